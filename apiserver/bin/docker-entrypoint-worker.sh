@@ -4,5 +4,32 @@ set -e
 python manage.py wait_for_db
 # Wait for migrations
 python manage.py wait_for_migrations
-# Run the processes
-celery -A plane worker -l info
\ No newline at end of file
+
+# Queues served by this container, e.g. WORKER_QUEUES="bulk" to scale the
+# bulk pool on its own
+WORKER_QUEUES=${WORKER_QUEUES:-"realtime default webhooks bulk"}
+
+# Concurrency and prefetch of every queue, overridden with
+# WORKER_<QUEUE>_CONCURRENCY and WORKER_<QUEUE>_PREFETCH
+declare -A CONCURRENCY=([realtime]=4 [default]=2 [webhooks]=4 [bulk]=1)
+declare -A PREFETCH=([realtime]=4 [default]=4 [webhooks]=1 [bulk]=1)
+
+# Pass the stop signal on to every worker so that they finish their tasks
+trap 'kill -TERM $(jobs -p) 2>/dev/null; wait' TERM INT
+
+# Run one worker per queue
+for queue in $WORKER_QUEUES; do
+    name=${queue^^}
+    concurrency_var="WORKER_${name}_CONCURRENCY"
+    prefetch_var="WORKER_${name}_PREFETCH"
+    celery -A plane worker -l info \
+        -Q "$queue" \
+        -n "$queue@%h" \
+        -O fair \
+        --concurrency "${!concurrency_var:-${CONCURRENCY[$queue]:-2}}" \
+        --prefetch-multiplier "${!prefetch_var:-${PREFETCH[$queue]:-1}}" &
+done
+
+# Stop the container as soon as one of the workers exits
+wait -n
+exit $?
@@ -3,6 +3,7 @@ from .workspace import WorkspaceLiteSerializer
 from .project import ProjectSerializer, ProjectLiteSerializer
 from .issue import (
     IssueSerializer,
+    IssueBulkUpsertSerializer,
     LabelSerializer,
     IssueLinkSerializer,
     IssueAttachmentSerializer,
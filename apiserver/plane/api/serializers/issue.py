@@ -274,6 +274,68 @@ class IssueSerializer(BaseSerializer):
         return data
 
 
+class IssueBulkUpsertSerializer(BaseSerializer):
+    """
+    Issue of a bulk upsert, the states, parents, assignees and labels are
+    checked against the project by the view for the whole batch at once
+    """
+
+    external_id = serializers.CharField(max_length=255)
+    external_source = serializers.CharField(max_length=255)
+    state = serializers.UUIDField(source="state_id", required=False)
+    parent = serializers.UUIDField(
+        source="parent_id", required=False, allow_null=True
+    )
+    assignees = serializers.ListField(
+        child=serializers.UUIDField(), required=False
+    )
+    labels = serializers.ListField(
+        child=serializers.UUIDField(), required=False
+    )
+    created_at = serializers.DateTimeField(required=False)
+    created_by = serializers.UUIDField(source="created_by_id", required=False)
+
+    class Meta:
+        model = Issue
+        fields = [
+            "external_id",
+            "external_source",
+            "name",
+            "description_html",
+            "priority",
+            "point",
+            "start_date",
+            "target_date",
+            "state",
+            "parent",
+            "assignees",
+            "labels",
+            "created_at",
+            "created_by",
+        ]
+
+    def validate(self, data):
+        if (
+            data.get("start_date", None) is not None
+            and data.get("target_date", None) is not None
+            and data.get("start_date", None) > data.get("target_date", None)
+        ):
+            raise serializers.ValidationError(
+                "Start date cannot exceed target date"
+            )
+
+        try:
+            if data.get("description_html", None) is not None:
+                parsed = html.fromstring(data["description_html"])
+                data["description_html"] = html.tostring(
+                    parsed, encoding="unicode"
+                )
+        except Exception:
+            raise serializers.ValidationError("Invalid HTML passed")
+
+        return data
+
+
 class LabelSerializer(BaseSerializer):
     class Meta:
         model = Label
@@ -2,6 +2,7 @@ from django.urls import path
 
 from plane.api.views import (
     IssueAPIEndpoint,
+    IssueBulkUpsertAPIEndpoint,
     LabelAPIEndpoint,
     IssueLinkAPIEndpoint,
     IssueCommentAPIEndpoint,
@@ -26,6 +27,11 @@ urlpatterns = [
         IssueAPIEndpoint.as_view(),
         name="issue",
     ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/issues/bulk-upsert/",
+        IssueBulkUpsertAPIEndpoint.as_view(),
+        name="issue-bulk-upsert",
+    ),
     path(
         "workspaces/<str:slug>/projects/<uuid:project_id>/labels/",
         LabelAPIEndpoint.as_view(),
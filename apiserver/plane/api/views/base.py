@@ -7,7 +7,6 @@ from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db import IntegrityError
 from django.urls import resolve
 from django.utils import timezone
-from plane.db.models.api import APIToken
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
@@ -18,6 +17,7 @@ from rest_framework.views import APIView
 # Module imports
 from plane.api.middleware.api_authentication import APIKeyAuthentication
 from plane.api.rate_limit import ApiKeyRateThrottle, ServiceTokenRateThrottle
+from plane.utils.api_token_cache import get_api_token
 from plane.utils.exception_logger import log_exception
 from plane.utils.paginator import BasePaginator
 
@@ -55,12 +55,10 @@ class BaseAPIView(TimezoneMixin, APIView, BasePaginator):
         api_key = self.request.headers.get("X-Api-Key")
 
         if api_key:
-            service_token = APIToken.objects.filter(
-                token=api_key,
-                is_service=True,
-            ).first()
+            # Resolved once by the authentication of the request
+            api_token = get_api_token(api_key)
 
-            if service_token:
+            if api_token and api_token["is_service"]:
                 throttle_classes.append(ServiceTokenRateThrottle())
                 return throttle_classes
 
@@ -4,7 +4,8 @@ import json
 from django.core.serializers.json import DjangoJSONEncoder
 
 # Django imports
-from django.db import IntegrityError
+from django.conf import settings
+from django.db import IntegrityError, transaction
 from django.db.models import (
     Case,
     CharField,
@@ -18,6 +19,7 @@ from django.db.models import (
     When,
 )
 from django.utils import timezone
+from django.utils.html import strip_tags
 
 # Third party imports
 from rest_framework import status
@@ -30,6 +32,7 @@ from plane.api.serializers import (
     IssueActivitySerializer,
     IssueCommentSerializer,
     IssueLinkSerializer,
+    IssueBulkUpsertSerializer,
     IssueSerializer,
     LabelSerializer,
 )
@@ -38,17 +41,32 @@ from plane.app.permissions import (
     ProjectLitePermission,
     ProjectMemberPermission,
 )
-from plane.bgtasks.issue_activities_task import issue_activity
+from plane.bgtasks.issue_activities_task import (
+    bulk_issue_activity,
+    issue_activity,
+)
 from plane.db.models import (
     Issue,
     IssueActivity,
+    IssueAssignee,
     IssueAttachment,
     IssueComment,
+    IssueLabel,
     IssueLink,
+    IssueSequence,
+    IssueType,
     Label,
     Project,
     ProjectMember,
+    State,
+    User,
+)
+from plane.utils.dashboard_stats import invalidate_dashboard_stats
+from plane.utils.issue_sequence import (
+    reserve_issue_sequences,
+    reserve_issue_sort_orders,
 )
+from plane.utils.search import index_search_documents
 
 from .base import BaseAPIView
 
@@ -558,6 +576,456 @@ class IssueAPIEndpoint(BaseAPIView):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
+# Validated fields of a bulk upsert that are not set on the issue itself
+UPSERT_SKIPPED_FIELDS = ("assignees", "labels", "created_at", "created_by_id")
+
+
+class IssueBulkUpsertAPIEndpoint(BaseAPIView):
+    """
+    Create or update a batch of issues identified by their external_id and
+    external_source, to sync the issues of another tracker. Every issue gets
+    its own result and invalid ones do not stop the rest of the batch.
+    """
+
+    model = Issue
+    webhook_event = "issue"
+    permission_classes = [
+        ProjectEntityPermission,
+    ]
+
+    # Fields of the serializer and the activity key they are tracked with
+    ACTIVITY_FIELDS = {
+        "name": "name",
+        "description_html": "description_html",
+        "priority": "priority",
+        "start_date": "start_date",
+        "target_date": "target_date",
+        "parent_id": "parent_id",
+        "state_id": "state_id",
+        "assignees": "assignee_ids",
+        "labels": "label_ids",
+    }
+
+    def get_activity_data(self, data):
+        return json.dumps(
+            {
+                key: data[field]
+                for field, key in self.ACTIVITY_FIELDS.items()
+                if field in data
+            },
+            cls=DjangoJSONEncoder,
+        )
+
+    def validate_relations(self, project, items):
+        """
+        Check the states, parents and creators of the validated items with a
+        query per relation and drop the assignees and labels that are not
+        from the project, as the issue serializer does
+        """
+        states = {
+            state.id: state
+            for state in State.objects.filter(project_id=project.id)
+        }
+        parent_ids = set(
+            Issue.objects.filter(
+                workspace_id=project.workspace_id,
+                pk__in=[
+                    data["parent_id"]
+                    for data in items.values()
+                    if data.get("parent_id")
+                ],
+            ).values_list("id", flat=True)
+        )
+        creator_ids = set(
+            User.objects.filter(
+                pk__in=[
+                    data["created_by_id"]
+                    for data in items.values()
+                    if "created_by_id" in data
+                ]
+            ).values_list("id", flat=True)
+        )
+        member_ids = set(
+            ProjectMember.objects.filter(
+                project_id=project.id,
+                is_active=True,
+                member_id__in={
+                    assignee
+                    for data in items.values()
+                    for assignee in data.get("assignees", [])
+                },
+            ).values_list("member_id", flat=True)
+        )
+        label_ids = set(
+            Label.objects.filter(
+                project_id=project.id,
+                id__in={
+                    label
+                    for data in items.values()
+                    for label in data.get("labels", [])
+                },
+            ).values_list("id", flat=True)
+        )
+
+        errors = {}
+        for index, data in items.items():
+            if "state_id" in data and data["state_id"] not in states:
+                errors[index] = [
+                    "State is not valid please pass a valid state_id"
+                ]
+            elif data.get("parent_id") and data["parent_id"] not in parent_ids:
+                errors[index] = [
+                    "Parent is not valid issue_id please pass a valid issue_id"
+                ]
+            elif (
+                "created_by_id" in data
+                and data["created_by_id"] not in creator_ids
+            ):
+                errors[index] = ["Created by is not a valid user"]
+
+            if "assignees" in data:
+                data["assignees"] = [
+                    assignee
+                    for assignee in dict.fromkeys(data["assignees"])
+                    if assignee in member_ids
+                ]
+            if "labels" in data:
+                data["labels"] = [
+                    label
+                    for label in dict.fromkeys(data["labels"])
+                    if label in label_ids
+                ]
+        return states, errors
+
+    def get_default_state(self, states):
+        states = [state for state in states.values() if not state.is_triage]
+        return next(
+            (state for state in states if state.default),
+            states[0] if states else None,
+        )
+
+    def set_completed_at(self, issue, states):
+        state = states.get(issue.state_id)
+        issue.completed_at = (
+            timezone.now()
+            if state is not None and state.group == "completed"
+            else None
+        )
+
+    def build_relations(self, issue, data, user_id):
+        assignees = [
+            IssueAssignee(
+                assignee_id=assignee_id,
+                issue=issue,
+                project_id=issue.project_id,
+                workspace_id=issue.workspace_id,
+                created_by_id=user_id,
+                updated_by_id=user_id,
+            )
+            for assignee_id in data.get("assignees", [])
+        ]
+        labels = [
+            IssueLabel(
+                label_id=label_id,
+                issue=issue,
+                project_id=issue.project_id,
+                workspace_id=issue.workspace_id,
+                created_by_id=user_id,
+                updated_by_id=user_id,
+            )
+            for label_id in data.get("labels", [])
+        ]
+        return assignees, labels
+
+    def create_issues(self, project, creations, states, user_id):
+        """Insert the new issues with blocks of sequence ids and sort orders"""
+        default_state = self.get_default_state(states)
+        issue_type = IssueType.objects.filter(
+            project_issue_types__project_id=project.id, is_default=True
+        ).first()
+
+        issues = []
+        for data in creations.values():
+            fields = {
+                field: value
+                for field, value in data.items()
+                if field not in UPSERT_SKIPPED_FIELDS
+            }
+            issue = Issue(
+                **fields,
+                created_by_id=data.get("created_by_id", user_id),
+                project_id=project.id,
+                workspace_id=project.workspace_id,
+                type=issue_type,
+                updated_by_id=user_id,
+            )
+            if issue.state_id is None and default_state is not None:
+                issue.state_id = default_state.id
+            self.set_completed_at(issue, states)
+            issue.description_stripped = (
+                strip_tags(issue.description_html)
+                if issue.description_html
+                else None
+            )
+            if not data.get("assignees") and project.default_assignee_id:
+                data["assignees"] = [project.default_assignee_id]
+            issues.append(issue)
+
+        if not issues:
+            return []
+
+        first_sequence = reserve_issue_sequences(project, len(issues))
+        for offset, issue in enumerate(issues):
+            issue.sequence_id = first_sequence + offset
+
+        by_state = {}
+        for issue in issues:
+            by_state.setdefault(issue.state_id, []).append(issue)
+        for state_id, state_issues in by_state.items():
+            sort_orders = reserve_issue_sort_orders(
+                project.id, state_id, len(state_issues)
+            )
+            for issue, sort_order in zip(state_issues, sort_orders):
+                issue.sort_order = sort_order
+
+        Issue.objects.bulk_create(issues, batch_size=500)
+        IssueSequence.objects.bulk_create(
+            [
+                IssueSequence(
+                    issue=issue,
+                    sequence=issue.sequence_id,
+                    project_id=project.id,
+                    workspace_id=project.workspace_id,
+                    created_by_id=user_id,
+                    updated_by_id=user_id,
+                )
+                for issue in issues
+            ],
+            batch_size=500,
+        )
+
+        # The creation date is set by the insert, imported issues keep theirs
+        dated = []
+        for issue, data in zip(issues, creations.values()):
+            if data.get("created_at"):
+                issue.created_at = data["created_at"]
+                dated.append(issue)
+        Issue.objects.bulk_update(dated, ["created_at"], batch_size=500)
+        return issues
+
+    def update_issues(self, updates, states, user_id):
+        fields = {"updated_at", "updated_by"}
+        for issue, data in updates.values():
+            for field, value in data.items():
+                # Relations are replaced separately, the creation is kept
+                if field in UPSERT_SKIPPED_FIELDS:
+                    continue
+                setattr(issue, field, value)
+                fields.add(field)
+            if "description_html" in data:
+                issue.description_stripped = (
+                    strip_tags(issue.description_html)
+                    if issue.description_html
+                    else None
+                )
+                fields.add("description_stripped")
+            if "state_id" in data:
+                self.set_completed_at(issue, states)
+                fields.add("completed_at")
+            issue.updated_at = timezone.now()
+            issue.updated_by_id = user_id
+
+        Issue.objects.bulk_update(
+            [issue for issue, _ in updates.values()],
+            list(fields),
+            batch_size=500,
+        )
+
+    def get_current_instances(self, updates):
+        """Tracked fields of the issues before the update"""
+        current_instances = {}
+        for issue, _ in updates.values():
+            current_instances[issue.id] = {
+                "name": issue.name,
+                "description_html": issue.description_html,
+                "priority": issue.priority,
+                "start_date": issue.start_date,
+                "target_date": issue.target_date,
+                "parent_id": issue.parent_id,
+                "state_id": issue.state_id,
+                "assignees": [],
+                "labels": [],
+            }
+        for issue_id, assignee_id in IssueAssignee.objects.filter(
+            issue_id__in=current_instances.keys()
+        ).values_list("issue_id", "assignee_id"):
+            current_instances[issue_id]["assignees"].append(assignee_id)
+        for issue_id, label_id in IssueLabel.objects.filter(
+            issue_id__in=current_instances.keys()
+        ).values_list("issue_id", "label_id"):
+            current_instances[issue_id]["labels"].append(label_id)
+        return current_instances
+
+    def put(self, request, slug, project_id):
+        items = request.data.get("issues")
+        if not isinstance(items, list) or not items:
+            return Response(
+                {"error": "issues should be a list of issues"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(items) > settings.ISSUE_BULK_UPSERT_LIMIT:
+            return Response(
+                {
+                    "error": f"At most {settings.ISSUE_BULK_UPSERT_LIMIT} "
+                    "issues can be upserted in a request"
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        project = Project.objects.get(pk=project_id, workspace__slug=slug)
+        user_id = request.user.id
+
+        results = [
+            {
+                "external_id": item.get("external_id"),
+                "external_source": item.get("external_source"),
+                "status": "failed",
+            }
+            if isinstance(item, dict)
+            else {"status": "failed"}
+            for item in items
+        ]
+        keys = [
+            (
+                str(result.get("external_source")),
+                str(result.get("external_id")),
+            )
+            for result in results
+        ]
+
+        # Existing issues of the batch are resolved with a single query
+        existing = {
+            (issue.external_source, issue.external_id): issue
+            for issue in Issue.objects.filter(
+                project_id=project_id,
+                external_id__in={external_id for _, external_id in keys},
+                deleted_at__isnull=True,
+            )
+        }
+
+        creations, updates, seen = {}, {}, set()
+        for index, item in enumerate(items):
+            issue = existing.get(keys[index])
+            serializer = IssueBulkUpsertSerializer(
+                issue, data=item, partial=issue is not None
+            )
+            if not serializer.is_valid():
+                results[index]["errors"] = serializer.errors
+                continue
+            data = serializer.validated_data
+            key = (data["external_source"], data["external_id"])
+            if key in seen:
+                results[index]["errors"] = [
+                    "The issue is present more than once in the request"
+                ]
+                continue
+            seen.add(key)
+            if issue is None:
+                creations[index] = data
+            else:
+                updates[index] = (issue, data)
+
+        states, errors = self.validate_relations(
+            project,
+            {
+                **creations,
+                **{index: data for index, (_, data) in updates.items()},
+            },
+        )
+        for index, error in errors.items():
+            results[index]["errors"] = error
+            creations.pop(index, None)
+            updates.pop(index, None)
+
+        current_instances = self.get_current_instances(updates)
+
+        with transaction.atomic():
+            created = self.create_issues(project, creations, states, user_id)
+            self.update_issues(updates, states, user_id)
+
+            # Assignees and labels sent with an update replace the current
+            replaced_assignees = [
+                issue.id
+                for issue, data in updates.values()
+                if "assignees" in data
+            ]
+            replaced_labels = [
+                issue.id
+                for issue, data in updates.values()
+                if "labels" in data
+            ]
+            IssueAssignee.objects.filter(
+                issue_id__in=replaced_assignees
+            ).delete()
+            IssueLabel.objects.filter(issue_id__in=replaced_labels).delete()
+
+            assignees, labels = [], []
+            for issue, data in list(zip(created, creations.values())) + list(
+                updates.values()
+            ):
+                issue_assignees, issue_labels = self.build_relations(
+                    issue, data, user_id
+                )
+                assignees.extend(issue_assignees)
+                labels.extend(issue_labels)
+            IssueAssignee.objects.bulk_create(assignees, batch_size=500)
+            IssueLabel.objects.bulk_create(labels, batch_size=500)
+
+        issues = created + [issue for issue, _ in updates.values()]
+        # Bulk writes skip the save signals keeping the search index and the
+        # dashboard counters current
+        index_search_documents(issues)
+        invalidate_dashboard_stats([project_id])
+
+        activities = []
+        for (index, data), issue in zip(creations.items(), created):
+            results[index].update(
+                status="created", id=issue.id, sequence_id=issue.sequence_id
+            )
+            activities.append(
+                {
+                    "type": "issue.activity.created",
+                    "issue_id": str(issue.id),
+                    "requested_data": self.get_activity_data(data),
+                    "current_instance": None,
+                }
+            )
+        for index, (issue, data) in updates.items():
+            results[index].update(
+                status="updated", id=issue.id, sequence_id=issue.sequence_id
+            )
+            activities.append(
+                {
+                    "type": "issue.activity.updated",
+                    "issue_id": str(issue.id),
+                    "requested_data": self.get_activity_data(data),
+                    "current_instance": self.get_activity_data(
+                        current_instances[issue.id]
+                    ),
+                }
+            )
+
+        if activities:
+            bulk_issue_activity.delay(
+                activities=activities,
+                actor_id=str(user_id),
+                project_id=str(project_id),
+                epoch=int(timezone.now().timestamp()),
+            )
+
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
+
 class LabelAPIEndpoint(BaseAPIView):
     """
     This viewset automatically provides `list`, `create`, `retrieve`,
@@ -1,4 +1,4 @@
-from plane.db.models import WorkspaceMember, ProjectMember
+from plane.utils.membership import get_membership
 from functools import wraps
 from rest_framework.response import Response
 from rest_framework import status
@@ -31,23 +31,15 @@ def allow_permission(allowed_roles, level="PROJECT", creator=False, model=None):
                 for role in allowed_roles
             ]
 
-            # Check role permissions
+            # Check role permissions against the roles resolved for the request
+            membership = get_membership(request, kwargs["slug"])
             if level == "WORKSPACE":
-                if WorkspaceMember.objects.filter(
-                    member=request.user,
-                    workspace__slug=kwargs["slug"],
-                    role__in=allowed_role_values,
-                    is_active=True,
-                ).exists():
+                if membership.has_workspace_role(allowed_role_values):
                     return view_func(instance, request, *args, **kwargs)
             else:
-                if ProjectMember.objects.filter(
-                    member=request.user,
-                    workspace__slug=kwargs["slug"],
-                    project_id=kwargs["project_id"],
-                    role__in=allowed_role_values,
-                    is_active=True,
-                ).exists():
+                if membership.has_project_role(
+                    kwargs["project_id"], allowed_role_values
+                ):
                     return view_func(instance, request, *args, **kwargs)
 
             # Return permission denied if no conditions are met
@@ -30,6 +30,7 @@ from plane.utils.analytics_plot import burndown_plot
 
 # Module imports
 from .. import BaseAPIView
+from plane.utils.membership import get_member_project_ids
 
 
 class CycleArchiveUnarchiveEndpoint(BaseAPIView):
@@ -130,8 +131,9 @@ class CycleArchiveUnarchiveEndpoint(BaseAPIView):
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(archived_at__isnull=False)
             .filter(
-                project__project_projectmember__member=self.request.user,
-                project__project_projectmember__is_active=True,
+                project_id__in=get_member_project_ids(
+                    self.request, self.kwargs.get("slug")
+                ),
             )
             .filter(project__archived_at__isnull=True)
             .select_related("project", "workspace", "owned_by")
@@ -33,10 +33,13 @@ from plane.utils.grouper import (
 from plane.utils.issue_filters import issue_filters
 from plane.utils.order_queryset import order_issue_queryset
 from plane.utils.paginator import (
+    COUNT_CACHED,
     GroupedOffsetPaginator,
+    KeysetPaginator,
     SubGroupedOffsetPaginator,
 )
 from plane.app.permissions import allow_permission, ROLE
+from plane.utils.membership import get_member_project_ids
 
 
 class CycleIssueViewSet(BaseViewSet):
@@ -66,8 +69,9 @@ class CycleIssueViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(
-                project__project_projectmember__member=self.request.user,
-                project__project_projectmember__is_active=True,
+                project_id__in=get_member_project_ids(
+                    self.request, self.kwargs.get("slug")
+                ),
             )
             .filter(project__archived_at__isnull=True)
             .filter(cycle_id=self.kwargs.get("cycle_id"))
@@ -225,6 +229,8 @@ class CycleIssueViewSet(BaseViewSet):
                 on_results=lambda issues: issue_on_results(
                     group_by=group_by, issues=issues, sub_group_by=sub_group_by
                 ),
+                paginator_cls=KeysetPaginator,
+                count=COUNT_CACHED,
             )
 
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER])
@@ -45,75 +45,42 @@ from plane.db.models import (
     Widget,
     WorkspaceMember,
 )
+from plane.utils.dashboard_stats import (
+    PRIORITIES,
+    STATE_GROUPS,
+    get_dashboard_stats,
+)
 from plane.utils.issue_filters import issue_filters
+from plane.utils.membership import get_membership
 
 # Module imports
 from .. import BaseAPIView
 
 
-def dashboard_overview_stats(self, request, slug):
-    extra_filters = {}
-    if WorkspaceMember.objects.filter(
-        workspace__slug=slug,
-        member=request.user,
-        role=5,
-        is_active=True,
-    ).exists():
-        extra_filters = {"created_by": request.user}
-
-    assigned_issues = (
-        Issue.issue_objects.filter(
-            project__project_projectmember__is_active=True,
-            project__project_projectmember__member=request.user,
-            workspace__slug=slug,
-            assignees__in=[request.user],
-        )
-        .filter(**extra_filters)
-        .count()
-    )
-
-    pending_issues_count = (
-        Issue.issue_objects.filter(
-            ~Q(state__group__in=["completed", "cancelled"]),
-            target_date__lt=timezone.now().date(),
-            project__project_projectmember__is_active=True,
-            project__project_projectmember__member=request.user,
-            workspace__slug=slug,
-            assignees__in=[request.user],
-        )
-        .filter(**extra_filters)
-        .count()
+def get_dashboard_snapshot(request, slug, filters=None):
+    """Issue counters of the request user, shared by the widgets"""
+    membership = get_membership(request, slug)
+    # Guests only count the issues they created
+    created_by_id = (
+        request.user.id if membership.has_workspace_role([5]) else None
     )
-
-    created_issues_count = (
-        Issue.issue_objects.filter(
-            workspace__slug=slug,
-            project__project_projectmember__is_active=True,
-            project__project_projectmember__member=request.user,
-            created_by_id=request.user.id,
-        )
-        .filter(**extra_filters)
-        .count()
+    return get_dashboard_stats(
+        slug,
+        request.user.id,
+        membership.project_ids,
+        filters=filters,
+        created_by_id=created_by_id,
     )
 
-    completed_issues_count = (
-        Issue.issue_objects.filter(
-            workspace__slug=slug,
-            project__project_projectmember__is_active=True,
-            project__project_projectmember__member=request.user,
-            assignees__in=[request.user],
-            state__group="completed",
-        )
-        .filter(**extra_filters)
-        .count()
-    )
 
+def dashboard_overview_stats(self, request, slug):
+    stats = get_dashboard_snapshot(request, slug)
     return Response(
         {
-            "assigned_issues_count": assigned_issues,
-            "pending_issues_count": pending_issues_count,
-            "completed_issues_count": completed_issues_count,
-            "created_issues_count": created_issues_count,
+            "assigned_issues_count": stats["assigned"],
+            "pending_issues_count": stats["overdue"],
+            "completed_issues_count": stats["completed"],
+            "created_issues_count": stats["created"],
         },
         status=status.HTTP_200_OK,
     )
@@ -442,84 +409,27 @@ def dashboard_created_issues(self, request, slug):
 
 def dashboard_issues_by_state_groups(self, request, slug):
     filters = issue_filters(request.query_params, "GET")
-    state_order = ["backlog", "unstarted", "started", "completed", "cancelled"]
-    extra_filters = {}
-
-    if WorkspaceMember.objects.filter(
-        workspace__slug=slug,
-        member=request.user,
-        role=5,
-        is_active=True,
-    ).exists():
-        extra_filters = {"created_by": request.user}
-
-    issues_by_state_groups = (
-        Issue.issue_objects.filter(
-            workspace__slug=slug,
-            project__project_projectmember__is_active=True,
-            project__project_projectmember__member=request.user,
-            assignees__in=[request.user],
-        )
-        .filter(**filters, **extra_filters)
-        .values("state__group")
-        .annotate(count=Count("id"))
+    stats = get_dashboard_snapshot(request, slug, filters)
+    return Response(
+        [
+            {"state": group, "count": stats[f"state_{group}"]}
+            for group in STATE_GROUPS
+        ],
+        status=status.HTTP_200_OK,
     )
 
-    # default state
-    all_groups = {state: 0 for state in state_order}
-
-    # Update counts for existing groups
-    for entry in issues_by_state_groups:
-        all_groups[entry["state__group"]] = entry["count"]
-
-    # Prepare output including all groups with their counts
-    output_data = [
-        {"state": group, "count": count} for group, count in all_groups.items()
-    ]
-
-    return Response(output_data, status=status.HTTP_200_OK)
-
 
 def dashboard_issues_by_priority(self, request, slug):
     filters = issue_filters(request.query_params, "GET")
-    priority_order = ["urgent", "high", "medium", "low", "none"]
-    extra_filters = {}
-
-    if WorkspaceMember.objects.filter(
-        workspace__slug=slug,
-        member=request.user,
-        role=5,
-        is_active=True,
-    ).exists():
-        extra_filters = {"created_by": request.user}
-
-    issues_by_priority = (
-        Issue.issue_objects.filter(
-            workspace__slug=slug,
-            project__project_projectmember__is_active=True,
-            project__project_projectmember__member=request.user,
-            assignees__in=[request.user],
-        )
-        .filter(**filters, **extra_filters)
-        .values("priority")
-        .annotate(count=Count("id"))
+    stats = get_dashboard_snapshot(request, slug, filters)
+    return Response(
+        [
+            {"priority": priority, "count": stats[f"priority_{priority}"]}
+            for priority in PRIORITIES
+        ],
+        status=status.HTTP_200_OK,
     )
 
-    # default priority
-    all_groups = {priority: 0 for priority in priority_order}
-
-    # Update counts for existing groups
-    for entry in issues_by_priority:
-        all_groups[entry["priority"]] = entry["count"]
-
-    # Prepare output including all groups with their counts
-    output_data = [
-        {"priority": group, "count": count}
-        for group, count in all_groups.items()
-    ]
-
-    return Response(output_data, status=status.HTTP_200_OK)
-
 
 def dashboard_recent_activity(self, request, slug):
     queryset = IssueActivity.objects.filter(
@@ -19,6 +19,7 @@ from plane.app.serializers import (
     EstimateReadSerializer,
 )
 from plane.utils.cache import invalidate_cache
+from plane.bgtasks.issue_rollup_task import refresh_estimate_rollups
 
 
 def generate_random_name(length=10):
@@ -172,6 +173,8 @@ class BulkEstimatePointEndpoint(BaseViewSet):
             ["key", "value"],
             batch_size=10,
         )
+        # Bulk updates skip the signals refreshing the summed points
+        refresh_estimate_rollups.delay([str(estimate_id)])
 
         estimate_serializer = EstimateReadSerializer(estimate)
         return Response(
@@ -1,5 +1,5 @@
 # Python imports
-from itertools import chain
+import heapq
 
 # Django imports
 from django.db.models import (
@@ -25,6 +25,25 @@ from plane.db.models import (
     IssueComment,
     CommentReaction,
 )
+from plane.utils.membership import get_member_project_ids
+from plane.utils.paginator import MergedKeysetPaginator
+
+
+def serialize_timeline(results):
+    """Serialize the activities and comments of a page in their order"""
+    serialized = {
+        model: iter(
+            serializer(
+                [result for result in results if isinstance(result, model)],
+                many=True,
+            ).data
+        )
+        for model, serializer in (
+            (IssueActivity, IssueActivitySerializer),
+            (IssueComment, IssueCommentSerializer),
+        )
+    }
+    return [next(serialized[type(result)]) for result in results]
 
 
 class IssueActivityEndpoint(BaseAPIView):
@@ -43,8 +62,7 @@ class IssueActivityEndpoint(BaseAPIView):
             IssueActivity.objects.filter(issue_id=issue_id)
             .filter(
                 ~Q(field__in=["comment", "vote", "reaction", "draft"]),
-                project__project_projectmember__member=self.request.user,
-                project__project_projectmember__is_active=True,
+                project_id__in=get_member_project_ids(request, slug),
                 project__archived_at__isnull=True,
                 workspace__slug=slug,
             )
@@ -54,8 +72,7 @@ class IssueActivityEndpoint(BaseAPIView):
         issue_comments = (
             IssueComment.objects.filter(issue_id=issue_id)
             .filter(
-                project__project_projectmember__member=self.request.user,
-                project__project_projectmember__is_active=True,
+                project_id__in=get_member_project_ids(request, slug),
                 project__archived_at__isnull=True,
                 workspace__slug=slug,
             )
@@ -69,20 +86,26 @@ class IssueActivityEndpoint(BaseAPIView):
                 )
             )
         )
-        issue_activities = IssueActivitySerializer(
-            issue_activities, many=True
-        ).data
-        issue_comments = IssueCommentSerializer(issue_comments, many=True).data
+        activity_type = request.GET.get("activity_type", None)
+        querysets = {
+            "issue-property": [issue_activities],
+            "issue-comment": [issue_comments],
+        }.get(activity_type, [issue_activities, issue_comments])
 
-        if request.GET.get("activity_type", None) == "issue-property":
-            return Response(issue_activities, status=status.HTTP_200_OK)
-
-        if request.GET.get("activity_type", None) == "issue-comment":
-            return Response(issue_comments, status=status.HTTP_200_OK)
+        # Pages of the timeline, merged in the database order
+        if request.GET.get("per_page", False) and request.GET.get(
+            "cursor", False
+        ):
+            return self.paginate(
+                request=request,
+                paginator_cls=MergedKeysetPaginator,
+                querysets=querysets,
+                on_results=serialize_timeline,
+            )
 
-        result_list = sorted(
-            chain(issue_activities, issue_comments),
-            key=lambda instance: instance["created_at"],
+        # Every entry of the timeline when it is not paged, both querysets
+        # are already ordered by their creation
+        results = list(
+            heapq.merge(*querysets, key=lambda instance: instance.created_at)
         )
-
-        return Response(result_list, status=status.HTTP_200_OK)
+        return Response(serialize_timeline(results), status=status.HTTP_200_OK)
@@ -43,7 +43,9 @@ from plane.utils.grouper import (
 from plane.utils.issue_filters import issue_filters
 from plane.utils.order_queryset import order_issue_queryset
 from plane.utils.paginator import (
+    COUNT_CACHED,
     GroupedOffsetPaginator,
+    KeysetPaginator,
     SubGroupedOffsetPaginator,
 )
 from plane.app.permissions import allow_permission, ROLE
@@ -211,6 +213,8 @@ class IssueArchiveViewSet(BaseViewSet):
                 on_results=lambda issues: issue_on_results(
                     group_by=group_by, issues=issues, sub_group_by=sub_group_by
                 ),
+                paginator_cls=KeysetPaginator,
+                count=COUNT_CACHED,
             )
 
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.VIEWER])
@@ -34,12 +34,14 @@ from plane.app.serializers import (
 )
 from plane.bgtasks.issue_activities_task import issue_activity
 from plane.db.models import (
+    CycleIssue,
     Issue,
     IssueAttachment,
     IssueLink,
     IssueUserProperty,
     IssueReaction,
     IssueSubscriber,
+    ModuleIssue,
     Project,
     ProjectMember,
 )
@@ -49,9 +51,12 @@ from plane.utils.grouper import (
     issue_queryset_grouper,
 )
 from plane.utils.issue_filters import issue_filters
+from plane.utils.issue_rollup import refresh_issue_rollups
 from plane.utils.order_queryset import order_issue_queryset
 from plane.utils.paginator import (
+    COUNT_CACHED,
     GroupedOffsetPaginator,
+    KeysetPaginator,
     SubGroupedOffsetPaginator,
 )
 from .. import BaseAPIView, BaseViewSet
@@ -351,6 +356,8 @@ class IssueViewSet(BaseViewSet):
                 on_results=lambda issues: issue_on_results(
                     group_by=group_by, issues=issues, sub_group_by=sub_group_by
                 ),
+                paginator_cls=KeysetPaginator,
+                count=COUNT_CACHED,
             )
 
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER])
@@ -648,8 +655,24 @@ class BulkDeleteIssuesEndpoint(BaseAPIView):
 
         total_issues = len(issues)
 
+        # Links are removed along with the issues, collect them first
+        cycle_ids = list(
+            CycleIssue.objects.filter(issue__in=issues).values_list(
+                "cycle_id", flat=True
+            )
+        )
+        module_ids = list(
+            ModuleIssue.objects.filter(issue__in=issues).values_list(
+                "module_id", flat=True
+            )
+        )
+
         issues.delete()
 
+        refresh_issue_rollups(
+            issue_ids=[], cycle_ids=cycle_ids, module_ids=module_ids
+        )
+
         return Response(
             {"message": f"{total_issues} issues were deleted"},
             status=status.HTTP_200_OK,
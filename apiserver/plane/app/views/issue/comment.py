@@ -23,6 +23,7 @@ from plane.db.models import (
     CommentReaction,
 )
 from plane.bgtasks.issue_activities_task import issue_activity
+from plane.utils.membership import get_member_project_ids
 
 
 class IssueCommentViewSet(BaseViewSet):
@@ -43,8 +44,9 @@ class IssueCommentViewSet(BaseViewSet):
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(issue_id=self.kwargs.get("issue_id"))
             .filter(
-                project__project_projectmember__member=self.request.user,
-                project__project_projectmember__is_active=True,
+                project_id__in=get_member_project_ids(
+                    self.request, self.kwargs.get("slug")
+                ),
                 project__archived_at__isnull=True,
             )
             .select_related("project")
@@ -168,8 +170,9 @@ class CommentReactionViewSet(BaseViewSet):
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(comment_id=self.kwargs.get("comment_id"))
             .filter(
-                project__project_projectmember__member=self.request.user,
-                project__project_projectmember__is_active=True,
+                project_id__in=get_member_project_ids(
+                    self.request, self.kwargs.get("slug")
+                ),
                 project__archived_at__isnull=True,
             )
             .order_by("-created_at")
@@ -15,6 +15,7 @@ from plane.app.serializers import IssueLinkSerializer
 from plane.app.permissions import ProjectEntityPermission
 from plane.db.models import IssueLink
 from plane.bgtasks.issue_activities_task import issue_activity
+from plane.utils.membership import get_member_project_ids
 
 
 class IssueLinkViewSet(BaseViewSet):
@@ -33,8 +34,9 @@ class IssueLinkViewSet(BaseViewSet):
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(issue_id=self.kwargs.get("issue_id"))
             .filter(
-                project__project_projectmember__member=self.request.user,
-                project__project_projectmember__is_active=True,
+                project_id__in=get_member_project_ids(
+                    self.request, self.kwargs.get("slug")
+                ),
                 project__archived_at__isnull=True,
             )
             .order_by("-created_at")
@@ -15,6 +15,7 @@ from plane.app.serializers import IssueReactionSerializer
 from plane.app.permissions import ProjectLitePermission
 from plane.db.models import IssueReaction
 from plane.bgtasks.issue_activities_task import issue_activity
+from plane.utils.membership import get_member_project_ids
 
 
 class IssueReactionViewSet(BaseViewSet):
@@ -32,8 +33,9 @@ class IssueReactionViewSet(BaseViewSet):
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(issue_id=self.kwargs.get("issue_id"))
             .filter(
-                project__project_projectmember__member=self.request.user,
-                project__project_projectmember__is_active=True,
+                project_id__in=get_member_project_ids(
+                    self.request, self.kwargs.get("slug")
+                ),
                 project__archived_at__isnull=True,
             )
             .order_by("-created_at")
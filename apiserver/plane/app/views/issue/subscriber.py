@@ -16,6 +16,7 @@ from plane.db.models import (
     IssueSubscriber,
     ProjectMember,
 )
+from plane.utils.membership import get_member_project_ids
 
 
 class IssueSubscriberViewSet(BaseViewSet):
@@ -52,8 +53,9 @@ class IssueSubscriberViewSet(BaseViewSet):
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(issue_id=self.kwargs.get("issue_id"))
             .filter(
-                project__project_projectmember__member=self.request.user,
-                project__project_projectmember__is_active=True,
+                project_id__in=get_member_project_ids(
+                    self.request, self.kwargs.get("slug")
+                ),
                 project__archived_at__isnull=True,
             )
             .order_by("-created_at")
@@ -19,6 +19,12 @@ from plane.db.models import (
     WorkspaceMember,
 )
 from plane.utils.paginator import BasePaginator
+from plane.utils.notification_counters import (
+    get_notification_counters,
+    is_counted,
+    track_notification_change,
+    update_notification_counters,
+)
 from plane.app.permissions import allow_permission, ROLE
 
 # Module imports
@@ -190,7 +196,9 @@ class NotificationViewSet(BaseViewSet, BasePaginator):
         )
 
         if serializer.is_valid():
+            was_counted = is_counted(notification)
             serializer.save()
+            track_notification_change(slug, notification, was_counted)
             return Response(serializer.data, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -202,8 +210,10 @@ class NotificationViewSet(BaseViewSet, BasePaginator):
         notification = Notification.objects.get(
             receiver=request.user, workspace__slug=slug, pk=pk
         )
+        was_counted = is_counted(notification)
         notification.read_at = timezone.now()
         notification.save()
+        track_notification_change(slug, notification, was_counted)
         serializer = NotificationSerializer(notification)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -214,8 +224,10 @@ class NotificationViewSet(BaseViewSet, BasePaginator):
         notification = Notification.objects.get(
             receiver=request.user, workspace__slug=slug, pk=pk
         )
+        was_counted = is_counted(notification)
         notification.read_at = None
         notification.save()
+        track_notification_change(slug, notification, was_counted)
         serializer = NotificationSerializer(notification)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -226,8 +238,10 @@ class NotificationViewSet(BaseViewSet, BasePaginator):
         notification = Notification.objects.get(
             receiver=request.user, workspace__slug=slug, pk=pk
         )
+        was_counted = is_counted(notification)
         notification.archived_at = timezone.now()
         notification.save()
+        track_notification_change(slug, notification, was_counted)
         serializer = NotificationSerializer(notification)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -238,8 +252,10 @@ class NotificationViewSet(BaseViewSet, BasePaginator):
         notification = Notification.objects.get(
             receiver=request.user, workspace__slug=slug, pk=pk
         )
+        was_counted = is_counted(notification)
         notification.archived_at = None
         notification.save()
+        track_notification_change(slug, notification, was_counted)
         serializer = NotificationSerializer(notification)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -250,27 +266,10 @@ class UnreadNotificationEndpoint(BaseAPIView):
         level="WORKSPACE",
     )
     def get(self, request, slug):
-        # Watching Issues Count
-        unread_notifications_count = (
-            Notification.objects.filter(
-                workspace__slug=slug,
-                receiver_id=request.user.id,
-                read_at__isnull=True,
-                archived_at__isnull=True,
-                snoozed_till__isnull=True,
-            )
-            .exclude(sender__icontains="mentioned")
-            .count()
-        )
-
-        mention_notifications_count = Notification.objects.filter(
-            workspace__slug=slug,
-            receiver_id=request.user.id,
-            read_at__isnull=True,
-            archived_at__isnull=True,
-            snoozed_till__isnull=True,
-            sender__icontains="mentioned",
-        ).count()
+        # Served from the counters kept in Redis
+        counters = get_notification_counters(slug, request.user.id)
+        unread_notifications_count = counters["unread"]
+        mention_notifications_count = counters["mention"]
 
         return Response(
             {
@@ -364,6 +363,17 @@ class MarkAllReadNotificationViewSet(BaseViewSet):
         Notification.objects.bulk_update(
             updated_notifications, ["read_at"], batch_size=100
         )
+        # Only unread notifications that were not archived nor snoozed
+        update_notification_counters(
+            slug,
+            [
+                notification
+                for notification in updated_notifications
+                if notification.archived_at is None
+                and notification.snoozed_till is None
+            ],
+            -1,
+        )
         return Response({"message": "Successful"}, status=status.HTTP_200_OK)
 
 
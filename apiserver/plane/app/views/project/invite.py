@@ -27,6 +27,7 @@ from plane.db.models import (
     WorkspaceMember,
     IssueUserProperty,
 )
+from plane.utils.membership import invalidate_membership
 
 
 class ProjectInvitationsViewset(BaseViewSet):
@@ -178,6 +179,7 @@ class UserProjectInvitationsViewset(BaseViewSet):
             ],
             ignore_conflicts=True,
         )
+        invalidate_membership([request.user.id])
 
         IssueUserProperty.objects.bulk_create(
             [
@@ -27,6 +27,7 @@ from plane.db.models import (
 )
 from plane.bgtasks.project_add_user_email_task import project_add_user_email
 from plane.utils.host import base_host
+from plane.utils.membership import invalidate_membership
 from plane.app.permissions.base import allow_permission, ROLE
 
 
@@ -166,6 +167,7 @@ class ProjectMemberViewSet(BaseViewSet):
             batch_size=10,
             ignore_conflicts=True,
         )
+        invalidate_membership([member.get("member_id") for member in members])
 
         _ = IssueUserProperty.objects.bulk_create(
             bulk_issue_props, batch_size=10, ignore_conflicts=True
@@ -371,6 +373,7 @@ class AddTeamToProjectEndpoint(BaseAPIView):
         ProjectMember.objects.bulk_create(
             project_members, batch_size=10, ignore_conflicts=True
         )
+        invalidate_membership(team_members)
 
         _ = IssueUserProperty.objects.bulk_create(
             issue_props, batch_size=10, ignore_conflicts=True
@@ -1,8 +1,5 @@
-# Python imports
-import re
-
 # Django imports
-from django.db.models import Q, OuterRef, Subquery, Value, UUIDField, CharField
+from django.db.models import Q, Value, UUIDField, CharField
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.fields import ArrayField
 from django.db.models.functions import Coalesce
@@ -23,6 +20,13 @@ from plane.db.models import (
     IssueView,
     ProjectPage,
 )
+from plane.utils.membership import get_member_project_ids
+from plane.utils.search import (
+    SEARCH_RESULTS_LIMIT,
+    exact_match_filter,
+    rank_documents,
+    search_documents,
+)
 
 
 class GlobalSearchEndpoint(BaseAPIView):
@@ -48,111 +52,89 @@ class GlobalSearchEndpoint(BaseAPIView):
         q = Q()
         for field in fields:
             q |= Q(**{f"{field}__icontains": query})
-        return (
-            Project.objects.filter(
-                q,
-                project_projectmember__member=self.request.user,
-                project_projectmember__is_active=True,
-                archived_at__isnull=True,
-                workspace__slug=slug,
+        return Project.objects.filter(
+            q,
+            pk__in=get_member_project_ids(self.request, slug),
+            archived_at__isnull=True,
+            workspace__slug=slug,
+        ).values("name", "id", "identifier", "workspace__slug")
+
+    def get_project_ids(self, slug, project_id, workspace_search):
+        project_ids = get_member_project_ids(self.request, slug)
+        if workspace_search == "false" and project_id:
+            return [project_id] if str(project_id) in project_ids else []
+        return list(project_ids)
+
+    def rank_documents(self, query, slug, project_ids):
+        # One ranked query over the search index for every entity type
+        documents = search_documents(query, workspace__slug=slug).filter(
+            Q(project_id__in=project_ids)
+            | Q(
+                entity_name="page",
+                entity_identifier__in=ProjectPage.objects.filter(
+                    project_id__in=project_ids
+                ).values("page_id"),
             )
-            .distinct()
-            .values("name", "id", "identifier", "workspace__slug")
         )
+        return rank_documents(documents)
 
-    def filter_issues(self, query, slug, project_id, workspace_search):
-        fields = ["name", "sequence_id", "project__identifier"]
-        q = Q()
-        for field in fields:
-            if field == "sequence_id":
-                # Match whole integers only (exclude decimal numbers)
-                sequences = re.findall(r"\b\d+\b", query)
-                for sequence_id in sequences:
-                    q |= Q(**{"sequence_id": sequence_id})
-            else:
-                q |= Q(**{f"{field}__icontains": query})
+    def in_rank_order(self, results, ids):
+        positions = {entity_id: index for index, entity_id in enumerate(ids)}
+        return sorted(results, key=lambda result: positions[result["id"]])
 
+    def filter_issues(self, query, slug, project_ids, ids):
         issues = Issue.issue_objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
+            project_id__in=project_ids,
             project__archived_at__isnull=True,
             workspace__slug=slug,
         )
-
-        if workspace_search == "false" and project_id:
-            issues = issues.filter(project_id=project_id)
-
-        return issues.distinct().values(
+        fields = [
             "name",
             "id",
             "sequence_id",
             "project__identifier",
             "project_id",
             "workspace__slug",
+        ]
+
+        # Issues referenced by their id come first
+        exact_match = exact_match_filter(query)
+        exact_issues = (
+            list(
+                issues.filter(exact_match).values(*fields)[
+                    :SEARCH_RESULTS_LIMIT
+                ]
+            )
+            if exact_match is not None
+            else []
         )
-
-    def filter_cycles(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-
-        cycles = Cycle.objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-            project__archived_at__isnull=True,
-            workspace__slug=slug,
-        )
-
-        if workspace_search == "false" and project_id:
-            cycles = cycles.filter(project_id=project_id)
-
-        return cycles.distinct().values(
-            "name",
-            "id",
-            "project_id",
-            "project__identifier",
-            "workspace__slug",
+        exact_ids = {issue["id"] for issue in exact_issues}
+        return exact_issues + self.in_rank_order(
+            issues.filter(pk__in=set(ids) - exact_ids).values(*fields), ids
         )
 
-    def filter_modules(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-
-        modules = Module.objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-            project__archived_at__isnull=True,
-            workspace__slug=slug,
-        )
-
-        if workspace_search == "false" and project_id:
-            modules = modules.filter(project_id=project_id)
-
-        return modules.distinct().values(
-            "name",
-            "id",
-            "project_id",
-            "project__identifier",
-            "workspace__slug",
+    def filter_project_entities(self, model, slug, project_ids, ids):
+        return self.in_rank_order(
+            model.objects.filter(
+                pk__in=ids,
+                project_id__in=project_ids,
+                project__archived_at__isnull=True,
+                workspace__slug=slug,
+            ).values(
+                "name",
+                "id",
+                "project_id",
+                "project__identifier",
+                "workspace__slug",
+            ),
+            ids,
         )
 
-    def filter_pages(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-
+    def filter_pages(self, slug, project_ids, ids):
         pages = (
             Page.objects.filter(
-                q,
-                projects__project_projectmember__member=self.request.user,
-                projects__project_projectmember__is_active=True,
+                pk__in=ids,
+                projects__id__in=project_ids,
                 projects__archived_at__isnull=True,
                 workspace__slug=slug,
             )
@@ -177,48 +159,15 @@ class GlobalSearchEndpoint(BaseAPIView):
                 ),
             )
         )
-
-        if workspace_search == "false" and project_id:
-            project_subquery = ProjectPage.objects.filter(
-                page_id=OuterRef("id"),
-                project_id=project_id,
-            ).values_list("project_id", flat=True)[:1]
-
-            pages = pages.annotate(
-                project_id=Subquery(project_subquery)
-            ).filter(project_id=project_id)
-
-        return pages.distinct().values(
-            "name",
-            "id",
-            "project_ids",
-            "project_identifiers",
-            "workspace__slug",
-        )
-
-    def filter_views(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-
-        issue_views = IssueView.objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-            project__archived_at__isnull=True,
-            workspace__slug=slug,
-        )
-
-        if workspace_search == "false" and project_id:
-            issue_views = issue_views.filter(project_id=project_id)
-
-        return issue_views.distinct().values(
-            "name",
-            "id",
-            "project_id",
-            "project__identifier",
-            "workspace__slug",
+        return self.in_rank_order(
+            pages.values(
+                "name",
+                "id",
+                "project_ids",
+                "project_identifiers",
+                "workspace__slug",
+            ),
+            ids,
         )
 
     def get(self, request, slug):
@@ -244,19 +193,30 @@ class GlobalSearchEndpoint(BaseAPIView):
                 status=status.HTTP_200_OK,
             )
 
-        MODELS_MAPPER = {
-            "workspace": self.filter_workspaces,
-            "project": self.filter_projects,
-            "issue": self.filter_issues,
-            "cycle": self.filter_cycles,
-            "module": self.filter_modules,
-            "issue_view": self.filter_views,
-            "page": self.filter_pages,
+        project_ids = self.get_project_ids(slug, project_id, workspace_search)
+        ranked_ids = self.rank_documents(query, slug, project_ids)
+
+        results = {
+            "workspace": self.filter_workspaces(
+                query, slug, project_id, workspace_search
+            ),
+            "project": self.filter_projects(
+                query, slug, project_id, workspace_search
+            ),
+            "issue": self.filter_issues(
+                query, slug, project_ids, ranked_ids.get("issue", [])
+            ),
+            "cycle": self.filter_project_entities(
+                Cycle, slug, project_ids, ranked_ids.get("cycle", [])
+            ),
+            "module": self.filter_project_entities(
+                Module, slug, project_ids, ranked_ids.get("module", [])
+            ),
+            "issue_view": self.filter_project_entities(
+                IssueView, slug, project_ids, ranked_ids.get("issue_view", [])
+            ),
+            "page": self.filter_pages(
+                slug, project_ids, ranked_ids.get("page", [])
+            ),
         }
-
-        results = {}
-
-        for model in MODELS_MAPPER.keys():
-            func = MODELS_MAPPER.get(model, None)
-            results[model] = func(query, slug, project_id, workspace_search)
         return Response({"results": results}, status=status.HTTP_200_OK)
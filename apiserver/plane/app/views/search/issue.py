@@ -11,6 +11,7 @@ from rest_framework.response import Response
 from .base import BaseAPIView
 from plane.db.models import Issue, ProjectMember
 from plane.utils.issue_search import search_issues
+from plane.utils.membership import get_member_project_ids
 
 
 class IssueSearchEndpoint(BaseAPIView):
@@ -30,8 +31,7 @@ class IssueSearchEndpoint(BaseAPIView):
 
         issues = Issue.issue_objects.filter(
             workspace__slug=slug,
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
+            project_id__in=get_member_project_ids(request, slug),
             project__archived_at__isnull=True,
         )
 
@@ -39,7 +39,7 @@ class IssueSearchEndpoint(BaseAPIView):
             issues = issues.filter(project_id=project_id)
 
         if query:
-            issues = search_issues(query, issues)
+            issues = search_issues(query, issues, workspace__slug=slug)
 
         if parent == "true" and issue_id:
             issue = Issue.issue_objects.get(pk=issue_id)
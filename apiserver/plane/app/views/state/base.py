@@ -13,6 +13,7 @@ from plane.app.permissions import (
 )
 from plane.db.models import State, Issue
 from plane.utils.cache import invalidate_cache
+from plane.utils.membership import get_member_project_ids
 
 
 class StateViewSet(BaseViewSet):
@@ -29,8 +30,9 @@ class StateViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(
-                project__project_projectmember__member=self.request.user,
-                project__project_projectmember__is_active=True,
+                project_id__in=get_member_project_ids(
+                    self.request, self.kwargs.get("slug")
+                ),
                 project__archived_at__isnull=True,
             )
             .filter(is_triage=False)
@@ -32,11 +32,17 @@ from plane.db.models import (
     Session,
 )
 from plane.license.models import Instance, InstanceAdmin
-from plane.utils.cache import cache_response, invalidate_cache
+from plane.utils.cache import (
+    cache_response,
+    invalidate_cache,
+    invalidate_cache_tags,
+    user_tag,
+)
 from plane.utils.paginator import BasePaginator
 from plane.authentication.utils.host import user_ip
 from plane.bgtasks.user_deactivation_email_task import user_deactivation_email
 from plane.utils.host import base_host
+from plane.utils.membership import invalidate_membership
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_control
 from django.views.decorators.vary import vary_on_cookie
@@ -170,6 +176,9 @@ class UserEndpoint(BaseViewSet):
         WorkspaceMember.objects.bulk_update(
             workspaces_to_deactivate, ["is_active"], batch_size=100
         )
+        invalidate_membership([request.user.id])
+        # Every response cached for the user
+        invalidate_cache_tags(user_tag(request.user.id))
 
         # Delete all workspace invites
         WorkspaceMemberInvite.objects.filter(
@@ -44,7 +44,9 @@ from plane.utils.grouper import (
 from plane.utils.issue_filters import issue_filters
 from plane.utils.order_queryset import order_issue_queryset
 from plane.utils.paginator import (
+    COUNT_CACHED,
     GroupedOffsetPaginator,
+    KeysetPaginator,
     SubGroupedOffsetPaginator,
 )
 from plane.bgtasks.recent_visited_task import recent_visited_task
@@ -52,6 +54,7 @@ from .. import BaseViewSet
 from plane.db.models import (
     UserFavorite,
 )
+from plane.utils.membership import get_member_project_ids
 
 
 class WorkspaceViewViewSet(BaseViewSet):
@@ -199,8 +202,9 @@ class WorkspaceViewIssuesViewSet(BaseViewSet):
             )
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(
-                project__project_projectmember__member=self.request.user,
-                project__project_projectmember__is_active=True,
+                project_id__in=get_member_project_ids(
+                    self.request, self.kwargs.get("slug")
+                ),
             )
             .select_related("workspace", "project", "state", "parent")
             .prefetch_related("assignees", "labels", "issue_module__module")
@@ -382,6 +386,8 @@ class WorkspaceViewIssuesViewSet(BaseViewSet):
                 on_results=lambda issues: issue_on_results(
                     group_by=group_by, issues=issues, sub_group_by=sub_group_by
                 ),
+                paginator_cls=KeysetPaginator,
+                count=COUNT_CACHED,
             )
 
 
@@ -409,8 +415,9 @@ class IssueViewViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(
-                project__project_projectmember__member=self.request.user,
-                project__project_projectmember__is_active=True,
+                project_id__in=get_member_project_ids(
+                    self.request, self.kwargs.get("slug")
+                ),
                 project__archived_at__isnull=True,
             )
             .filter(Q(owned_by=self.request.user) | Q(access=1))
@@ -43,7 +43,12 @@ from plane.db.models import (
     WorkspaceMember,
     WorkspaceTheme,
 )
-from plane.utils.cache import cache_response, invalidate_cache
+from plane.utils.cache import (
+    cache_response,
+    invalidate_cache,
+    invalidate_cache_tags,
+    workspace_tag,
+)
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_control
 from django.views.decorators.vary import vary_on_cookie
@@ -163,7 +168,10 @@ class WorkSpaceViewSet(BaseViewSet):
         path="/api/users/me/settings/", multiple=True, user=False
     )
     def destroy(self, request, *args, **kwargs):
-        return super().destroy(request, *args, **kwargs)
+        response = super().destroy(request, *args, **kwargs)
+        # Everything cached for the workspace, whatever the path
+        invalidate_cache_tags(workspace_tag(kwargs["slug"]))
+        return response
 
 
 class UserWorkSpacesEndpoint(BaseAPIView):
@@ -8,6 +8,7 @@ from plane.app.views.base import BaseAPIView
 from plane.db.models import Label
 from plane.app.permissions import WorkspaceViewerPermission
 from plane.utils.cache import cache_response
+from plane.utils.membership import get_member_project_ids
 
 class WorkspaceLabelsEndpoint(BaseAPIView):
     permission_classes = [
@@ -18,8 +19,7 @@ class WorkspaceLabelsEndpoint(BaseAPIView):
     def get(self, request, slug):
         labels = Label.objects.filter(
             workspace__slug=slug,
-            project__project_projectmember__member=request.user,
-            project__project_projectmember__is_active=True,
+            project_id__in=get_member_project_ids(request, slug),
             project__archived_at__isnull=True,
         )
         serializer = LabelSerializer(labels, many=True).data
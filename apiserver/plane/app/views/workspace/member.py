@@ -231,7 +231,7 @@ class WorkSpaceMemberViewSet(BaseViewSet):
     )
     @invalidate_cache(path="/api/users/me/settings/")
     @invalidate_cache(
-        path="api/users/me/workspaces/", user=False, multiple=True
+        path="/api/users/me/workspaces/", user=False, multiple=True
     )
     def leave(self, request, slug):
         workspace_member = WorkspaceMember.objects.get(
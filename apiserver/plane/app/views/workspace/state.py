@@ -8,6 +8,7 @@ from plane.app.views.base import BaseAPIView
 from plane.db.models import State
 from plane.app.permissions import WorkspaceEntityPermission
 from plane.utils.cache import cache_response
+from plane.utils.membership import get_member_project_ids
 
 class WorkspaceStatesEndpoint(BaseAPIView):
     permission_classes = [
@@ -18,8 +19,7 @@ class WorkspaceStatesEndpoint(BaseAPIView):
     def get(self, request, slug):
         states = State.objects.filter(
             workspace__slug=slug,
-            project__project_projectmember__member=request.user,
-            project__project_projectmember__is_active=True,
+            project_id__in=get_member_project_ids(request, slug),
             project__archived_at__isnull=True,
             is_triage=False,
         )
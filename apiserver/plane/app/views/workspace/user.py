@@ -5,15 +5,11 @@ from dateutil.relativedelta import relativedelta
 
 # Django imports
 from django.db.models import (
-    Case,
     Count,
     F,
     Func,
-    IntegerField,
     OuterRef,
     Q,
-    Value,
-    When,
 )
 from django.db.models.fields import DateField
 from django.db.models.functions import Cast, ExtractWeek
@@ -50,6 +46,11 @@ from plane.db.models import (
     WorkspaceMember,
     WorkspaceUserProperties,
 )
+from plane.utils.dashboard_stats import (
+    PRIORITIES,
+    STATE_GROUPS,
+    get_dashboard_stats,
+)
 from plane.utils.grouper import (
     issue_group_values,
     issue_on_results,
@@ -58,9 +59,12 @@ from plane.utils.grouper import (
 from plane.utils.issue_filters import issue_filters
 from plane.utils.order_queryset import order_issue_queryset
 from plane.utils.paginator import (
+    COUNT_CACHED,
     GroupedOffsetPaginator,
+    KeysetPaginator,
     SubGroupedOffsetPaginator,
 )
+from plane.utils.membership import get_member_project_ids
 
 
 class UserLastProjectWithWorkspaceEndpoint(BaseAPIView):
@@ -114,8 +118,7 @@ class WorkspaceUserProfileIssuesEndpoint(BaseAPIView):
                 | Q(created_by_id=user_id)
                 | Q(issue_subscribers__subscriber_id=user_id),
                 workspace__slug=slug,
-                project__project_projectmember__member=request.user,
-                project__project_projectmember__is_active=True,
+                project_id__in=get_member_project_ids(request, slug),
             )
             .filter(**filters)
             .select_related("workspace", "project", "state", "parent")
@@ -239,6 +242,8 @@ class WorkspaceUserProfileIssuesEndpoint(BaseAPIView):
                 on_results=lambda issues: issue_on_results(
                     group_by=group_by, issues=issues, sub_group_by=sub_group_by
                 ),
+                paginator_cls=KeysetPaginator,
+                count=COUNT_CACHED,
             )
 
 
@@ -381,8 +386,7 @@ class WorkspaceUserActivityEndpoint(BaseAPIView):
         queryset = IssueActivity.objects.filter(
             ~Q(field__in=["comment", "vote", "reaction", "draft"]),
             workspace__slug=slug,
-            project__project_projectmember__member=request.user,
-            project__project_projectmember__is_active=True,
+            project_id__in=get_member_project_ids(request, slug),
             project__archived_at__isnull=True,
             actor=user_id,
         ).select_related("actor", "workspace", "issue", "project")
@@ -404,98 +408,33 @@ class WorkspaceUserProfileStatsEndpoint(BaseAPIView):
     def get(self, request, slug, user_id):
         filters = issue_filters(request.query_params, "GET")
 
-        state_distribution = (
-            Issue.issue_objects.filter(
-                workspace__slug=slug,
-                assignees__in=[user_id],
-                project__project_projectmember__member=request.user,
-                project__project_projectmember__is_active=True,
-            )
-            .filter(**filters)
-            .annotate(state_group=F("state__group"))
-            .values("state_group")
-            .annotate(state_count=Count("state_group"))
-            .order_by("state_group")
-        )
-
-        priority_order = ["urgent", "high", "medium", "low", "none"]
-
-        priority_distribution = (
-            Issue.issue_objects.filter(
-                workspace__slug=slug,
-                assignees__in=[user_id],
-                project__project_projectmember__member=request.user,
-                project__project_projectmember__is_active=True,
-            )
-            .filter(**filters)
-            .values("priority")
-            .annotate(priority_count=Count("priority"))
-            .filter(priority_count__gte=1)
-            .annotate(
-                priority_order=Case(
-                    *[
-                        When(priority=p, then=Value(i))
-                        for i, p in enumerate(priority_order)
-                    ],
-                    default=Value(len(priority_order)),
-                    output_field=IntegerField(),
-                )
-            )
-            .order_by("priority_order")
-        )
-
-        created_issues = (
-            Issue.issue_objects.filter(
-                workspace__slug=slug,
-                project__project_projectmember__member=request.user,
-                project__project_projectmember__is_active=True,
-                created_by_id=user_id,
-            )
-            .filter(**filters)
-            .count()
-        )
-
-        assigned_issues_count = (
-            Issue.issue_objects.filter(
-                workspace__slug=slug,
-                assignees__in=[user_id],
-                project__project_projectmember__member=request.user,
-                project__project_projectmember__is_active=True,
-            )
-            .filter(**filters)
-            .count()
-        )
-
-        pending_issues_count = (
-            Issue.issue_objects.filter(
-                ~Q(state__group__in=["completed", "cancelled"]),
-                workspace__slug=slug,
-                assignees__in=[user_id],
-                project__project_projectmember__member=request.user,
-                project__project_projectmember__is_active=True,
-            )
-            .filter(**filters)
-            .count()
+        stats = get_dashboard_stats(
+            slug,
+            user_id,
+            get_member_project_ids(request, slug),
+            filters=filters,
         )
 
-        completed_issues_count = (
-            Issue.issue_objects.filter(
-                workspace__slug=slug,
-                assignees__in=[user_id],
-                state__group="completed",
-                project__project_projectmember__member=request.user,
-                project__project_projectmember__is_active=True,
-            )
-            .filter(**filters)
-            .count()
-        )
+        state_distribution = [
+            {"state_group": group, "state_count": stats[f"state_{group}"]}
+            for group in sorted(STATE_GROUPS)
+            if stats[f"state_{group}"]
+        ]
+        priority_distribution = [
+            {
+                "priority": priority,
+                "priority_count": stats[f"priority_{priority}"],
+                "priority_order": priority_order,
+            }
+            for priority_order, priority in enumerate(PRIORITIES)
+            if stats[f"priority_{priority}"]
+        ]
 
         subscribed_issues_count = (
             IssueSubscriber.objects.filter(
                 workspace__slug=slug,
                 subscriber_id=user_id,
-                project__project_projectmember__member=request.user,
-                project__project_projectmember__is_active=True,
+                project_id__in=get_member_project_ids(request, slug),
                 project__archived_at__isnull=True,
             )
             .filter(**filters)
@@ -523,10 +462,10 @@ class WorkspaceUserProfileStatsEndpoint(BaseAPIView):
             {
                 "state_distribution": state_distribution,
                 "priority_distribution": priority_distribution,
-                "created_issues": created_issues,
-                "assigned_issues": assigned_issues_count,
-                "completed_issues": completed_issues_count,
-                "pending_issues": pending_issues_count,
+                "created_issues": stats["created"],
+                "assigned_issues": stats["assigned"],
+                "completed_issues": stats["completed"],
+                "pending_issues": stats["pending"],
                 "subscribed_issues": subscribed_issues_count,
                 "present_cycles": present_cycle,
                 "upcoming_cycles": upcoming_cycles,
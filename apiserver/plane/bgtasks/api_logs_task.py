@@ -1,4 +1,5 @@
 from django.utils import timezone
+from django.db.models import Min
 from datetime import timedelta
 from plane.db.models import APIActivityLog
 from celery import shared_task
@@ -7,9 +8,19 @@ from celery import shared_task
 @shared_task
 def delete_api_logs():
     # Get the logs older than 30 days to delete
-    logs_to_delete = APIActivityLog.objects.filter(
-        created_at__lte=timezone.now() - timedelta(days=30)
-    )
+    cutoff = timezone.now() - timedelta(days=30)
+    start = APIActivityLog.objects.filter(created_at__lte=cutoff).aggregate(
+        oldest=Min("created_at")
+    )["oldest"]
 
-    # Delete the logs
-    logs_to_delete._raw_delete(logs_to_delete.db)
+    # Delete a day of logs per statement, every delete scans a narrow
+    # created_at range and commits on its own instead of one long delete
+    while start is not None and start <= cutoff:
+        end = start + timedelta(days=1)
+        logs_to_delete = APIActivityLog.objects.filter(
+            created_at__gte=start,
+            created_at__lt=end,
+            created_at__lte=cutoff,
+        )
+        logs_to_delete._raw_delete(logs_to_delete.db)
+        start = end
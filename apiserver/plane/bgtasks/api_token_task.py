@@ -0,0 +1,38 @@
+# Python imports
+from datetime import datetime, timezone
+
+# Third party imports
+from celery import shared_task
+
+# Module imports
+from plane.db.models import APIToken
+from plane.settings.redis import redis_instance
+from plane.utils.api_token_cache import API_TOKEN_LAST_USED_KEY
+from plane.utils.exception_logger import log_exception
+
+
+@shared_task
+def flush_api_token_last_used():
+    try:
+        pipeline = redis_instance().pipeline(transaction=True)
+        pipeline.hgetall(API_TOKEN_LAST_USED_KEY)
+        pipeline.delete(API_TOKEN_LAST_USED_KEY)
+        last_used = pipeline.execute()[0]
+
+        # One update for all the tokens used since the last flush
+        APIToken.objects.bulk_update(
+            [
+                APIToken(
+                    id=token_id.decode(),
+                    last_used=datetime.fromtimestamp(
+                        float(timestamp), tz=timezone.utc
+                    ),
+                )
+                for token_id, timestamp in last_used.items()
+            ],
+            ["last_used"],
+            batch_size=500,
+        )
+    except Exception as e:
+        log_exception(e)
+        return
@@ -0,0 +1,100 @@
+# Django imports
+from django.db.models import Exists, F, OuterRef, Q
+from django.utils import timezone
+
+# Third party imports
+from celery import shared_task
+
+# Module imports
+from plane.db.models import (
+    Cycle,
+    CycleBurndownSnapshot,
+    Module,
+    ModuleBurndownSnapshot,
+)
+from plane.utils.analytics_plot import (
+    burndown_chart,
+    burndown_date_range,
+    burndown_distribution,
+)
+from plane.utils.exception_logger import log_exception
+
+
+def snapshot_burndowns(snapshot_model, field, entities, end_field, today):
+    for entity in entities.iterator():
+        end_date = min(getattr(entity, end_field), today)
+        recorded = set(
+            snapshot_model.objects.filter(
+                **{field: entity}, date__lt=today
+            ).values_list("date", flat=True)
+        )
+        # Record today and fill the days that were missed
+        dates = [
+            date
+            for date in burndown_date_range(entity.start_date, end_date)
+            if date not in recorded
+        ]
+        if not dates:
+            continue
+
+        chart = burndown_chart(burndown_distribution(field, entity.id), dates)
+        snapshot_model.objects.bulk_create(
+            [
+                snapshot_model(
+                    **{field: entity},
+                    project_id=entity.project_id,
+                    workspace_id=entity.workspace_id,
+                    date=date,
+                    pending_issues=pending_issues,
+                    pending_estimate_points=pending_points,
+                )
+                for date, (pending_issues, pending_points) in chart.items()
+            ],
+            update_conflicts=True,
+            unique_fields=[field, "date"],
+            update_fields=[
+                "pending_issues",
+                "pending_estimate_points",
+                "updated_at",
+            ],
+            batch_size=1000,
+        )
+
+
+def burndown_entities(model, snapshot_model, field, end_field, today):
+    # Running entities, and finished ones that are not closed out yet
+    closed = snapshot_model.objects.filter(
+        **{field: OuterRef("pk")}, date=OuterRef(end_field)
+    )
+    return model.objects.filter(
+        Q(**{f"{end_field}__gte": today}) | ~Exists(closed),
+        start_date__lte=today,
+        **{f"{end_field}__gte": F("start_date")},
+    ).only("id", "project_id", "workspace_id", "start_date", end_field)
+
+
+@shared_task
+def take_burndown_snapshots():
+    try:
+        today = timezone.now().date()
+        snapshot_burndowns(
+            CycleBurndownSnapshot,
+            "cycle",
+            burndown_entities(
+                Cycle, CycleBurndownSnapshot, "cycle", "end_date", today
+            ),
+            "end_date",
+            today,
+        )
+        snapshot_burndowns(
+            ModuleBurndownSnapshot,
+            "module",
+            burndown_entities(
+                Module, ModuleBurndownSnapshot, "module", "target_date", today
+            ),
+            "target_date",
+            today,
+        )
+    except Exception as e:
+        log_exception(e)
+        return
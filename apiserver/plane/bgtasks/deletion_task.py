@@ -1,36 +1,224 @@
+# Python imports
+import json
+import logging
+import time
+from functools import lru_cache
+
 # Django imports
 from django.utils import timezone
 from django.apps import apps
 from django.conf import settings
-from django.core.exceptions import ObjectDoesNotExist
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
 
 # Third party imports
 from celery import shared_task
 
+# Module imports
+from plane.db.signals import soft_deleted
+from plane.settings.redis import redis_instance
+from plane.utils.metrics import increment_metric, observe_metric
+
+# Checkpoint of the soft delete cascade of an instance
+SOFT_DELETE_PROGRESS_KEY = "deletion:soft_delete:{label}:{pk}"
+
+# Seconds the checkpoint of a cascade is kept after its last update
+SOFT_DELETE_PROGRESS_TTL = 60 * 60 * 24 * 7
+
+# Checkpoint of the running hard delete purge
+HARD_DELETE_PROGRESS_KEY = "deletion:hard_delete"
+
+# Seconds the checkpoint of a purge outlives its last batch
+HARD_DELETE_PROGRESS_TTL = 60 * 60 * 24 * 2
+
+logger = logging.getLogger("plane")
+
+
+@lru_cache(maxsize=None)
+def get_soft_delete_relations(model):
+    """
+    Soft deletable models removed along with the model by a hard delete,
+    with the name of the foreign key pointing at it
+    """
+    return tuple(
+        (field.related_model, field.field.name)
+        for field in model._meta.get_fields()
+        if (field.one_to_many or field.one_to_one)
+        and field.auto_created
+        and not field.concrete
+        and field.on_delete is models.CASCADE
+        and hasattr(field.related_model, "deleted_at")
+    )
+
+
+def get_soft_delete_progress(model, instance_pk):
+    """Checkpoint and deleted rows of every table of a cascade"""
+    progress = redis_instance().get(
+        SOFT_DELETE_PROGRESS_KEY.format(
+            label=model._meta.label_lower, pk=instance_pk
+        )
+    )
+    return json.loads(progress) if progress else None
+
+
+class SoftDeleteCascade:
+    """
+    Marks every soft deletable descendant of a deleted instance as deleted
+    with one update per batch of rows of a table, walking the relations
+    depth first so only a batch of keys is held per level.
+
+    Descendants carry the deleted_at of the instance. The position in the
+    relations of the instance is checkpointed in Redis after every batch
+    and a new run resumes from there, walking the rows already marked by
+    the cascade again to reach the descendants that were missed.
+    """
+
+    def __init__(self, instance, using=None):
+        self.instance = instance
+        self.using = using
+        self.deleted_at = instance.deleted_at
+        self.batch_size = settings.SOFT_DELETE_BATCH_SIZE
+        self.key = SOFT_DELETE_PROGRESS_KEY.format(
+            label=instance._meta.label_lower, pk=instance.pk
+        )
+        self.progress = {"relation": None, "last_pk": None, "counts": {}}
+        self.resuming = False
+        # Self referencing rows are only walked once, in case of a loop
+        self.visited = set()
+
+    def load_progress(self):
+        try:
+            progress = redis_instance().get(self.key)
+        except Exception as e:
+            logger.warning(f"Soft delete checkpoint was not read: {e}")
+            return
+        if progress:
+            progress = json.loads(progress)
+            # A restored and deleted again instance starts over
+            if progress.get("deleted_at") == self.get_deleted_at():
+                self.progress = progress
+                self.resuming = True
+
+    def save_progress(self):
+        self.progress["deleted_at"] = self.get_deleted_at()
+        try:
+            redis_instance().set(
+                self.key,
+                json.dumps(self.progress, cls=DjangoJSONEncoder),
+                ex=SOFT_DELETE_PROGRESS_TTL,
+            )
+        except Exception as e:
+            logger.warning(f"Soft delete checkpoint was not saved: {e}")
+
+    def get_deleted_at(self):
+        return json.loads(json.dumps(self.deleted_at, cls=DjangoJSONEncoder))
+
+    def get_batches(self, model, field_name, parent_pks, last_pk=None):
+        """Keys of the rows of the parents, in batches ordered by key"""
+        pending = models.Q(deleted_at__isnull=True)
+        if self.resuming:
+            # The descendants of the rows marked before the interruption
+            # may not have been reached yet
+            pending |= models.Q(deleted_at=self.deleted_at)
+        queryset = model.all_objects.using(self.using).filter(
+            pending, **{f"{field_name}__in": parent_pks}
+        )
+        while True:
+            batch = queryset
+            if last_pk is not None:
+                batch = batch.filter(pk__gt=last_pk)
+            pks = list(
+                batch.order_by("pk").values_list("pk", flat=True)[
+                    : self.batch_size
+                ]
+            )
+            if not pks:
+                return
+            last_pk = pks[-1]
+            yield pks
+
+    def delete_batch(self, model, pks):
+        updated = (
+            model.all_objects.using(self.using)
+            .filter(pk__in=pks, deleted_at__isnull=True)
+            .update(deleted_at=self.deleted_at)
+        )
+        if updated:
+            table = model._meta.db_table
+            counts = self.progress["counts"]
+            counts[table] = counts.get(table, 0) + updated
+            soft_deleted.send(sender=model, pks=pks, using=self.using)
+
+    def cascade(self, model, parent_pks):
+        for related_model, field_name in get_soft_delete_relations(model):
+            for pks in self.get_batches(related_model, field_name, parent_pks):
+                self.walk(model, related_model, pks)
 
-@shared_task
+    def walk(self, parent_model, model, pks):
+        if model is parent_model:
+            pks = [
+                pk for pk in pks if (model._meta.label, pk) not in self.visited
+            ]
+            self.visited.update((model._meta.label, pk) for pk in pks)
+            if not pks:
+                return
+        self.delete_batch(model, pks)
+        self.cascade(model, pks)
+
+    def run(self):
+        self.load_progress()
+        if self.progress.get("completed"):
+            return self.progress["counts"]
+
+        model = type(self.instance)
+        relations = [
+            f"{related_model._meta.label}.{field_name}"
+            for related_model, field_name in get_soft_delete_relations(model)
+        ]
+        # Relations before the checkpoint are already done
+        start = (
+            relations.index(self.progress["relation"])
+            if self.progress["relation"] in relations
+            else 0
+        )
+        for relation, (related_model, field_name) in list(
+            zip(relations, get_soft_delete_relations(model))
+        )[start:]:
+            last_pk = (
+                self.progress["last_pk"]
+                if relation == self.progress["relation"]
+                else None
+            )
+            for pks in self.get_batches(
+                related_model, field_name, [self.instance.pk], last_pk
+            ):
+                self.walk(model, related_model, pks)
+                self.progress.update(relation=relation, last_pk=pks[-1])
+                self.save_progress()
+            logger.info(
+                f"Soft deleted {relation} of {self.key}, "
+                f"{sum(self.progress['counts'].values())} rows so far"
+            )
+
+        self.progress.update(relation=None, last_pk=None, completed=True)
+        self.save_progress()
+        return self.progress["counts"]
+
+
+# Late acknowledgement redelivers the task when the worker is lost, the
+# cascade then resumes from its checkpoint
+@shared_task(acks_late=True)
 def soft_delete_related_objects(
     app_label, model_name, instance_pk, using=None
 ):
     model_class = apps.get_model(app_label, model_name)
-    instance = model_class.all_objects.get(pk=instance_pk)
-    related_fields = instance._meta.get_fields()
-    for field in related_fields:
-        if field.one_to_many or field.one_to_one:
-            try:
-                if field.one_to_many:
-                    related_objects = getattr(instance, field.name).all()
-                elif field.one_to_one:
-                    related_object = getattr(instance, field.name)
-                    related_objects = (
-                        [related_object] if related_object is not None else []
-                    )
-                for obj in related_objects:
-                    if obj:
-                        obj.deleted_at = timezone.now()
-                        obj.save(using=using)
-            except ObjectDoesNotExist:
-                pass
+    instance = (
+        model_class.all_objects.using(using).filter(pk=instance_pk).first()
+    )
+    # The instance was restored or removed before the cascade ran
+    if instance is None or instance.deleted_at is None:
+        return
+    return SoftDeleteCascade(instance, using=using).run()
 
 
 # @shared_task
@@ -38,124 +226,153 @@ def restore_related_objects(app_label, model_name, instance_pk, using=None):
     pass
 
 
-@shared_task
-def hard_delete():
+def get_purge_order():
+    """
+    Soft deletable models ordered with the models cascading from a model
+    before it, so the rows left to collect with a deleted parent are few
+    """
+    ordered, visiting = [], set()
 
-    from plane.db.models import (
-        Workspace,
-        Project,
-        Cycle,
-        Module,
-        Issue,
-        Page,
-        IssueView,
-        Label,
-        State,
-        IssueActivity,
-        IssueComment,
-        IssueLink,
-        IssueReaction,
-        UserFavorite,
-        ModuleIssue,
-        CycleIssue,
-        Estimate,
-        EstimatePoint,
-    )
+    def visit(model):
+        # Models met again through a loop of relations keep their place
+        if model in visiting or model in ordered:
+            return
+        visiting.add(model)
+        for related_model, _ in get_soft_delete_relations(model):
+            visit(related_model)
+        visiting.discard(model)
+        ordered.append(model)
+
+    for model in apps.get_models():
+        if (
+            hasattr(model, "deleted_at")
+            and model._meta.managed
+            and not model._meta.proxy
+        ):
+            visit(model)
+    return ordered
+
+
+class HardDeletePurge:
+    """
+    Deletes the rows soft deleted before the retention period, one model
+    at a time, in batches of primary keys with a pause between batches.
+    Django deletes a batch with a single raw delete when the model has no
+    delete signals nor relations to collect, otherwise only the rows of
+    the batch and their cascades are loaded. The position of the purge is
+    checkpointed in Redis after every batch and a killed purge resumes
+    from it with the same cutoff.
+    """
 
-    days = settings.HARD_DELETE_AFTER_DAYS
-    # check delete workspace
-    _ = Workspace.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete project
-    _ = Project.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete cycle
-    _ = Cycle.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete module
-    _ = Module.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete issue
-    _ = Issue.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete page
-    _ = Page.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete view
-    _ = IssueView.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete label
-    _ = Label.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete state
-    _ = State.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = IssueActivity.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = IssueComment.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = IssueLink.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = IssueReaction.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = UserFavorite.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = ModuleIssue.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = CycleIssue.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = Estimate.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = EstimatePoint.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # at last, check for every thing which ever is left and delete it
-    # Get all Django models
-    all_models = apps.get_models()
-
-    # Iterate through all models
-    for model in all_models:
-        # Check if the model has a 'deleted_at' field
-        if hasattr(model, "deleted_at"):
-            # Get all instances where 'deleted_at' is greater than 30 days ago
-            _ = model.all_objects.filter(
-                deleted_at__lt=timezone.now()
-                - timezone.timedelta(days=days)
-            ).delete()
-
-    return
+    def __init__(self):
+        self.batch_size = settings.HARD_DELETE_BATCH_SIZE
+        self.pause = settings.HARD_DELETE_BATCH_PAUSE
+        self.progress = None
+
+    def load_progress(self):
+        try:
+            progress = redis_instance().get(HARD_DELETE_PROGRESS_KEY)
+        except Exception as e:
+            logger.warning(f"Hard delete checkpoint was not read: {e}")
+            progress = None
+        if progress:
+            self.progress = json.loads(progress)
+        else:
+            cutoff = timezone.now() - timezone.timedelta(
+                days=settings.HARD_DELETE_AFTER_DAYS
+            )
+            self.progress = {
+                "cutoff": cutoff.isoformat(),
+                "model": None,
+                "last_pk": None,
+                "counts": {},
+                "durations": {},
+            }
+
+    def save_progress(self):
+        try:
+            redis_instance().set(
+                HARD_DELETE_PROGRESS_KEY,
+                json.dumps(self.progress, cls=DjangoJSONEncoder),
+                ex=HARD_DELETE_PROGRESS_TTL,
+            )
+        except Exception as e:
+            logger.warning(f"Hard delete checkpoint was not saved: {e}")
+
+    def purge_model(self, model, last_pk=None):
+        label = model._meta.label
+        queryset = model.all_objects.filter(
+            deleted_at__lt=self.progress["cutoff"]
+        )
+        while True:
+            batch = queryset
+            if last_pk is not None:
+                batch = batch.filter(pk__gt=last_pk)
+            pks = list(
+                batch.order_by("pk").values_list("pk", flat=True)[
+                    : self.batch_size
+                ]
+            )
+            if not pks:
+                return
+
+            started = time.monotonic()
+            _, deleted = model.all_objects.filter(pk__in=pks).delete()
+            duration = time.monotonic() - started
+
+            # Rows of other tables deleted with the batch are counted too
+            for deleted_label, count in deleted.items():
+                counts = self.progress["counts"]
+                counts[deleted_label] = counts.get(deleted_label, 0) + count
+                increment_metric(f"hard_delete.rows.{deleted_label}", count)
+            durations = self.progress["durations"]
+            durations[label] = durations.get(label, 0) + duration
+            observe_metric(f"hard_delete.batch_seconds.{label}", duration)
+
+            last_pk = pks[-1]
+            self.progress.update(model=label, last_pk=last_pk)
+            self.save_progress()
+            if self.pause:
+                time.sleep(self.pause)
+
+    def run(self):
+        self.load_progress()
+        models_order = get_purge_order()
+        labels = [model._meta.label for model in models_order]
+        # Models before the checkpoint are already purged
+        start = (
+            labels.index(self.progress["model"])
+            if self.progress["model"] in labels
+            else 0
+        )
+        for model in models_order[start:]:
+            label = model._meta.label
+            self.purge_model(
+                model,
+                self.progress["last_pk"]
+                if label == self.progress["model"]
+                else None,
+            )
+            logger.info(
+                f"Hard deleted {self.progress['counts'].get(label, 0)} "
+                f"{label} rows in "
+                f"{self.progress['durations'].get(label, 0):.1f}s"
+            )
+
+        # The next purge starts over with a new cutoff
+        try:
+            redis_instance().delete(HARD_DELETE_PROGRESS_KEY)
+        except Exception as e:
+            logger.warning(f"Hard delete checkpoint was not cleared: {e}")
+        return self.progress
+
+
+# Late acknowledgement redelivers the task when the worker is lost, the
+# purge then resumes from its checkpoint
+@shared_task(acks_late=True)
+def hard_delete():
+    progress = HardDeletePurge().run()
+    return {
+        "counts": progress["counts"],
+        "durations": progress["durations"],
+    }
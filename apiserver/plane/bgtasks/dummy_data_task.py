@@ -33,6 +33,7 @@ from plane.db.models import (
     Inbox,
     InboxIssue,
 )
+from plane.utils.issue_sequence import reserve_issue_sequences
 
 
 def create_project(workspace, user_id):
@@ -317,14 +318,8 @@ def create_issues(workspace, project, user_id, issue_count):
 
     issues = []
 
-    # Get the maximum sequence_id
-    last_id = IssueSequence.objects.filter(
-        project=project,
-    ).aggregate(
-        largest=Max("sequence")
-    )["largest"]
-
-    last_id = 1 if last_id is None else last_id + 1
+    # Reserve the sequence ids of all the issues at once
+    last_id = reserve_issue_sequences(project, issue_count)
 
     # Get the maximum sort order
     largest_sort_order = Issue.objects.filter(
@@ -1,15 +1,20 @@
+# Python imports
+import hashlib
 import logging
 import re
 from datetime import datetime
+from itertools import groupby
+from uuid import UUID
 
 from bs4 import BeautifulSoup
 
 # Third party imports
 from celery import shared_task
-from django.core.mail import EmailMultiAlternatives, get_connection
-from django.template.loader import render_to_string
 
 # Django imports
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.template.loader import render_to_string
 from django.utils import timezone
 from django.utils.html import strip_tags
 
@@ -19,6 +24,11 @@ from plane.license.utils.instance_value import get_email_configuration
 from plane.settings.redis import redis_instance
 from plane.utils.exception_logger import log_exception
 
+# Users mentioned in a comment
+MENTION_PATTERN = re.compile(
+    r'<mention-component[^>]*\bentity_identifier="([^"]+)"'
+)
+
 
 def remove_unwanted_characters(input_text):
     # Keep only alphanumeric characters, spaces, and dashes.
@@ -39,65 +49,90 @@ def release_lock(lock_id):
     redis_client.delete(lock_id)
 
 
+def group_email_notifications(rows, window):
+    """
+    Digests of the rows in one pass, the rows being ordered by receiver. A
+    receiver cut by a full window is left to the next run unless it is the
+    only one.
+    Yields (receiver_id, {issue_id: ({actor_id: [data]}, ids)}, ids)
+    """
+    groups = groupby(rows, key=lambda row: row[1])
+    current = None
+    count = 0
+    for receiver_id, receiver_rows in groups:
+        if current is not None:
+            yield current
+        payload = {}
+        ids = []
+        for (
+            notification_id,
+            _,
+            issue_id,
+            triggered_by_id,
+            data,
+        ) in receiver_rows:
+            notification_data, issue_ids = payload.setdefault(
+                str(issue_id), ({}, [])
+            )
+            notification_data.setdefault(str(triggered_by_id), []).append(
+                data
+            )
+            issue_ids.append(notification_id)
+            ids.append(notification_id)
+        count += len(ids)
+        current = (str(receiver_id), payload, ids)
+
+    if current is not None and (count < window or count == len(current[2])):
+        yield current
+
+
 @shared_task
 def stack_email_notification():
-    # get all email notifications
-    email_notifications = (
+    window = settings.EMAIL_NOTIFICATION_BATCH_SIZE
+    rows = (
         EmailNotificationLog.objects.filter(processed_at__isnull=True)
-        .order_by("receiver")
-        .values()
+        .order_by("receiver_id", "created_at")
+        .values_list(
+            "id",
+            "receiver_id",
+            "entity_identifier",
+            "triggered_by_id",
+            "data",
+        )[:window]
     )
 
-    # Create the below format for each of the issues
-    # {"issue_id" : { "actor_id1": [ { data }, { data } ], "actor_id2": [ { data }, { data } ] }}
-
-    # Convert to unique receivers list
-    receivers = list(
-        set(
-            [
-                str(notification.get("receiver_id"))
-                for notification in email_notifications
-            ]
-        )
-    )
     processed_notifications = []
-    # Loop through all the issues to create the emails
-    for receiver_id in receivers:
-        # Notification triggered for the receiver
-        receiver_notifications = [
-            notification
-            for notification in email_notifications
-            if str(notification.get("receiver_id")) == receiver_id
-        ]
-        # create payload for all issues
-        payload = {}
-        email_notification_ids = []
-        for receiver_notification in receiver_notifications:
-            payload.setdefault(
-                receiver_notification.get("entity_identifier"), {}
-            ).setdefault(
-                str(receiver_notification.get("triggered_by_id")), []
-            ).append(
-                receiver_notification.get("data")
-            )
-            # append processed notifications
-            processed_notifications.append(receiver_notification.get("id"))
-            email_notification_ids.append(receiver_notification.get("id"))
-
-        # Create emails for all the issues
-        for issue_id, notification_data in payload.items():
-            send_email_notification.delay(
-                issue_id=issue_id,
-                notification_data=notification_data,
-                receiver_id=receiver_id,
-                email_notification_ids=email_notification_ids,
-            )
+    # Every receiver gets all of its issue emails from one task
+    for receiver_id, payload, ids in group_email_notifications(
+        rows.iterator(chunk_size=500), window
+    ):
+        send_email_digest.delay(
+            receiver_id=receiver_id,
+            issues=[
+                {
+                    "issue_id": issue_id,
+                    "notification_data": notification_data,
+                    "email_notification_ids": [
+                        str(id) for id in email_notification_ids
+                    ],
+                }
+                for issue_id, (
+                    notification_data,
+                    email_notification_ids,
+                ) in payload.items()
+            ],
+        )
+        processed_notifications.extend(ids)
 
     # Update the email notification log
     EmailNotificationLog.objects.filter(pk__in=processed_notifications).update(
         processed_at=timezone.now()
     )
 
+    # Carry on with the rows past a full window
+    if len(processed_notifications) and rows.count() == window:
+        stack_email_notification.delay()
+
 
 def create_payload(notification_data):
     # return format {"actor_id":  { "key": { "old_value": [], "new_value": [] } }}
@@ -148,197 +183,282 @@ def create_payload(notification_data):
     return data
 
 
-def process_mention(mention_component):
+def get_mentioned_user_ids(data):
+    user_ids = set()
+    for changes in data.values():
+        mention = changes.get("mention") or {}
+        for html_content in mention.get("new_value", []) + mention.get(
+            "old_value", []
+        ):
+            user_ids.update(MENTION_PATTERN.findall(html_content))
+    return user_ids
+
+
+def is_valid_uuid(value):
+    try:
+        UUID(str(value))
+    except ValueError:
+        return False
+    return True
+
+
+def process_mention(mention_component, users):
     soup = BeautifulSoup(mention_component, "html.parser")
     mentions = soup.find_all("mention-component")
     for mention in mentions:
-        user_id = mention["entity_identifier"]
-        user = User.objects.get(pk=user_id)
-        user_name = user.display_name
-        highlighted_name = f"@{user_name}"
+        user = users.get(mention["entity_identifier"])
+        if user is None:
+            mention.replace_with(mention.get_text())
+            continue
+        highlighted_name = f"@{user.display_name}"
         mention.replace_with(highlighted_name)
     return str(soup)
 
 
-def process_html_content(content):
+def process_html_content(content, users):
     processed_content_list = []
     for html_content in content:
-        processed_content = process_mention(html_content)
+        processed_content = process_mention(html_content, users)
         processed_content_list.append(processed_content)
     return processed_content_list
 
 
-@shared_task
-def send_email_notification(
-    issue_id, notification_data, receiver_id, email_notification_ids
-):
-    # Convert UUIDs to a sorted, concatenated string
-    sorted_ids = sorted(email_notification_ids)
-    ids_str = "_".join(str(id) for id in sorted_ids)
-    lock_id = f"send_email_notif_{issue_id}_{receiver_id}_{ids_str}"
-
-    # acquire the lock for sending emails
-    try:
-        if acquire_lock(lock_id=lock_id):
-            # get the redis instance
-            ri = redis_instance()
-            base_api = (
-                ri.get(str(issue_id)).decode()
-                if ri.get(str(issue_id))
-                else None
+def get_actor_detail(actor):
+    return {
+        "avatar_url": actor.avatar,
+        "first_name": actor.first_name,
+        "last_name": actor.last_name,
+    }
+
+
+def render_issue_email(issue, receiver, base_api, data, users):
+    """Subject, html and text of the email of the updates of an issue"""
+    template_data = []
+    total_changes = 0
+    comments = []
+    actors_involved = []
+    for actor_id, changes in data.items():
+        actor = users.get(actor_id)
+        if actor is None:
+            continue
+        total_changes = total_changes + len(changes)
+        comment = changes.pop("comment", False)
+        mention = changes.pop("mention", False)
+        actors_involved.append(actor_id)
+        if comment:
+            comments.append(
+                {
+                    "actor_comments": comment,
+                    "actor_detail": get_actor_detail(actor),
+                }
+            )
+        if mention:
+            mention["new_value"] = process_html_content(
+                mention.get("new_value", []), users
+            )
+            mention["old_value"] = process_html_content(
+                mention.get("old_value", []), users
+            )
+            comments.append(
+                {
+                    "actor_comments": mention,
+                    "actor_detail": get_actor_detail(actor),
+                }
+            )
+        activity_time = changes.pop("activity_time")
+        # Parse the input string into a datetime object
+        formatted_time = datetime.strptime(
+            activity_time, "%Y-%m-%d %H:%M:%S"
+        ).strftime("%H:%M %p")
+
+        if changes:
+            template_data.append(
+                {
+                    "actor_detail": get_actor_detail(actor),
+                    "changes": changes,
+                    "issue_details": {
+                        "name": issue.name,
+                        "identifier": f"{issue.project.identifier}-{issue.sequence_id}",
+                    },
+                    "activity_time": str(formatted_time),
+                }
             )
 
-            # Skip if base api is not present
-            if not base_api:
-                return
-
-            data = create_payload(notification_data=notification_data)
-
-            # Get email configurations
-            (
-                EMAIL_HOST,
-                EMAIL_HOST_USER,
-                EMAIL_HOST_PASSWORD,
-                EMAIL_PORT,
-                EMAIL_USE_TLS,
-                EMAIL_USE_SSL,
-                EMAIL_FROM,
-            ) = get_email_configuration()
-
-            receiver = User.objects.get(pk=receiver_id)
-            issue = Issue.objects.get(pk=issue_id)
-            template_data = []
-            total_changes = 0
-            comments = []
-            actors_involved = []
-            for actor_id, changes in data.items():
-                actor = User.objects.get(pk=actor_id)
-                total_changes = total_changes + len(changes)
-                comment = changes.pop("comment", False)
-                mention = changes.pop("mention", False)
-                actors_involved.append(actor_id)
-                if comment:
-                    comments.append(
-                        {
-                            "actor_comments": comment,
-                            "actor_detail": {
-                                "avatar_url": actor.avatar,
-                                "first_name": actor.first_name,
-                                "last_name": actor.last_name,
-                            },
-                        }
-                    )
-                if mention:
-                    mention["new_value"] = process_html_content(
-                        mention.get("new_value")
-                    )
-                    mention["old_value"] = process_html_content(
-                        mention.get("old_value")
-                    )
-                    comments.append(
-                        {
-                            "actor_comments": mention,
-                            "actor_detail": {
-                                "avatar_url": actor.avatar,
-                                "first_name": actor.first_name,
-                                "last_name": actor.last_name,
-                            },
-                        }
+    summary = "Updates were made to the issue by"
+
+    subject = f"{issue.project.identifier}-{issue.sequence_id} {remove_unwanted_characters(issue.name)}"
+    context = {
+        "data": template_data,
+        "summary": summary,
+        "actors_involved": len(set(actors_involved)),
+        "issue": {
+            "issue_identifier": f"{str(issue.project.identifier)}-{str(issue.sequence_id)}",
+            "name": issue.name,
+            "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
+        },
+        "receiver": {
+            "email": receiver.email,
+        },
+        "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
+        "project_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/",
+        "workspace": str(issue.project.workspace.slug),
+        "project": str(issue.project.name),
+        "user_preference": f"{base_api}/profile/preferences/email",
+        "comments": comments,
+    }
+    html_content = render_to_string(
+        "emails/notifications/issue-updates.html", context
+    )
+    return subject, html_content, strip_tags(html_content)
+
+
+def send_issue_emails(receiver_id, issues):
+    """
+    Send the emails of the updated issues of a receiver over one connection,
+    with the actors and mentioned users of every issue loaded at once
+    """
+    ri = redis_instance()
+    # The origin of the requests is set by the activity of the issues
+    origins = ri.mget([str(issue["issue_id"]) for issue in issues])
+    payloads = {
+        str(issue["issue_id"]): create_payload(
+            notification_data=issue["notification_data"]
+        )
+        for issue, origin in zip(issues, origins)
+        if origin
+    }
+    base_apis = {
+        str(issue["issue_id"]): origin.decode()
+        for issue, origin in zip(issues, origins)
+        if origin
+    }
+    if not payloads:
+        return
+    email_notification_ids = {
+        str(issue["issue_id"]): issue["email_notification_ids"]
+        for issue in issues
+    }
+
+    receiver = User.objects.get(pk=receiver_id)
+    user_ids = set()
+    for data in payloads.values():
+        user_ids.update(data)
+        user_ids.update(get_mentioned_user_ids(data))
+    users = {
+        str(user.id): user
+        for user in User.objects.filter(
+            pk__in=[user_id for user_id in user_ids if is_valid_uuid(user_id)]
+        ).only("id", "display_name", "avatar", "first_name", "last_name")
+    }
+    issues_by_id = {
+        str(issue.id): issue
+        for issue in Issue.objects.filter(
+            pk__in=[issue_id for issue_id in payloads if is_valid_uuid(issue_id)]
+        ).select_related("project", "project__workspace")
+    }
+
+    # Get email configurations
+    (
+        EMAIL_HOST,
+        EMAIL_HOST_USER,
+        EMAIL_HOST_PASSWORD,
+        EMAIL_PORT,
+        EMAIL_USE_TLS,
+        EMAIL_USE_SSL,
+        EMAIL_FROM,
+    ) = get_email_configuration()
+
+    sent_ids = []
+    try:
+        with get_connection(
+            host=EMAIL_HOST,
+            port=int(EMAIL_PORT),
+            username=EMAIL_HOST_USER,
+            password=EMAIL_HOST_PASSWORD,
+            use_tls=EMAIL_USE_TLS == "1",
+            use_ssl=EMAIL_USE_SSL == "1",
+        ) as connection:
+            for issue_id, data in payloads.items():
+                issue = issues_by_id.get(issue_id)
+                if issue is None:
+                    continue
+                # An issue failing to render or send does not hold back
+                # the emails of the other issues
+                try:
+                    subject, html_content, text_content = render_issue_email(
+                        issue=issue,
+                        receiver=receiver,
+                        base_api=base_apis[issue_id],
+                        data=data,
+                        users=users,
                     )
-                activity_time = changes.pop("activity_time")
-                # Parse the input string into a datetime object
-                formatted_time = datetime.strptime(
-                    activity_time, "%Y-%m-%d %H:%M:%S"
-                ).strftime("%H:%M %p")
-
-                if changes:
-                    template_data.append(
-                        {
-                            "actor_detail": {
-                                "avatar_url": actor.avatar,
-                                "first_name": actor.first_name,
-                                "last_name": actor.last_name,
-                            },
-                            "changes": changes,
-                            "issue_details": {
-                                "name": issue.name,
-                                "identifier": f"{issue.project.identifier}-{issue.sequence_id}",
-                            },
-                            "activity_time": str(formatted_time),
-                        }
+                    msg = EmailMultiAlternatives(
+                        subject=subject,
+                        body=text_content,
+                        from_email=EMAIL_FROM,
+                        to=[receiver.email],
+                        connection=connection,
                     )
+                    msg.attach_alternative(html_content, "text/html")
+                    msg.send()
+                except Exception as e:
+                    log_exception(e)
+                    continue
+                sent_ids.extend(email_notification_ids[issue_id])
+    finally:
+        # The emails that went out are not sent again by the next digest
+        if sent_ids:
+            logging.getLogger("plane").info("Email Sent Successfully")
+            # Update the logs
+            EmailNotificationLog.objects.filter(pk__in=sent_ids).update(
+                sent_at=timezone.now()
+            )
 
-            summary = "Updates were made to the issue by"
-
-            # Send the mail
-            subject = f"{issue.project.identifier}-{issue.sequence_id} {remove_unwanted_characters(issue.name)}"
-            context = {
-                "data": template_data,
-                "summary": summary,
-                "actors_involved": len(set(actors_involved)),
-                "issue": {
-                    "issue_identifier": f"{str(issue.project.identifier)}-{str(issue.sequence_id)}",
-                    "name": issue.name,
-                    "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
-                },
-                "receiver": {
-                    "email": receiver.email,
-                },
-                "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
-                "project_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/",
-                "workspace": str(issue.project.workspace.slug),
-                "project": str(issue.project.name),
-                "user_preference": f"{base_api}/profile/preferences/email",
-                "comments": comments,
-            }
-            html_content = render_to_string(
-                "emails/notifications/issue-updates.html", context
+
+@shared_task
+def send_email_digest(receiver_id, issues):
+    """
+    Emails of the updated issues of a receiver, issues holding the issue_id,
+    notification_data and email_notification_ids of every issue
+    """
+    ids_digest = hashlib.sha1(
+        "_".join(
+            sorted(
+                str(id)
+                for issue in issues
+                for id in issue["email_notification_ids"]
             )
-            text_content = strip_tags(html_content)
-
-            try:
-                connection = get_connection(
-                    host=EMAIL_HOST,
-                    port=int(EMAIL_PORT),
-                    username=EMAIL_HOST_USER,
-                    password=EMAIL_HOST_PASSWORD,
-                    use_tls=EMAIL_USE_TLS == "1",
-                    use_ssl=EMAIL_USE_SSL == "1",
-                )
-
-                msg = EmailMultiAlternatives(
-                    subject=subject,
-                    body=text_content,
-                    from_email=EMAIL_FROM,
-                    to=[receiver.email],
-                    connection=connection,
-                )
-                msg.attach_alternative(html_content, "text/html")
-                msg.send()
-                logging.getLogger("plane").info("Email Sent Successfully")
-
-                # Update the logs
-                EmailNotificationLog.objects.filter(
-                    pk__in=email_notification_ids
-                ).update(sent_at=timezone.now())
-
-                # release the lock
-                release_lock(lock_id=lock_id)
-                return
-            except Exception as e:
-                log_exception(e)
-                # release the lock
-                release_lock(lock_id=lock_id)
-                return
-        else:
+        ).encode()
+    ).hexdigest()
+    lock_id = f"send_email_digest_{receiver_id}_{ids_digest}"
+
+    # acquire the lock for sending emails
+    try:
+        if not acquire_lock(lock_id=lock_id):
             logging.getLogger("plane").info(
                 "Duplicate email received skipping"
             )
             return
-    except (Issue.DoesNotExist, User.DoesNotExist):
-        release_lock(lock_id=lock_id)
-        return
+        send_issue_emails(receiver_id, issues)
+    except User.DoesNotExist:
+        pass
     except Exception as e:
         log_exception(e)
-        release_lock(lock_id=lock_id)
-        return
+    release_lock(lock_id=lock_id)
+
+
+@shared_task
+def send_email_notification(
+    issue_id, notification_data, receiver_id, email_notification_ids
+):
+    """Email of a single issue, kept for the tasks queued before digests"""
+    send_email_digest(
+        receiver_id=receiver_id,
+        issues=[
+            {
+                "issue_id": issue_id,
+                "notification_data": notification_data,
+                "email_notification_ids": email_notification_ids,
+            }
+        ],
+    )
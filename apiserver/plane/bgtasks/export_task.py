@@ -2,9 +2,11 @@
 import csv
 import io
 import json
+import tempfile
 import zipfile
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.client import Config
 
 # Third party imports
@@ -12,13 +14,36 @@ from celery import shared_task
 
 # Django imports
 from django.conf import settings
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Concat
 from django.utils import timezone
 from openpyxl import Workbook
 
 # Module imports
-from plane.db.models import ExporterHistory, Issue
+from plane.db.models import (
+    CycleIssue,
+    ExporterHistory,
+    Issue,
+    IssueAssignee,
+    IssueLabel,
+    ModuleIssue,
+    ProjectMember,
+)
 from plane.utils.exception_logger import log_exception
 
+# Issues fetched per round trip of the server side cursor
+EXPORT_CHUNK_SIZE = 2000
+
+# The export is kept in memory up to this size and spilled to disk beyond
+EXPORT_SPOOL_SIZE = 16 * 1024 * 1024
+
+# Exports larger than a part are uploaded in parts
+EXPORT_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+)
+
 
 def dateTimeConverter(time):
     if time:
@@ -30,44 +55,6 @@ def dateConverter(time):
         return time.strftime("%a, %d %b %Y")
 
 
-def create_csv_file(data):
-    csv_buffer = io.StringIO()
-    csv_writer = csv.writer(csv_buffer, delimiter=",", quoting=csv.QUOTE_ALL)
-
-    for row in data:
-        csv_writer.writerow(row)
-
-    csv_buffer.seek(0)
-    return csv_buffer.getvalue()
-
-
-def create_json_file(data):
-    return json.dumps(data)
-
-
-def create_xlsx_file(data):
-    workbook = Workbook()
-    sheet = workbook.active
-
-    for row in data:
-        sheet.append(row)
-
-    xlsx_buffer = io.BytesIO()
-    workbook.save(xlsx_buffer)
-    xlsx_buffer.seek(0)
-    return xlsx_buffer.getvalue()
-
-
-def create_zip_file(files):
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for filename, file_content in files:
-            zipf.writestr(filename, file_content)
-
-    zip_buffer.seek(0)
-    return zip_buffer
-
-
 def upload_to_s3(zip_file, workspace_id, token_id, slug):
     file_name = f"{workspace_id}/export-{slug}-{token_id[:6]}-{str(timezone.now().date())}.zip"
     expires_in = 7 * 24 * 60 * 60
@@ -85,6 +72,7 @@ def upload_to_s3(zip_file, workspace_id, token_id, slug):
             settings.AWS_STORAGE_BUCKET_NAME,
             file_name,
             ExtraArgs={"ACL": "public-read", "ContentType": "application/zip"},
+            Config=EXPORT_TRANSFER_CONFIG,
         )
 
         # Generate presigned url for the uploaded file with different base
@@ -130,6 +118,7 @@ def upload_to_s3(zip_file, workspace_id, token_id, slug):
             settings.AWS_STORAGE_BUCKET_NAME,
             file_name,
             ExtraArgs={"ACL": "public-read", "ContentType": "application/zip"},
+            Config=EXPORT_TRANSFER_CONFIG,
         )
 
         # Generate presigned url for the uploaded file
@@ -169,18 +158,14 @@ def generate_table_row(issue):
             and issue["created_by__last_name"]
             else ""
         ),
-        (
-            f"{issue['assignees__first_name']} {issue['assignees__last_name']}"
-            if issue["assignees__first_name"] and issue["assignees__last_name"]
-            else ""
-        ),
-        issue["labels__name"],
-        issue["issue_cycle__cycle__name"],
-        dateConverter(issue["issue_cycle__cycle__start_date"]),
-        dateConverter(issue["issue_cycle__cycle__end_date"]),
-        issue["issue_module__module__name"],
-        dateConverter(issue["issue_module__module__start_date"]),
-        dateConverter(issue["issue_module__module__target_date"]),
+        ", ".join(issue["assignee_names"] or []),
+        ", ".join(issue["label_names"] or []) or None,
+        issue["cycle_name"],
+        dateConverter(issue["cycle_start_date"]),
+        dateConverter(issue["cycle_end_date"]),
+        issue["module_name"],
+        dateConverter(issue["module_start_date"]),
+        dateConverter(issue["module_target_date"]),
         dateTimeConverter(issue["created_at"]),
         dateTimeConverter(issue["updated_at"]),
         dateTimeConverter(issue["completed_at"]),
@@ -202,24 +187,14 @@ def generate_json_row(issue):
             and issue["created_by__last_name"]
             else ""
         ),
-        "Assignee": (
-            f"{issue['assignees__first_name']} {issue['assignees__last_name']}"
-            if issue["assignees__first_name"] and issue["assignees__last_name"]
-            else ""
-        ),
-        "Labels": issue["labels__name"],
-        "Cycle Name": issue["issue_cycle__cycle__name"],
-        "Cycle Start Date": dateConverter(
-            issue["issue_cycle__cycle__start_date"]
-        ),
-        "Cycle End Date": dateConverter(issue["issue_cycle__cycle__end_date"]),
-        "Module Name": issue["issue_module__module__name"],
-        "Module Start Date": dateConverter(
-            issue["issue_module__module__start_date"]
-        ),
-        "Module Target Date": dateConverter(
-            issue["issue_module__module__target_date"]
-        ),
+        "Assignee": ", ".join(issue["assignee_names"] or []),
+        "Labels": ", ".join(issue["label_names"] or []) or None,
+        "Cycle Name": issue["cycle_name"],
+        "Cycle Start Date": dateConverter(issue["cycle_start_date"]),
+        "Cycle End Date": dateConverter(issue["cycle_end_date"]),
+        "Module Name": issue["module_name"],
+        "Module Start Date": dateConverter(issue["module_start_date"]),
+        "Module Target Date": dateConverter(issue["module_target_date"]),
         "Created At": dateTimeConverter(issue["created_at"]),
         "Updated At": dateTimeConverter(issue["updated_at"]),
         "Completed At": dateTimeConverter(issue["completed_at"]),
@@ -227,84 +202,144 @@ def generate_json_row(issue):
     }
 
 
-def update_json_row(rows, row):
-    matched_index = next(
-        (
-            index
-            for index, existing_row in enumerate(rows)
-            if existing_row["ID"] == row["ID"]
-        ),
-        None,
+def generate_csv(header, project_id, issues, zip_file):
+    """
+    Stream the CSV export of the passed issues into the zip file.
+    """
+    with io.TextIOWrapper(
+        zip_file.open(f"{project_id}.csv", "w"), encoding="utf-8", newline=""
+    ) as csv_file:
+        csv_writer = csv.writer(csv_file, delimiter=",", quoting=csv.QUOTE_ALL)
+        csv_writer.writerow(header)
+        for issue in issues.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            csv_writer.writerow(generate_table_row(issue))
+
+
+def generate_json(header, project_id, issues, zip_file):
+    # Written element by element, the output is still one JSON array
+    with io.TextIOWrapper(
+        zip_file.open(f"{project_id}.json", "w"), encoding="utf-8"
+    ) as json_file:
+        json_file.write("[")
+        for index, issue in enumerate(
+            issues.iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        ):
+            if index:
+                json_file.write(", ")
+            json_file.write(json.dumps(generate_json_row(issue)))
+        json_file.write("]")
+
+
+def generate_xlsx(header, project_id, issues, zip_file):
+    # Write only workbooks keep the rows in a temporary file
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(header)
+    for issue in issues.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        sheet.append(generate_table_row(issue))
+
+    with zip_file.open(f"{project_id}.xlsx", "w") as xlsx_file:
+        workbook.save(xlsx_file)
+
+
+def get_export_queryset(workspace_id, project_ids, member_id):
+    """
+    One row per issue, the assignees and labels are aggregated and the first
+    cycle and module of the issue are read through subqueries
+    """
+    cycle_issues = CycleIssue.objects.filter(issue_id=OuterRef("pk")).order_by(
+        "created_at"
     )
-
-    if matched_index is not None:
-        existing_assignees, existing_labels = (
-            rows[matched_index]["Assignee"],
-            rows[matched_index]["Labels"],
+    module_issues = ModuleIssue.objects.filter(
+        issue_id=OuterRef("pk")
+    ).order_by("created_at")
+
+    # Projects of the member, a join on the memberships would repeat the
+    # issues for every soft deleted membership row
+    member_project_ids = ProjectMember.objects.filter(
+        workspace_id=workspace_id, member_id=member_id, is_active=True
+    ).values("project_id")
+
+    return (
+        Issue.objects.filter(
+            workspace__id=workspace_id,
+            project_id__in=project_ids,
+            project__archived_at__isnull=True,
         )
-        assignee, label = row["Assignee"], row["Labels"]
-
-        if assignee is not None and assignee not in existing_assignees:
-            rows[matched_index]["Assignee"] += f", {assignee}"
-        if label is not None and label not in existing_labels:
-            rows[matched_index]["Labels"] += f", {label}"
-    else:
-        rows.append(row)
-
-
-def update_table_row(rows, row):
-    matched_index = next(
-        (
-            index
-            for index, existing_row in enumerate(rows)
-            if existing_row[0] == row[0]
-        ),
-        None,
+        .filter(project_id__in=member_project_ids)
+        .annotate(
+            assignee_names=Subquery(
+                IssueAssignee.objects.filter(
+                    issue_id=OuterRef("pk"),
+                    assignee__first_name__gt="",
+                    assignee__last_name__gt="",
+                )
+                .values("issue_id")
+                .annotate(
+                    names=ArrayAgg(
+                        Concat(
+                            "assignee__first_name",
+                            Value(" "),
+                            "assignee__last_name",
+                        ),
+                        distinct=True,
+                    )
+                )
+                .values("names")
+            ),
+            label_names=Subquery(
+                IssueLabel.objects.filter(issue_id=OuterRef("pk"))
+                .values("issue_id")
+                .annotate(
+                    names=ArrayAgg(
+                        "label__name", distinct=True, ordering="label__name"
+                    )
+                )
+                .values("names")
+            ),
+            cycle_name=Subquery(cycle_issues.values("cycle__name")[:1]),
+            cycle_start_date=Subquery(
+                cycle_issues.values("cycle__start_date")[:1]
+            ),
+            cycle_end_date=Subquery(
+                cycle_issues.values("cycle__end_date")[:1]
+            ),
+            module_name=Subquery(module_issues.values("module__name")[:1]),
+            module_start_date=Subquery(
+                module_issues.values("module__start_date")[:1]
+            ),
+            module_target_date=Subquery(
+                module_issues.values("module__target_date")[:1]
+            ),
+        )
+        .values(
+            "id",
+            "project__identifier",
+            "project__name",
+            "project__id",
+            "sequence_id",
+            "name",
+            "description_stripped",
+            "priority",
+            "state__name",
+            "created_at",
+            "updated_at",
+            "completed_at",
+            "archived_at",
+            "cycle_name",
+            "cycle_start_date",
+            "cycle_end_date",
+            "module_name",
+            "module_start_date",
+            "module_target_date",
+            "created_by__first_name",
+            "created_by__last_name",
+            "assignee_names",
+            "label_names",
+        )
+        .order_by("project__identifier", "sequence_id")
     )
 
-    if matched_index is not None:
-        existing_assignees, existing_labels = rows[matched_index][7:9]
-        assignee, label = row[7:9]
-
-        if assignee is not None and assignee not in existing_assignees:
-            rows[matched_index][7] += f", {assignee}"
-        if label is not None and label not in existing_labels:
-            rows[matched_index][8] += f", {label}"
-    else:
-        rows.append(row)
-
-
-def generate_csv(header, project_id, issues, files):
-    """
-    Generate CSV export for all the passed issues.
-    """
-    rows = [
-        header,
-    ]
-    for issue in issues:
-        row = generate_table_row(issue)
-        update_table_row(rows, row)
-    csv_file = create_csv_file(rows)
-    files.append((f"{project_id}.csv", csv_file))
-
-
-def generate_json(header, project_id, issues, files):
-    rows = []
-    for issue in issues:
-        row = generate_json_row(issue)
-        update_json_row(rows, row)
-    json_file = create_json_file(rows)
-    files.append((f"{project_id}.json", json_file))
-
-
-def generate_xlsx(header, project_id, issues, files):
-    rows = [header]
-    for issue in issues:
-        row = generate_table_row(issue)
-        update_table_row(rows, row)
-    xlsx_file = create_xlsx_file(rows)
-    files.append((f"{project_id}.xlsx", xlsx_file))
-
 
 @shared_task
 def issue_export_task(
@@ -315,53 +350,10 @@ def issue_export_task(
         exporter_instance.status = "processing"
         exporter_instance.save(update_fields=["status"])
 
-        workspace_issues = (
-            (
-                Issue.objects.filter(
-                    workspace__id=workspace_id,
-                    project_id__in=project_ids,
-                    project__project_projectmember__member=exporter_instance.initiated_by_id,
-                    project__project_projectmember__is_active=True,
-                    project__archived_at__isnull=True,
-                )
-                .select_related(
-                    "project", "workspace", "state", "parent", "created_by"
-                )
-                .prefetch_related(
-                    "assignees",
-                    "labels",
-                    "issue_cycle__cycle",
-                    "issue_module__module",
-                )
-                .values(
-                    "id",
-                    "project__identifier",
-                    "project__name",
-                    "project__id",
-                    "sequence_id",
-                    "name",
-                    "description_stripped",
-                    "priority",
-                    "state__name",
-                    "created_at",
-                    "updated_at",
-                    "completed_at",
-                    "archived_at",
-                    "issue_cycle__cycle__name",
-                    "issue_cycle__cycle__start_date",
-                    "issue_cycle__cycle__end_date",
-                    "issue_module__module__name",
-                    "issue_module__module__start_date",
-                    "issue_module__module__target_date",
-                    "created_by__first_name",
-                    "created_by__last_name",
-                    "assignees__first_name",
-                    "assignees__last_name",
-                    "labels__name",
-                )
-            )
-            .order_by("project__identifier", "sequence_id")
-            .distinct()
+        workspace_issues = get_export_queryset(
+            workspace_id=workspace_id,
+            project_ids=project_ids,
+            member_id=exporter_instance.initiated_by_id,
         )
         # CSV header
         header = [
@@ -392,31 +384,31 @@ def issue_export_task(
             "xlsx": generate_xlsx,
         }
 
-        files = []
-        if multiple:
-            for project_id in project_ids:
-                issues = workspace_issues.filter(project__id=project_id)
-                exporter = EXPORTER_MAPPER.get(provider)
-                if exporter is not None:
+        exporter = EXPORTER_MAPPER.get(provider)
+        with tempfile.SpooledTemporaryFile(
+            max_size=EXPORT_SPOOL_SIZE
+        ) as export_file:
+            with zipfile.ZipFile(
+                export_file, "w", zipfile.ZIP_DEFLATED
+            ) as zip_file:
+                if exporter is not None and multiple:
+                    for project_id in project_ids:
+                        exporter(
+                            header,
+                            project_id,
+                            workspace_issues.filter(project__id=project_id),
+                            zip_file,
+                        )
+                elif exporter is not None:
                     exporter(
                         header,
-                        project_id,
-                        issues,
-                        files,
+                        workspace_id,
+                        workspace_issues,
+                        zip_file,
                     )
 
-        else:
-            exporter = EXPORTER_MAPPER.get(provider)
-            if exporter is not None:
-                exporter(
-                    header,
-                    workspace_id,
-                    workspace_issues,
-                    files,
-                )
-
-        zip_buffer = create_zip_file(files)
-        upload_to_s3(zip_buffer, workspace_id, token_id, slug)
+            export_file.seek(0)
+            upload_to_s3(export_file, workspace_id, token_id, slug)
 
     except Exception as e:
         exporter_instance = ExporterHistory.objects.get(token=token_id)
@@ -30,9 +30,12 @@ from plane.db.models import (
     User,
     EstimatePoint,
 )
+from plane.realtime.events import publish_issue_events
 from plane.settings.redis import redis_instance
+from plane.utils.dashboard_stats import invalidate_dashboard_stats
 from plane.utils.exception_logger import log_exception
-from plane.bgtasks.webhook_task import webhook_activity
+from plane.utils.issue_rollup import refresh_issue_rollups
+from plane.bgtasks.webhook_task import webhook_activities
 
 
 # Track Changes in name
@@ -1614,6 +1617,72 @@ def create_inbox_activity(
         )
 
 
+# Activity entities that can change the cycle and module rollups
+ROLLUP_ACTIVITY_ENTITIES = ["issue", "cycle", "module", "issue_draft", "inbox"]
+
+
+def refresh_activity_rollups(issue_id, issue_activities_created):
+    # Cycles and modules the issues were added to or removed from
+    identifiers = {"cycles": set(), "modules": set()}
+    for activity in issue_activities_created:
+        if activity.field in identifiers:
+            identifiers[activity.field].update(
+                [activity.old_identifier, activity.new_identifier]
+            )
+    refresh_issue_rollups(
+        issue_ids=[issue_id]
+        + [activity.issue_id for activity in issue_activities_created],
+        cycle_ids=identifiers["cycles"],
+        module_ids=identifiers["modules"],
+    )
+
+
+def dispatch_webhook_activities(issue_activities_created, origin, inbox=None):
+    if len(issue_activities_created):
+        webhook_activities.delay(
+            slug=issue_activities_created[0].workspace.slug,
+            current_site=origin,
+            activities=[
+                {
+                    "event": (
+                        "issue_comment"
+                        if activity.field == "comment"
+                        else "inbox_issue"
+                        if inbox
+                        else "issue"
+                    ),
+                    "event_id": (
+                        activity.issue_comment_id
+                        if activity.field == "comment"
+                        else inbox
+                        if inbox
+                        else activity.issue_id
+                    ),
+                    "verb": activity.verb,
+                    "field": (
+                        "description"
+                        if activity.field == "comment"
+                        else activity.field
+                    ),
+                    "old_value": (
+                        activity.old_value
+                        if activity.old_value != ""
+                        else None
+                    ),
+                    "new_value": (
+                        activity.new_value
+                        if activity.new_value != ""
+                        else None
+                    ),
+                    "actor_id": activity.actor_id,
+                    "old_identifier": activity.old_identifier,
+                    "new_identifier": activity.new_identifier,
+                }
+                for activity in issue_activities_created
+            ],
+        )
+
+
 # Receive message from room group
 @shared_task
 def issue_activity(
@@ -1695,46 +1764,11 @@ def issue_activity(
         issue_activities_created = IssueActivity.objects.bulk_create(
             issue_activities
         )
+
         # Post the updates to segway for integrations and webhooks
-        if len(issue_activities_created):
-            for activity in issue_activities_created:
-                webhook_activity.delay(
-                    event=(
-                        "issue_comment"
-                        if activity.field == "comment"
-                        else "inbox_issue"
-                        if inbox
-                        else "issue"
-                    ),
-                    event_id=(
-                        activity.issue_comment_id
-                        if activity.field == "comment"
-                        else inbox
-                        if inbox
-                        else activity.issue_id
-                    ),
-                    verb=activity.verb,
-                    field=(
-                        "description"
-                        if activity.field == "comment"
-                        else activity.field
-                    ),
-                    old_value=(
-                        activity.old_value
-                        if activity.old_value != ""
-                        else None
-                    ),
-                    new_value=(
-                        activity.new_value
-                        if activity.new_value != ""
-                        else None
-                    ),
-                    actor_id=activity.actor_id,
-                    current_site=origin,
-                    slug=activity.workspace.slug,
-                    old_identifier=activity.old_identifier,
-                    new_identifier=activity.new_identifier,
-                )
+        dispatch_webhook_activities(issue_activities_created, origin, inbox)
+        # Push the changes to the clients watching the project
+        publish_issue_events(project_id, [issue_id], issue_activities_created)
 
         if notification:
             notifications.delay(
@@ -1753,6 +1787,109 @@ def issue_activity(
                 current_instance=current_instance,
             )
 
+        # Bulk issue updates do not go through the save signals, the
+        # dashboard and the cycle and module rollups are refreshed after the
+        # fan out so that a failed refresh does not drop it
+        if type.split(".")[0] in ROLLUP_ACTIVITY_ENTITIES:
+            invalidate_dashboard_stats([project_id])
+            refresh_activity_rollups(
+                issue_id=issue_id,
+                issue_activities_created=issue_activities_created,
+            )
+
+        return
+    except Exception as e:
+        log_exception(e)
+        return
+
+
+@shared_task
+def bulk_issue_activity(activities, actor_id, project_id, epoch, origin=None):
+    """
+    Activities of the issues created or updated by one bulk request, every
+    item holding the type, issue_id, requested_data and current_instance
+    of an issue. They are saved, rolled up and posted to the webhooks once
+    for the whole batch.
+    """
+    try:
+        issue_activities = []
+        project = Project.objects.get(pk=project_id)
+        workspace_id = project.workspace_id
+
+        created_issues = {
+            str(issue_id): (created_at, created_by_id)
+            for issue_id, created_at, created_by_id in Issue.objects.filter(
+                pk__in=[
+                    activity["issue_id"]
+                    for activity in activities
+                    if activity["type"] == "issue.activity.created"
+                ]
+            ).values_list("id", "created_at", "created_by_id")
+        }
+
+        creations = []
+        for activity in activities:
+            issue_id = activity["issue_id"]
+            requested_data = json.loads(activity["requested_data"])
+            if activity["type"] == "issue.activity.created":
+                if issue_id not in created_issues:
+                    continue
+                created_at, created_by_id = created_issues[issue_id]
+                creation = IssueActivity(
+                    issue_id=issue_id,
+                    project_id=project_id,
+                    workspace_id=workspace_id,
+                    comment="created the issue",
+                    verb="created",
+                    actor_id=created_by_id or actor_id,
+                    epoch=epoch,
+                )
+                creations.append((creation, created_at))
+                issue_activities.append(creation)
+                if requested_data.get("assignee_ids"):
+                    track_assignees(
+                        requested_data=requested_data,
+                        current_instance=None,
+                        issue_id=issue_id,
+                        project_id=project_id,
+                        workspace_id=workspace_id,
+                        actor_id=actor_id,
+                        issue_activities=issue_activities,
+                        epoch=epoch,
+                    )
+            else:
+                update_issue_activity(
+                    requested_data=activity["requested_data"],
+                    current_instance=activity["current_instance"],
+                    issue_id=issue_id,
+                    project_id=project_id,
+                    workspace_id=workspace_id,
+                    actor_id=actor_id,
+                    issue_activities=issue_activities,
+                    epoch=epoch,
+                )
+
+        issue_activities_created = IssueActivity.objects.bulk_create(
+            issue_activities, batch_size=500
+        )
+        # The creation activities are dated with their issue
+        for creation, created_at in creations:
+            creation.created_at = created_at
+        IssueActivity.objects.bulk_update(
+            [creation for creation, _ in creations],
+            ["created_at"],
+            batch_size=500,
+        )
+
+        dispatch_webhook_activities(issue_activities_created, origin)
+        publish_issue_events(
+            project_id,
+            [activity["issue_id"] for activity in activities],
+            issue_activities_created,
+        )
+        refresh_activity_rollups(
+            issue_id=None, issue_activities_created=issue_activities_created
+        )
         return
     except Exception as e:
         log_exception(e)
@@ -0,0 +1,33 @@
+# Third party imports
+from celery import shared_task
+
+# Module imports
+from plane.db.models import Issue
+from plane.utils.exception_logger import log_exception
+from plane.utils.issue_rollup import refresh_linked_rollups
+
+
+@shared_task
+def refresh_state_rollups(state_ids):
+    """Rollups of the cycles and modules holding issues of the states"""
+    try:
+        refresh_linked_rollups(
+            Issue.issue_objects.filter(state_id__in=state_ids)
+        )
+    except Exception as e:
+        log_exception(e)
+        return
+
+
+@shared_task
+def refresh_estimate_rollups(estimate_ids):
+    """Rollups of the cycles and modules holding issues with the estimates"""
+    try:
+        refresh_linked_rollups(
+            Issue.issue_objects.filter(
+                estimate_point__estimate_id__in=estimate_ids
+            )
+        )
+    except Exception as e:
+        log_exception(e)
+        return
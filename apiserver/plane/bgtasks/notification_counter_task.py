@@ -0,0 +1,78 @@
+# Django imports
+from django.conf import settings
+
+# Third party imports
+from celery import shared_task
+
+# Module imports
+from plane.settings.redis import redis_instance
+from plane.utils.exception_logger import log_exception
+from plane.utils.metrics import increment_metric
+from plane.utils.notification_counters import (
+    COUNTER_FIELDS,
+    NOTIFICATION_COUNTERS_INDEX,
+    counter_aggregates,
+    unread_notifications,
+)
+
+
+def reconcile_counters(client, keys):
+    pipeline = client.pipeline()
+    for key in keys:
+        pipeline.hgetall(key)
+    stored = dict(zip(keys, pipeline.execute()))
+
+    # Counters that expired are dropped from the index
+    loaded = {
+        key: tuple(key.split(":")[-2:])
+        for key, counters in stored.items()
+        if counters
+    }
+    expired = [key for key, counters in stored.items() if not counters]
+
+    counts = {
+        (row["workspace__slug"], str(row["receiver_id"])): row
+        for row in unread_notifications(
+            workspace__slug__in={slug for slug, _ in loaded.values()},
+            receiver_id__in={user_id for _, user_id in loaded.values()},
+        )
+        .order_by()
+        .values("workspace__slug", "receiver_id")
+        .annotate(**counter_aggregates())
+    }
+
+    corrected = 0
+    pipeline = client.pipeline()
+    for key, user in loaded.items():
+        row = counts.get(user, {})
+        counters = {field: row.get(field, 0) for field in COUNTER_FIELDS}
+        if any(
+            int(stored[key].get(field.encode(), -1)) != counters[field]
+            for field in COUNTER_FIELDS
+        ):
+            corrected += 1
+            pipeline.hset(key, mapping=counters)
+            pipeline.expire(key, settings.NOTIFICATION_COUNTERS_TTL)
+    if expired:
+        pipeline.srem(NOTIFICATION_COUNTERS_INDEX, *expired)
+    pipeline.execute()
+    return corrected
+
+
+@shared_task
+def reconcile_notification_counters(batch_size=500):
+    try:
+        client = redis_instance()
+        keys = sorted(
+            key.decode()
+            for key in client.smembers(NOTIFICATION_COUNTERS_INDEX)
+        )
+        corrected = 0
+        for index in range(0, len(keys), batch_size):
+            corrected += reconcile_counters(
+                client, keys[index : index + batch_size]
+            )
+        increment_metric("notification_counters.corrected", corrected)
+    except Exception as e:
+        log_exception(e)
+        return
@@ -17,6 +17,8 @@ from plane.db.models import (
     IssueActivity,
     UserNotificationPreference,
 )
+from plane.realtime.events import publish_notification_events
+from plane.utils.notification_counters import update_notification_counters
 
 # Third Party imports
 from celery import shared_task
@@ -82,37 +84,47 @@ def get_removed_mentions(requested_instance, current_instance):
 # Adds mentions as subscribers
 def extract_mentions_as_subscribers(project_id, issue_id, mentions):
     # mentions is an array of User IDs representing the FILTERED set of mentioned users
+    mentions = list(dict.fromkeys(mentions))
+    if not mentions:
+        return []
 
-    bulk_mention_subscribers = []
+    # Mentions who already subscribed, are assigned or created the issue are skipped
+    skipped = {
+        str(user_id)
+        for user_id in IssueSubscriber.objects.filter(
+            issue_id=issue_id,
+            subscriber_id__in=mentions,
+            project_id=project_id,
+        ).values_list("subscriber_id", flat=True)
+    }
+    skipped.update(
+        str(user_id)
+        for user_id in IssueAssignee.objects.filter(
+            project_id=project_id,
+            issue_id=issue_id,
+            assignee_id__in=mentions,
+        ).values_list("assignee_id", flat=True)
+    )
+    skipped.update(
+        str(user_id)
+        for user_id in Issue.objects.filter(
+            project_id=project_id, pk=issue_id
+        ).values_list("created_by_id", flat=True)
+    )
 
-    for mention_id in mentions:
-        # If the particular mention has not already been subscribed to the issue, he must be sent the mentioned notification
-        if (
-            not IssueSubscriber.objects.filter(
-                issue_id=issue_id,
-                subscriber_id=mention_id,
-                project_id=project_id,
-            ).exists()
-            and not IssueAssignee.objects.filter(
-                project_id=project_id,
-                issue_id=issue_id,
-                assignee_id=mention_id,
-            ).exists()
-            and not Issue.objects.filter(
-                project_id=project_id, pk=issue_id, created_by_id=mention_id
-            ).exists()
-        ):
-            project = Project.objects.get(pk=project_id)
-
-            bulk_mention_subscribers.append(
-                IssueSubscriber(
-                    workspace_id=project.workspace_id,
-                    project_id=project_id,
-                    issue_id=issue_id,
-                    subscriber_id=mention_id,
-                )
-            )
-    return bulk_mention_subscribers
+    workspace_id = Project.objects.values_list(
+        "workspace_id", flat=True
+    ).get(pk=project_id)
+    return [
+        IssueSubscriber(
+            workspace_id=workspace_id,
+            project_id=project_id,
+            issue_id=issue_id,
+            subscriber_id=mention_id,
+        )
+        for mention_id in mentions
+        if str(mention_id) not in skipped
+    ]
 
 
 # Parse Issue Description & extracts mentions
@@ -164,6 +176,70 @@ def get_new_comment_mentions(new_value, old_value):
     return new_mentions
 
 
+# =========== Batched lookups of the notification fan-out ======================
+def get_notification_preferences(user_ids):
+    return {
+        str(preference.user_id): preference
+        for preference in UserNotificationPreference.objects.filter(
+            user_id__in=set(user_ids)
+        )
+    }
+
+
+def get_completed_state_ids(project_id, issue_activities):
+    state_ids = {
+        issue_activity.get("new_identifier")
+        for issue_activity in issue_activities
+        if issue_activity.get("field") == "state"
+        and issue_activity.get("new_identifier")
+    }
+    if not state_ids:
+        return set()
+    return {
+        str(state_id)
+        for state_id in State.objects.filter(
+            project_id=project_id, pk__in=state_ids, group="completed"
+        ).values_list("id", flat=True)
+    }
+
+
+def get_activity_comments(project, issue_id, issue_activities):
+    comment_ids = {
+        issue_activity.get("issue_comment")
+        for issue_activity in issue_activities
+        if issue_activity.get("issue_comment")
+    }
+    if not comment_ids:
+        return {}
+    return {
+        str(comment_id): comment_stripped
+        for comment_id, comment_stripped in IssueComment.objects.filter(
+            id__in=comment_ids,
+            issue_id=issue_id,
+            project_id=project.id,
+            workspace_id=project.workspace_id,
+        ).values_list("id", "comment_stripped")
+    }
+
+
+def should_send_email(preference, issue_activity, completed_state_ids):
+    # Users without preferences only get in app notifications
+    if preference is None:
+        return False
+    field = issue_activity.get("field")
+    if field == "state" and preference.state_change:
+        return True
+    if (
+        field == "state"
+        and preference.issue_completed
+        and str(issue_activity.get("new_identifier")) in completed_state_ids
+    ):
+        return True
+    if field == "comment" and preference.comment:
+        return True
+    return preference.property_change
+
+
 def create_mention_notification(
     project,
     notification_comment,
@@ -311,7 +387,11 @@ def notifications(
                 .values_list("subscriber", flat=True)
             )
 
-            issue = Issue.objects.filter(pk=issue_id).first()
+            issue = (
+                Issue.objects.filter(pk=issue_id)
+                .select_related("state", "project", "project__workspace")
+                .first()
+            )
 
             if subscriber:
                 # add the user to issue subscriber
@@ -324,16 +404,87 @@ def notifications(
                 except Exception:
                     pass
 
-            project = Project.objects.get(pk=project_id)
+            project = Project.objects.select_related("workspace").get(
+                pk=project_id
+            )
 
-            issue_assignees = IssueAssignee.objects.filter(
-                issue_id=issue_id, project_id=project_id
-            ).values_list("assignee", flat=True)
+            issue_assignees = set(
+                IssueAssignee.objects.filter(
+                    issue_id=issue_id, project_id=project_id
+                ).values_list("assignee", flat=True)
+            )
 
             issue_subscribers = list(
                 set(issue_subscribers) - {uuid.UUID(actor_id)}
             )
 
+            # Resolve everything the fan-out looks up once for all the receivers
+            preferences = get_notification_preferences(
+                issue_subscribers + comment_mentions + new_mentions
+            )
+            completed_state_ids = get_completed_state_ids(
+                project_id, issue_activities_created
+            )
+            issue_comments = get_activity_comments(
+                project, issue_id, issue_activities_created
+            )
+
+            # The payloads of an activity are the same for every subscriber
+            subscriber_activities = []
+            for issue_activity in issue_activities_created:
+                # If activity done in blocking then blocked by email should not go
+                if issue_activity.get("issue_detail").get("id") != issue_id:
+                    continue
+
+                # Do not send notification for description update
+                if issue_activity.get("field") == "description":
+                    continue
+
+                issue_comment = str(
+                    issue_comments.get(
+                        str(issue_activity.get("issue_comment")), ""
+                    )
+                )
+                activity_data = {
+                    "id": str(issue_activity.get("id")),
+                    "verb": str(issue_activity.get("verb")),
+                    "field": str(issue_activity.get("field")),
+                    "actor": str(issue_activity.get("actor_id")),
+                    "new_value": str(issue_activity.get("new_value")),
+                    "old_value": str(issue_activity.get("old_value")),
+                    "issue_comment": issue_comment,
+                }
+                notification_data = {
+                    "issue": {
+                        "id": str(issue_id),
+                        "name": str(issue.name),
+                        "identifier": str(issue.project.identifier),
+                        "sequence_id": issue.sequence_id,
+                        "state_name": issue.state.name,
+                        "state_group": issue.state.group,
+                    },
+                    "issue_activity": activity_data,
+                }
+                email_data = {
+                    "issue": {
+                        "id": str(issue_id),
+                        "name": str(issue.name),
+                        "identifier": str(issue.project.identifier),
+                        "project_id": str(issue.project.id),
+                        "workspace_slug": str(issue.project.workspace.slug),
+                        "sequence_id": issue.sequence_id,
+                        "state_name": issue.state.name,
+                        "state_group": issue.state.group,
+                    },
+                    "issue_activity": {
+                        **activity_data,
+                        "activity_time": issue_activity.get("created_at"),
+                    },
+                }
+                subscriber_activities.append(
+                    (issue_activity, notification_data, email_data)
+                )
+
             for subscriber in issue_subscribers:
                 if issue.created_by_id and issue.created_by_id == subscriber:
                     sender = "in_app:issue_activities:created"
@@ -345,61 +496,13 @@ def notifications(
                 else:
                     sender = "in_app:issue_activities:subscribed"
 
-                preference = UserNotificationPreference.objects.get(
-                    user_id=subscriber
-                )
-
-                for issue_activity in issue_activities_created:
-                    # If activity done in blocking then blocked by email should not go
-                    if (
-                        issue_activity.get("issue_detail").get("id")
-                        != issue_id
-                    ):
-                        continue
-
-                    # Do not send notification for description update
-                    if issue_activity.get("field") == "description":
-                        continue
-
-                    # Check if the value should be sent or not
-                    send_email = False
-                    if (
-                        issue_activity.get("field") == "state"
-                        and preference.state_change
-                    ):
-                        send_email = True
-                    elif (
-                        issue_activity.get("field") == "state"
-                        and preference.issue_completed
-                        and State.objects.filter(
-                            project_id=project_id,
-                            pk=issue_activity.get("new_identifier"),
-                            group="completed",
-                        ).exists()
-                    ):
-                        send_email = True
-                    elif (
-                        issue_activity.get("field") == "comment"
-                        and preference.comment
-                    ):
-                        send_email = True
-                    elif preference.property_change:
-                        send_email = True
-                    else:
-                        send_email = False
-
-                    # If activity is of issue comment fetch the comment
-                    issue_comment = (
-                        IssueComment.objects.filter(
-                            id=issue_activity.get("issue_comment"),
-                            issue_id=issue_id,
-                            project_id=project_id,
-                            workspace_id=project.workspace_id,
-                        ).first()
-                        if issue_activity.get("issue_comment")
-                        else None
-                    )
+                preference = preferences.get(str(subscriber))
 
+                for (
+                    issue_activity,
+                    notification_data,
+                    email_data,
+                ) in subscriber_activities:
                     # Create in app notification
                     bulk_notifications.append(
                         Notification(
@@ -411,89 +514,20 @@ def notifications(
                             entity_name="issue",
                             project=project,
                             title=issue_activity.get("comment"),
-                            data={
-                                "issue": {
-                                    "id": str(issue_id),
-                                    "name": str(issue.name),
-                                    "identifier": str(
-                                        issue.project.identifier
-                                    ),
-                                    "sequence_id": issue.sequence_id,
-                                    "state_name": issue.state.name,
-                                    "state_group": issue.state.group,
-                                },
-                                "issue_activity": {
-                                    "id": str(issue_activity.get("id")),
-                                    "verb": str(issue_activity.get("verb")),
-                                    "field": str(issue_activity.get("field")),
-                                    "actor": str(
-                                        issue_activity.get("actor_id")
-                                    ),
-                                    "new_value": str(
-                                        issue_activity.get("new_value")
-                                    ),
-                                    "old_value": str(
-                                        issue_activity.get("old_value")
-                                    ),
-                                    "issue_comment": str(
-                                        issue_comment.comment_stripped
-                                        if issue_comment is not None
-                                        else ""
-                                    ),
-                                },
-                            },
+                            data=notification_data,
                         )
                     )
                     # Create email notification
-                    if send_email:
+                    if should_send_email(
+                        preference, issue_activity, completed_state_ids
+                    ):
                         bulk_email_logs.append(
                             EmailNotificationLog(
                                 triggered_by_id=actor_id,
                                 receiver_id=subscriber,
                                 entity_identifier=issue_id,
                                 entity_name="issue",
-                                data={
-                                    "issue": {
-                                        "id": str(issue_id),
-                                        "name": str(issue.name),
-                                        "identifier": str(
-                                            issue.project.identifier
-                                        ),
-                                        "project_id": str(issue.project.id),
-                                        "workspace_slug": str(
-                                            issue.project.workspace.slug
-                                        ),
-                                        "sequence_id": issue.sequence_id,
-                                        "state_name": issue.state.name,
-                                        "state_group": issue.state.group,
-                                    },
-                                    "issue_activity": {
-                                        "id": str(issue_activity.get("id")),
-                                        "verb": str(
-                                            issue_activity.get("verb")
-                                        ),
-                                        "field": str(
-                                            issue_activity.get("field")
-                                        ),
-                                        "actor": str(
-                                            issue_activity.get("actor_id")
-                                        ),
-                                        "new_value": str(
-                                            issue_activity.get("new_value")
-                                        ),
-                                        "old_value": str(
-                                            issue_activity.get("old_value")
-                                        ),
-                                        "issue_comment": str(
-                                            issue_comment.comment_stripped
-                                            if issue_comment is not None
-                                            else ""
-                                        ),
-                                        "activity_time": issue_activity.get(
-                                            "created_at"
-                                        ),
-                                    },
-                                },
+                                data=email_data,
                             )
                         )
 
@@ -516,9 +550,7 @@ def notifications(
 
             for mention_id in comment_mentions:
                 if mention_id != actor_id:
-                    preference = UserNotificationPreference.objects.get(
-                        user_id=mention_id
-                    )
+                    preference = preferences.get(str(mention_id))
                     for issue_activity in issue_activities_created:
                         notification = create_mention_notification(
                             project=project,
@@ -531,7 +563,7 @@ def notifications(
                         )
 
                         # check for email notifications
-                        if preference.mention:
+                        if preference and preference.mention:
                             bulk_email_logs.append(
                                 EmailNotificationLog(
                                     triggered_by_id=actor_id,
@@ -583,9 +615,7 @@ def notifications(
 
             for mention_id in new_mentions:
                 if mention_id != actor_id:
-                    preference = UserNotificationPreference.objects.get(
-                        user_id=mention_id
-                    )
+                    preference = preferences.get(str(mention_id))
                     if (
                         last_activity is not None
                         and last_activity.field == "description"
@@ -631,11 +661,11 @@ def notifications(
                                 },
                             )
                         )
-                        if preference.mention:
+                        if preference and preference.mention:
                             bulk_email_logs.append(
                                 EmailNotificationLog(
                                     triggered_by_id=actor_id,
-                                    receiver_id=subscriber,
+                                    receiver_id=mention_id,
                                     entity_identifier=issue_id,
                                     entity_name="issue",
                                     data={
@@ -678,11 +708,11 @@ def notifications(
                                 issue_id=issue_id,
                                 activity=issue_activity,
                             )
-                            if preference.mention:
+                            if preference and preference.mention:
                                 bulk_email_logs.append(
                                     EmailNotificationLog(
                                         triggered_by_id=actor_id,
-                                        receiver_id=subscriber,
+                                        receiver_id=mention_id,
                                         entity_identifier=issue_id,
                                         entity_name="issue",
                                         data={
@@ -739,6 +769,12 @@ def notifications(
             Notification.objects.bulk_create(
                 bulk_notifications, batch_size=100
             )
+            update_notification_counters(
+                project.workspace.slug, bulk_notifications, 1
+            )
+            publish_notification_events(
+                project.workspace.slug, bulk_notifications
+            )
             EmailNotificationLog.objects.bulk_create(
                 bulk_email_logs, batch_size=100, ignore_conflicts=True
             )
@@ -0,0 +1,25 @@
+# Third party imports
+from celery import shared_task
+
+# Django imports
+from django.conf import settings
+
+# Module imports
+from plane.settings.redis import redis_instance
+from plane.utils.exception_logger import log_exception
+from plane.utils.metrics import observe_metric
+
+
+@shared_task
+def record_queue_depths():
+    """Messages waiting in every queue, the broker keeps a queue in a list"""
+    try:
+        queues = [queue.name for queue in settings.CELERY_TASK_QUEUES]
+        pipeline = redis_instance().pipeline(transaction=False)
+        for queue in queues:
+            pipeline.llen(queue)
+        for queue, depth in zip(queues, pipeline.execute()):
+            observe_metric(f"celery.queue_depth.{queue}", depth)
+    except Exception as e:
+        log_exception(e)
+        return
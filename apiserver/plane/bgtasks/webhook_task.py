@@ -2,9 +2,12 @@ import hashlib
 import hmac
 import json
 import logging
+import os
+import time
 import uuid
 
 import requests
+from requests.adapters import HTTPAdapter
 
 # Third party imports
 from celery import shared_task
@@ -43,7 +46,9 @@ from plane.db.models import (
     InboxIssue,
 )
 from plane.license.utils.instance_value import get_email_configuration
+from plane.settings.redis import redis_instance
 from plane.utils.exception_logger import log_exception
+from plane.utils.metrics import increment_metric, observe_metric
 
 SERIALIZER_MAPPER = {
     "project": ProjectSerializer,
@@ -80,6 +85,150 @@ def get_model_data(event, event_id, many=False):
     return serializer(queryset, many=many).data
 
 
+# Webhook flag that subscribes to an event
+EVENT_MAPPER = {
+    "project": "project",
+    "issue": "issue",
+    "module": "module",
+    "module_issue": "module",
+    "cycle": "cycle",
+    "cycle_issue": "cycle",
+    "issue_comment": "issue_comment",
+}
+
+ACTION_MAPPER = {
+    "POST": "create",
+    "PATCH": "update",
+    "PUT": "update",
+    "DELETE": "delete",
+}
+
+# Redis keys of the batched deliveries
+BATCH_QUEUE_KEY = "webhook:batch:{webhook_id}"
+BATCH_PENDING_KEY = "webhook:batch:pending"
+BATCH_SCHEDULED_KEY = "webhook:batch:scheduled"
+
+_session = None
+_session_pid = None
+
+
+def get_webhook_session():
+    """
+    Session shared by the deliveries of a worker process so the connections
+    to the webhook hosts are kept alive, recreated after a fork
+    """
+    global _session, _session_pid
+    if _session is None or _session_pid != os.getpid():
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=settings.WEBHOOK_POOL_SIZE,
+            pool_maxsize=settings.WEBHOOK_POOL_SIZE,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _session, _session_pid = session, os.getpid()
+    return _session
+
+
+def get_webhook_headers(webhook, event, payload):
+    headers = {
+        "Content-Type": "application/json",
+        "User-Agent": "Autopilot",
+        "X-Plane-Delivery": str(uuid.uuid4()),
+        "X-Plane-Event": event,
+    }
+
+    # Use HMAC for generating signature
+    if webhook.secret_key:
+        hmac_signature = hmac.new(
+            webhook.secret_key.encode("utf-8"),
+            json.dumps(payload).encode("utf-8"),
+            hashlib.sha256,
+        )
+        headers["X-Plane-Signature"] = hmac_signature.hexdigest()
+    return headers
+
+
+def send_webhook(webhook, headers, payload):
+    return get_webhook_session().post(
+        webhook.url,
+        headers=headers,
+        json=payload,
+        timeout=30,
+    )
+
+
+def get_webhook_log(
+    webhook,
+    event,
+    action,
+    headers,
+    payload,
+    retries,
+    response=None,
+    error=None,
+):
+    return WebhookLog(
+        workspace_id=str(webhook.workspace_id),
+        webhook_id=str(webhook.id),
+        event_type=str(event),
+        request_method=str(action),
+        request_headers=str(headers),
+        request_body=str(payload),
+        response_status=(
+            str(response.status_code) if response is not None else 500
+        ),
+        response_headers=(
+            str(response.headers) if response is not None else ""
+        ),
+        response_body=str(response.text)
+        if response is not None
+        else str(error),
+        retry_count=str(retries),
+    )
+
+
+def get_batch_payload(webhook, events):
+    return {
+        "event": "batch",
+        "action": "batch",
+        "webhook_id": str(webhook.id),
+        "workspace_id": str(webhook.workspace_id),
+        "data": [
+            {
+                "event": event["event"],
+                "action": event["action"],
+                "data": event["data"],
+                "activity": event["activity"],
+            }
+            for event in events
+        ],
+    }
+
+
+def observe_delivery_lag(queued_at):
+    # Seconds between the activity and its delivery
+    queued_at = [value for value in queued_at if value is not None]
+    if queued_at:
+        now = time.time()
+        observe_metric(
+            "webhook.delivery_lag",
+            sum(now - value for value in queued_at),
+            count=len(queued_at),
+        )
+
+
+def deactivate_webhook(webhook, reason, current_site):
+    Webhook.objects.filter(pk=webhook.id).update(is_active=False)
+    # send email for the deactivation of the webhook
+    send_webhook_deactivation_email(
+        webhook_id=webhook.id,
+        receiver_id=webhook.created_by_id,
+        reason=reason,
+        current_site=current_site,
+    )
+
+
 @shared_task(
     bind=True,
     autoretry_for=(requests.RequestException,),
@@ -91,13 +240,6 @@ def webhook_task(self, webhook, slug, event, event_data, action, current_site):
     try:
         webhook = Webhook.objects.get(id=webhook, workspace__slug=slug)
 
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "Autopilot",
-            "X-Plane-Delivery": str(uuid.uuid4()),
-            "X-Plane-Event": event,
-        }
-
         # # Your secret key
         event_data = (
             json.loads(json.dumps(event_data, cls=DjangoJSONEncoder))
@@ -105,12 +247,7 @@ def webhook_task(self, webhook, slug, event, event_data, action, current_site):
             else None
         )
 
-        action = {
-            "POST": "create",
-            "PATCH": "update",
-            "PUT": "update",
-            "DELETE": "delete",
-        }.get(action, action)
+        action = ACTION_MAPPER.get(action, action)
 
         payload = {
             "event": event,
@@ -119,64 +256,37 @@ def webhook_task(self, webhook, slug, event, event_data, action, current_site):
             "workspace_id": str(webhook.workspace_id),
             "data": event_data,
         }
-
-        # Use HMAC for generating signature
-        if webhook.secret_key:
-            hmac_signature = hmac.new(
-                webhook.secret_key.encode("utf-8"),
-                json.dumps(payload).encode("utf-8"),
-                hashlib.sha256,
-            )
-            signature = hmac_signature.hexdigest()
-            headers["X-Plane-Signature"] = signature
+        # Built before sending so failed deliveries are logged with them
+        headers = get_webhook_headers(webhook, event, payload)
 
         # Send the webhook event
-        response = requests.post(
-            webhook.url,
-            headers=headers,
-            json=payload,
-            timeout=30,
-        )
+        response = send_webhook(webhook, headers, payload)
 
         # Log the webhook request
-        WebhookLog.objects.create(
-            workspace_id=str(webhook.workspace_id),
-            webhook_id=str(webhook.id),
-            event_type=str(event),
-            request_method=str(action),
-            request_headers=str(headers),
-            request_body=str(payload),
-            response_status=str(response.status_code),
-            response_headers=str(response.headers),
-            response_body=str(response.text),
-            retry_count=str(self.request.retries),
-        )
+        get_webhook_log(
+            webhook,
+            event,
+            action,
+            headers,
+            payload,
+            self.request.retries,
+            response=response,
+        ).save()
 
     except requests.RequestException as e:
         # Log the failed webhook request
-        WebhookLog.objects.create(
-            workspace_id=str(webhook.workspace_id),
-            webhook_id=str(webhook.id),
-            event_type=str(event),
-            request_method=str(action),
-            request_headers=str(headers),
-            request_body=str(payload),
-            response_status=500,
-            response_headers="",
-            response_body=str(e),
-            retry_count=str(self.request.retries),
-        )
+        get_webhook_log(
+            webhook,
+            event,
+            action,
+            headers,
+            payload,
+            self.request.retries,
+            error=e,
+        ).save()
         # Retry logic
         if self.request.retries >= self.max_retries:
-            Webhook.objects.filter(pk=webhook.id).update(is_active=False)
-            if webhook:
-                # send email for the deactivation of the webhook
-                send_webhook_deactivation_email(
-                    webhook_id=webhook.id,
-                    receiver_id=webhook.created_by_id,
-                    reason=str(e),
-                    current_site=current_site,
-                )
+            deactivate_webhook(webhook, str(e), current_site)
             return
         raise requests.RequestException()
 
@@ -262,17 +372,11 @@ def webhook_send_task(
     action,
     current_site,
     activity,
+    queued_at=None,
 ):
     try:
         webhook = Webhook.objects.get(id=webhook, workspace__slug=slug)
 
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "Autopilot",
-            "X-Plane-Delivery": str(uuid.uuid4()),
-            "X-Plane-Event": event,
-        }
-
         # # Your secret key
         event_data = (
             json.loads(json.dumps(event_data, cls=DjangoJSONEncoder))
@@ -286,12 +390,7 @@ def webhook_send_task(
             else None
         )
 
-        action = {
-            "POST": "create",
-            "PATCH": "update",
-            "PUT": "update",
-            "DELETE": "delete",
-        }.get(action, action)
+        action = ACTION_MAPPER.get(action, action)
 
         payload = {
             "event": event,
@@ -301,64 +400,38 @@ def webhook_send_task(
             "data": event_data,
             "activity": activity,
         }
-
-        # Use HMAC for generating signature
-        if webhook.secret_key:
-            hmac_signature = hmac.new(
-                webhook.secret_key.encode("utf-8"),
-                json.dumps(payload).encode("utf-8"),
-                hashlib.sha256,
-            )
-            signature = hmac_signature.hexdigest()
-            headers["X-Plane-Signature"] = signature
+        # Built before sending so failed deliveries are logged with them
+        headers = get_webhook_headers(webhook, event, payload)
 
         # Send the webhook event
-        response = requests.post(
-            webhook.url,
-            headers=headers,
-            json=payload,
-            timeout=30,
-        )
+        response = send_webhook(webhook, headers, payload)
+        observe_delivery_lag([queued_at])
 
         # Log the webhook request
-        WebhookLog.objects.create(
-            workspace_id=str(webhook.workspace_id),
-            webhook_id=str(webhook.id),
-            event_type=str(event),
-            request_method=str(action),
-            request_headers=str(headers),
-            request_body=str(payload),
-            response_status=str(response.status_code),
-            response_headers=str(response.headers),
-            response_body=str(response.text),
-            retry_count=str(self.request.retries),
-        )
+        get_webhook_log(
+            webhook,
+            event,
+            action,
+            headers,
+            payload,
+            self.request.retries,
+            response=response,
+        ).save()
 
     except requests.RequestException as e:
         # Log the failed webhook request
-        WebhookLog.objects.create(
-            workspace_id=str(webhook.workspace_id),
-            webhook_id=str(webhook.id),
-            event_type=str(event),
-            request_method=str(action),
-            request_headers=str(headers),
-            request_body=str(payload),
-            response_status=500,
-            response_headers="",
-            response_body=str(e),
-            retry_count=str(self.request.retries),
-        )
+        get_webhook_log(
+            webhook,
+            event,
+            action,
+            headers,
+            payload,
+            self.request.retries,
+            error=e,
+        ).save()
         # Retry logic
         if self.request.retries >= self.max_retries:
-            Webhook.objects.filter(pk=webhook.id).update(is_active=False)
-            if webhook:
-                # send email for the deactivation of the webhook
-                send_webhook_deactivation_email(
-                    webhook_id=webhook.id,
-                    receiver_id=webhook.created_by_id,
-                    reason=str(e),
-                    current_site=current_site,
-                )
+            deactivate_webhook(webhook, str(e), current_site)
             return
         raise requests.RequestException()
 
@@ -369,6 +442,248 @@ def webhook_send_task(
         return
 
 
+@shared_task(
+    bind=True,
+    autoretry_for=(requests.RequestException,),
+    retry_backoff=600,
+    max_retries=5,
+    retry_jitter=True,
+)
+def webhook_batch_send_task(self, webhook, events, current_site):
+    """Retry a batched delivery that failed while flushing"""
+    try:
+        webhook = Webhook.objects.get(id=webhook, is_active=True)
+        payload = get_batch_payload(webhook, events)
+        headers = get_webhook_headers(webhook, "batch", payload)
+
+        response = send_webhook(webhook, headers, payload)
+        observe_delivery_lag([event.get("queued_at") for event in events])
+
+        get_webhook_log(
+            webhook,
+            "batch",
+            "batch",
+            headers,
+            payload,
+            self.request.retries,
+            response=response,
+        ).save()
+
+    except requests.RequestException as e:
+        get_webhook_log(
+            webhook,
+            "batch",
+            "batch",
+            headers,
+            payload,
+            self.request.retries,
+            error=e,
+        ).save()
+        if self.request.retries >= self.max_retries:
+            deactivate_webhook(webhook, str(e), current_site)
+            return
+        raise requests.RequestException()
+
+    except Exception as e:
+        if isinstance(e, ObjectDoesNotExist):
+            return
+        log_exception(e)
+        return
+
+
+def queue_batched_events(events):
+    """
+    Queue the events of batched webhooks, the first event of a window
+    schedules the flush that delivers everything queued by then
+    """
+    ri = redis_instance()
+    pipeline = ri.pipeline()
+    for webhook_id, event in events:
+        pipeline.rpush(
+            BATCH_QUEUE_KEY.format(webhook_id=webhook_id),
+            json.dumps(event, cls=DjangoJSONEncoder),
+        )
+        pipeline.sadd(BATCH_PENDING_KEY, str(webhook_id))
+    pipeline.execute()
+
+    # Expire the flag in case the flush never runs
+    if ri.set(
+        BATCH_SCHEDULED_KEY,
+        1,
+        nx=True,
+        ex=settings.WEBHOOK_BATCH_WINDOW * 6,
+    ):
+        flush_webhook_batches.apply_async(
+            countdown=settings.WEBHOOK_BATCH_WINDOW
+        )
+
+
+def drain_batched_events():
+    ri = redis_instance()
+    pipeline = ri.pipeline(transaction=True)
+    # Events queued from here on schedule the next flush
+    pipeline.delete(BATCH_SCHEDULED_KEY)
+    pipeline.smembers(BATCH_PENDING_KEY)
+    pipeline.delete(BATCH_PENDING_KEY)
+    webhook_ids = [webhook_id.decode() for webhook_id in pipeline.execute()[1]]
+
+    pipeline = ri.pipeline(transaction=True)
+    for webhook_id in webhook_ids:
+        key = BATCH_QUEUE_KEY.format(webhook_id=webhook_id)
+        pipeline.lrange(key, 0, -1)
+        pipeline.delete(key)
+    results = pipeline.execute()
+
+    return {
+        webhook_id: [json.loads(event) for event in results[index * 2]]
+        for index, webhook_id in enumerate(webhook_ids)
+    }
+
+
+@shared_task
+def flush_webhook_batches():
+    try:
+        batches = drain_batched_events()
+        webhooks = Webhook.objects.filter(
+            pk__in=batches.keys(), is_active=True
+        )
+
+        webhook_logs = []
+        for webhook in webhooks:
+            events = batches[str(webhook.id)]
+            for start in range(0, len(events), settings.WEBHOOK_BATCH_SIZE):
+                chunk = events[start : start + settings.WEBHOOK_BATCH_SIZE]
+                payload = get_batch_payload(webhook, chunk)
+                headers = get_webhook_headers(webhook, "batch", payload)
+                try:
+                    response = send_webhook(webhook, headers, payload)
+                except requests.RequestException as e:
+                    webhook_logs.append(
+                        get_webhook_log(
+                            webhook,
+                            "batch",
+                            "batch",
+                            headers,
+                            payload,
+                            0,
+                            error=e,
+                        )
+                    )
+                    # Hand the batch over to the retrying task
+                    webhook_batch_send_task.apply_async(
+                        kwargs={
+                            "webhook": str(webhook.id),
+                            "events": chunk,
+                            "current_site": chunk[0].get("current_site"),
+                        },
+                        countdown=60,
+                    )
+                    continue
+
+                increment_metric("webhook.batches")
+                increment_metric("webhook.batched_events", len(chunk))
+                observe_delivery_lag(
+                    [event.get("queued_at") for event in chunk]
+                )
+                webhook_logs.append(
+                    get_webhook_log(
+                        webhook,
+                        "batch",
+                        "batch",
+                        headers,
+                        payload,
+                        0,
+                        response=response,
+                    )
+                )
+
+        # Log all the deliveries at once
+        WebhookLog.objects.bulk_create(webhook_logs, batch_size=100)
+    except Exception as e:
+        log_exception(e)
+        return
+
+
+def dispatch_webhook_activities(slug, current_site, activities):
+    """
+    Deliver the activities to the subscribed webhooks, serializing every
+    changed object and actor once however many webhooks receive them
+    """
+    webhooks = list(
+        Webhook.objects.filter(workspace__slug=slug, is_active=True)
+    )
+    if not webhooks:
+        return
+
+    model_data = {}
+    batched_events = []
+    queued_at = time.time()
+    for activity in activities:
+        event = activity["event"]
+        subscribed = [
+            webhook
+            for webhook in webhooks
+            if event not in EVENT_MAPPER
+            or getattr(webhook, EVENT_MAPPER[event])
+        ]
+        if not subscribed:
+            continue
+
+        keys = [(event, activity["event_id"]), ("user", activity["actor_id"])]
+        for key in keys:
+            if key not in model_data:
+                try:
+                    model_data[key] = get_model_data(
+                        event=key[0], event_id=key[1]
+                    )
+                except ObjectDoesNotExist:
+                    model_data[key] = None
+        # Skip the activities of objects that no longer exist
+        if any(model_data[key] is None for key in keys):
+            continue
+
+        event_data = model_data[(event, activity["event_id"])]
+        event_activity = {
+            "field": activity["field"],
+            "new_value": activity["new_value"],
+            "old_value": activity["old_value"],
+            "actor": model_data[("user", activity["actor_id"])],
+            "old_identifier": activity["old_identifier"],
+            "new_identifier": activity["new_identifier"],
+        }
+        for webhook in subscribed:
+            if webhook.batch_delivery:
+                batched_events.append(
+                    (
+                        webhook.id,
+                        {
+                            "event": event,
+                            "action": ACTION_MAPPER.get(
+                                activity["verb"], activity["verb"]
+                            ),
+                            "data": event_data,
+                            "activity": event_activity,
+                            "queued_at": queued_at,
+                            "current_site": current_site,
+                        },
+                    )
+                )
+            else:
+                webhook_send_task.delay(
+                    webhook=webhook.id,
+                    slug=slug,
+                    event=event,
+                    event_data=event_data,
+                    action=activity["verb"],
+                    current_site=current_site,
+                    activity=event_activity,
+                    queued_at=queued_at,
+                )
+
+    if batched_events:
+        queue_batched_events(batched_events)
+
+
 @shared_task
 def webhook_activity(
     event,
@@ -384,43 +699,23 @@ def webhook_activity(
     new_identifier,
 ):
     try:
-        webhooks = Webhook.objects.filter(workspace__slug=slug, is_active=True)
-
-        if event == "project":
-            webhooks = webhooks.filter(project=True)
-
-        if event == "issue":
-            webhooks = webhooks.filter(issue=True)
-
-        if event == "module" or event == "module_issue":
-            webhooks = webhooks.filter(module=True)
-
-        if event == "cycle" or event == "cycle_issue":
-            webhooks = webhooks.filter(cycle=True)
-
-        if event == "issue_comment":
-            webhooks = webhooks.filter(issue_comment=True)
-
-        for webhook in webhooks:
-            webhook_send_task.delay(
-                webhook=webhook.id,
-                slug=slug,
-                event=event,
-                event_data=get_model_data(
-                    event=event,
-                    event_id=event_id,
-                ),
-                action=verb,
-                current_site=current_site,
-                activity={
+        dispatch_webhook_activities(
+            slug=slug,
+            current_site=current_site,
+            activities=[
+                {
+                    "event": event,
+                    "verb": verb,
                     "field": field,
-                    "new_value": new_value,
                     "old_value": old_value,
-                    "actor": get_model_data(event="user", event_id=actor_id),
+                    "new_value": new_value,
+                    "actor_id": actor_id,
+                    "event_id": event_id,
                     "old_identifier": old_identifier,
                     "new_identifier": new_identifier,
-                },
-            )
+                }
+            ],
+        )
         return
     except Exception as e:
         # Return if a does not exist error occurs
@@ -432,6 +727,23 @@ def webhook_activity(
         return
 
 
+@shared_task
+def webhook_activities(slug, current_site, activities):
+    """Deliver all the activities recorded by one change together"""
+    try:
+        dispatch_webhook_activities(
+            slug=slug, current_site=current_site, activities=activities
+        )
+        return
+    except Exception as e:
+        if isinstance(e, ObjectDoesNotExist):
+            return
+        if settings.DEBUG:
+            print(e)
+        log_exception(e)
+        return
+
+
 @shared_task
 def model_activity(
     model_name,
@@ -1,13 +1,14 @@
 import os
+import time
+from datetime import datetime
+
 from celery import Celery
-from plane.settings.redis import redis_instance
 from celery.schedules import crontab
+from celery.signals import before_task_publish, task_prerun
 
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "plane.settings.production")
 
-ri = redis_instance()
-
 app = Celery("plane")
 
 # Using a string here means the worker will not have to
@@ -40,8 +41,49 @@ app.conf.beat_schedule = {
         "task": "plane.bgtasks.deletion_task.hard_delete",
         "schedule": crontab(hour=0, minute=0),
     },
+    # Executes every day at 11:50 PM, before the day closes
+    "check-every-day-to-take-burndown-snapshots": {
+        "task": "plane.bgtasks.burndown_snapshot_task.take_burndown_snapshots",
+        "schedule": crontab(hour=23, minute=50),
+    },
+    "check-every-minute-to-flush-api-token-last-used": {
+        "task": "plane.bgtasks.api_token_task.flush_api_token_last_used",
+        "schedule": crontab(minute="*"),
+    },
+    "check-every-ten-minutes-to-reconcile-notification-counters": {
+        "task": "plane.bgtasks.notification_counter_task.reconcile_notification_counters",
+        "schedule": crontab(minute="*/10"),
+    },
+    "check-every-minute-to-record-queue-depths": {
+        "task": "plane.bgtasks.queue_depth_task.record_queue_depths",
+        "schedule": crontab(minute="*"),
+    },
 }
 
+
+@before_task_publish.connect
+def stamp_published_at(headers=None, **kwargs):
+    # Read back by the worker as an attribute of the task request
+    headers["published_at"] = time.time()
+
+
+@task_prerun.connect
+def observe_queue_wait(task=None, **kwargs):
+    """Seconds a task waited in its queue before a worker started it"""
+    published_at = getattr(task.request, "published_at", None)
+    if published_at is None:
+        return
+    # Delayed tasks and retries only start waiting once they are due
+    if task.request.eta:
+        published_at = max(
+            published_at, datetime.fromisoformat(task.request.eta).timestamp()
+        )
+    from plane.utils.metrics import observe_metric
+
+    queue = (task.request.delivery_info or {}).get("routing_key", "default")
+    observe_metric(f"celery.wait_seconds.{queue}", time.time() - published_at)
+
+
 # Load task modules from all registered Django app configs.
 app.autodiscover_tasks()
 
@@ -0,0 +1,179 @@
+# Python imports
+import time
+
+# Django imports
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count, F, Q, Window
+from django.db.models.functions import RowNumber
+from django.test.utils import CaptureQueriesContext
+
+# Module imports
+from plane.db.models import Issue, Project
+from plane.utils.grouper import (
+    issue_group_values,
+    issue_on_results,
+    issue_queryset_grouper,
+)
+from plane.utils.order_queryset import order_issue_queryset
+from plane.utils.paginator import (
+    Cursor,
+    GroupedOffsetPaginator,
+    SubGroupedOffsetPaginator,
+)
+
+
+class Command(BaseCommand):
+    help = "Compare query counts and latency of the grouped issue pagination against the previous multi query pagination"
+
+    def add_arguments(self, parser):
+        # Positional argument
+        parser.add_argument("project_id", type=str, help="project id")
+        parser.add_argument(
+            "--group-by", type=str, default="state_id", help="group by field"
+        )
+        parser.add_argument(
+            "--sub-group-by", type=str, default=None, help="sub group by field"
+        )
+        parser.add_argument(
+            "--per-page", type=int, default=50, help="issues per group"
+        )
+        parser.add_argument(
+            "--page", type=int, default=0, help="page to fetch"
+        )
+        parser.add_argument(
+            "--iterations", type=int, default=10, help="runs per mode"
+        )
+
+    def get_queryset(self, project):
+        issue_queryset, order_by = order_issue_queryset(
+            issue_queryset=Issue.issue_objects.filter(project=project),
+            order_by_param="-created_at",
+        )
+        return issue_queryset, order_by
+
+    def run_legacy(self, queryset, order_by, options):
+        # The queries the paginators used to issue for every request
+        group_by = options["group_by"]
+        sub_group_by = options["sub_group_by"]
+        per_page = options["per_page"]
+        offset = options["page"] * per_page
+        stop = offset + per_page + 1
+        partition_by = [F(group_by)] + (
+            [F(sub_group_by)] if sub_group_by else []
+        )
+        key = order_by[1:] if order_by.startswith("-") else order_by
+        windowed = queryset.annotate(
+            row_number=Window(
+                expression=RowNumber(),
+                partition_by=partition_by,
+                order_by=(
+                    F(key).desc(nulls_last=True),
+                    F("created_at").desc(),
+                ),
+            )
+        )
+        results = windowed.filter(row_number__gt=offset, row_number__lt=stop)
+        list(
+            issue_on_results(
+                issues=results, group_by=group_by, sub_group_by=sub_group_by
+            )
+        )
+        windowed.filter(row_number__gte=stop).exists()
+        windowed.count()
+        list(
+            windowed.values(group_by)
+            .annotate(count=Count("id", distinct=True))
+            .order_by("-count")[:1]
+        )
+        list(
+            queryset.values(group_by)
+            .annotate(count=Count("id", distinct=True))
+            .order_by()
+        )
+        if sub_group_by:
+            list(
+                queryset.values(group_by, sub_group_by)
+                .annotate(count=Count("id", distinct=True))
+                .order_by()
+            )
+
+    def run_window(self, queryset, order_by, options):
+        group_by = options["group_by"]
+        sub_group_by = options["sub_group_by"]
+        group_by_fields = issue_group_values(
+            field=group_by,
+            slug=self.project.workspace.slug,
+            project_id=self.project.id,
+            filters={},
+        )
+        paginator_kwargs = {
+            "queryset": queryset,
+            "order_by": order_by,
+            "group_by_field_name": group_by,
+            "group_by_fields": group_by_fields,
+            "count_filter": Q(),
+        }
+        if sub_group_by:
+            paginator = SubGroupedOffsetPaginator(
+                sub_group_by_field_name=sub_group_by,
+                sub_group_by_fields=issue_group_values(
+                    field=sub_group_by,
+                    slug=self.project.workspace.slug,
+                    project_id=self.project.id,
+                    filters={},
+                ),
+                **paginator_kwargs,
+            )
+        else:
+            paginator = GroupedOffsetPaginator(**paginator_kwargs)
+        cursor_result = paginator.get_result(
+            limit=options["per_page"],
+            cursor=Cursor(options["per_page"], options["page"], False),
+        )
+        paginator.process_results(
+            results=issue_on_results(
+                issues=cursor_result.results,
+                group_by=group_by,
+                sub_group_by=sub_group_by,
+            )
+        )
+
+    def measure(self, name, runner, queryset, order_by, options):
+        durations = []
+        queries = 0
+        for _ in range(options["iterations"]):
+            with CaptureQueriesContext(connection) as context:
+                start = time.perf_counter()
+                runner(queryset, order_by, options)
+                durations.append(time.perf_counter() - start)
+            queries = len(context.captured_queries)
+
+        durations.sort()
+        self.stdout.write(
+            f"{name:<8} queries={queries:<3} "
+            f"median={durations[len(durations) // 2] * 1000:.1f}ms "
+            f"max={durations[-1] * 1000:.1f}ms"
+        )
+
+    def handle(self, *args, **options):
+        if options["iterations"] < 1:
+            raise CommandError("Iterations should be at least 1")
+
+        self.project = (
+            Project.objects.filter(pk=options["project_id"])
+            .select_related("workspace")
+            .first()
+        )
+        if not self.project:
+            raise CommandError("Project does not exist")
+
+        queryset, order_by = self.get_queryset(self.project)
+        queryset = issue_queryset_grouper(
+            queryset=queryset,
+            group_by=options["group_by"],
+            sub_group_by=options["sub_group_by"],
+        )
+
+        self.measure("legacy", self.run_legacy, queryset, order_by, options)
+        self.measure("window", self.run_window, queryset, order_by, options)
@@ -0,0 +1,96 @@
+# Python imports
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Django imports
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+# Module imports
+from plane.db.models import Issue, Project
+
+
+class Command(BaseCommand):
+    help = "Create issues in a project from many threads at once and report the throughput"
+
+    def add_arguments(self, parser):
+        parser.add_argument("project", type=str, help="project id")
+        parser.add_argument(
+            "--threads", type=int, default=8, help="concurrent creators"
+        )
+        parser.add_argument(
+            "--issues", type=int, default=50, help="issues per thread"
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="keep the created issues instead of deleting them",
+        )
+
+    def create_issues(self, project, count, barrier):
+        created, latencies = [], []
+        try:
+            barrier.wait()
+            for index in range(count):
+                started = time.perf_counter()
+                issue = Issue.objects.create(
+                    project=project, name=f"Benchmark issue {index}"
+                )
+                latencies.append(time.perf_counter() - started)
+                created.append((issue.id, issue.sequence_id))
+        finally:
+            # Every thread holds its own database connection
+            connection.close()
+        return created, latencies
+
+    def handle(self, *args, **options):
+        if options["threads"] < 1 or options["issues"] < 1:
+            raise CommandError("Threads and issues should be at least 1")
+
+        try:
+            project = Project.objects.get(pk=options["project"])
+        except Project.DoesNotExist:
+            raise CommandError("Project does not exist")
+
+        threads = options["threads"]
+        barrier = threading.Barrier(threads)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            results = list(
+                executor.map(
+                    lambda _: self.create_issues(
+                        project, options["issues"], barrier
+                    ),
+                    range(threads),
+                )
+            )
+        elapsed = time.perf_counter() - started
+
+        created = [issue for issues, _ in results for issue in issues]
+        latencies = sorted(
+            latency
+            for _, thread_latencies in results
+            for latency in thread_latencies
+        )
+        sequence_ids = [sequence_id for _, sequence_id in created]
+
+        self.stdout.write(
+            f"Created {len(created)} issues with {threads} threads in "
+            f"{elapsed:.2f}s ({len(created) / elapsed:.1f} issues/s)"
+        )
+        self.stdout.write(
+            f"Latency p50 {statistics.median(latencies) * 1000:.1f}ms, "
+            f"p95 {latencies[int(len(latencies) * 0.95) - 1] * 1000:.1f}ms, "
+            f"max {latencies[-1] * 1000:.1f}ms"
+        )
+
+        if not options["keep"]:
+            Issue.objects.filter(
+                pk__in=[issue_id for issue_id, _ in created]
+            ).delete()
+
+        if len(set(sequence_ids)) != len(sequence_ids):
+            raise CommandError("Sequence ids were handed out more than once")
+        self.stdout.write(self.style.SUCCESS("Every sequence id is unique"))
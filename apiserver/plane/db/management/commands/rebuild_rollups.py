@@ -0,0 +1,52 @@
+# Django imports
+from django.core.management.base import BaseCommand, CommandError
+
+# Module imports
+from plane.db.models import Cycle, Module
+from plane.utils.issue_rollup import (
+    refresh_cycle_rollups,
+    refresh_module_rollups,
+)
+
+
+class Command(BaseCommand):
+    help = "Rebuild the issue count and estimate point rollups of cycles and modules"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--project", type=str, default=None, help="project id"
+        )
+        parser.add_argument(
+            "--missing",
+            action="store_true",
+            help="only rebuild cycles and modules without rollups",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=500, help="entities per batch"
+        )
+
+    def rebuild(self, name, queryset, refresh, options):
+        if options["project"]:
+            queryset = queryset.filter(project_id=options["project"])
+        if options["missing"]:
+            queryset = queryset.filter(issue_rollups__isnull=True)
+
+        entity_ids = list(queryset.values_list("id", flat=True).distinct())
+        batch_size = options["batch_size"]
+        for start in range(0, len(entity_ids), batch_size):
+            refresh(entity_ids[start : start + batch_size])
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt rollups of {len(entity_ids)} {name}")
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("Batch size should be at least 1")
+
+        self.rebuild(
+            "cycles", Cycle.objects.all(), refresh_cycle_rollups, options
+        )
+        self.rebuild(
+            "modules", Module.objects.all(), refresh_module_rollups, options
+        )
@@ -0,0 +1,63 @@
+# Django imports
+from django.core.management.base import BaseCommand, CommandError
+
+# Module imports
+from plane.db.models import SearchDocument
+from plane.utils.search import SEARCH_ENTITIES, index_search_documents
+
+
+class Command(BaseCommand):
+    help = "Rebuild the search documents of issues, pages, cycles, modules and views"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workspace", type=str, default=None, help="workspace slug"
+        )
+        parser.add_argument(
+            "--missing",
+            action="store_true",
+            help="only index the entities without search documents",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=500, help="entities per batch"
+        )
+
+    def rebuild(self, model, options):
+        entity_name, name_field, content_field = SEARCH_ENTITIES[model]
+        fields = ["id", "workspace_id", "deleted_at", name_field]
+        if content_field:
+            fields.append(content_field)
+        if any(field.name == "project" for field in model._meta.fields):
+            fields.append("project_id")
+
+        queryset = model.objects.filter(deleted_at__isnull=True).only(*fields)
+        if options["workspace"]:
+            queryset = queryset.filter(workspace__slug=options["workspace"])
+        if options["missing"]:
+            queryset = queryset.exclude(
+                pk__in=SearchDocument.all_objects.filter(
+                    entity_name=entity_name
+                ).values("entity_identifier")
+            )
+
+        batch, indexed = [], 0
+        for instance in queryset.iterator(chunk_size=options["batch_size"]):
+            batch.append(instance)
+            if len(batch) == options["batch_size"]:
+                index_search_documents(batch)
+                indexed, batch = indexed + len(batch), []
+        index_search_documents(batch)
+        indexed += len(batch)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Indexed {indexed} {model._meta.verbose_name_plural}"
+            )
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("Batch size should be at least 1")
+
+        for model in SEARCH_ENTITIES:
+            self.rebuild(model, options)
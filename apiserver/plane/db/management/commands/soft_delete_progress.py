@@ -0,0 +1,42 @@
+# Django imports
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+# Module imports
+from plane.bgtasks.deletion_task import get_soft_delete_progress
+
+
+class Command(BaseCommand):
+    help = "Print the rows soft deleted per table by a cascade"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "model", type=str, help="model label, e.g. db.Project"
+        )
+        parser.add_argument("pk", type=str, help="deleted instance id")
+
+    def handle(self, *args, **options):
+        try:
+            model = apps.get_model(options["model"])
+        except (LookupError, ValueError):
+            raise CommandError(f"Error: {options['model']} is not a model")
+
+        progress = get_soft_delete_progress(model, options["pk"])
+        if progress is None:
+            raise CommandError(
+                "Error: No soft delete cascade was checkpointed for "
+                f"{options['model']} {options['pk']} in the last week"
+            )
+
+        for table, count in sorted(progress["counts"].items()):
+            self.stdout.write(f"{table}: {count}")
+        total = sum(progress["counts"].values())
+        if progress.get("completed"):
+            self.stdout.write(
+                self.style.SUCCESS(f"Completed, {total} rows soft deleted")
+            )
+        else:
+            self.stdout.write(
+                f"Running, at {progress['relation']} after "
+                f"{progress['last_pk']}, {total} rows soft deleted so far"
+            )
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.15 on 2026-10-18 01:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("db", "0076_cycle_module_burndown_snapshots"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="webhook",
+            name="batch_delivery",
+            field=models.BooleanField(default=False),
+        ),
+    ]
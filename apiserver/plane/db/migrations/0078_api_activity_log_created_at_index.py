@@ -0,0 +1,19 @@
+# Generated by Django 4.2.15 on 2026-10-18 01:34
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("db", "0077_webhook_batch_delivery"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="apiactivitylog",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["created_at"], name="api_logs_created_at_brin"
+            ),
+        ),
+    ]
@@ -2,7 +2,14 @@ from .analytic import AnalyticView
 from .api import APIActivityLog, APIToken
 from .asset import FileAsset
 from .base import BaseModel
-from .cycle import Cycle, CycleFavorite, CycleIssue, CycleUserProperties
+from .cycle import (
+    Cycle,
+    CycleBurndownSnapshot,
+    CycleFavorite,
+    CycleIssue,
+    CycleIssueRollup,
+    CycleUserProperties,
+)
 from .dashboard import Dashboard, DashboardWidget, Widget
 from .deploy_board import DeployBoard
 from .estimate import Estimate, EstimatePoint
@@ -33,14 +40,17 @@ from .issue import (
     IssueReaction,
     IssueRelation,
     IssueSequence,
+    IssueSequenceCounter,
     IssueSubscriber,
     IssueVote,
     Label,
 )
 from .module import (
     Module,
+    ModuleBurndownSnapshot,
     ModuleFavorite,
     ModuleIssue,
+    ModuleIssueRollup,
     ModuleLink,
     ModuleMember,
     ModuleUserProperties,
@@ -112,3 +122,5 @@ from .favorite import UserFavorite
 from .issue_type import IssueType
 
 from .recent_visit import UserRecentVisit
+
+from .search import SearchDocument
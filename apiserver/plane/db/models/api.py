@@ -4,8 +4,12 @@ from uuid import uuid4
 # Django imports
 from django.db import models
 from django.conf import settings
+from django.contrib.postgres.indexes import BrinIndex
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from .base import BaseModel
+from plane.db.signals import soft_deleted
 
 
 def generate_label_token():
@@ -56,6 +60,25 @@ class APIToken(BaseModel):
         return str(self.user.id)
 
 
+@receiver(post_save, sender=APIToken)
+@receiver(post_delete, sender=APIToken)
+def invalidate_api_token_cache(sender, instance, **kwargs):
+    # Revoked and updated tokens are resolved again on their next use
+    from plane.utils.api_token_cache import invalidate_api_token
+
+    invalidate_api_token(instance.token)
+
+
+@receiver(soft_deleted, sender=APIToken)
+def invalidate_deleted_api_tokens(sender, pks, **kwargs):
+    from plane.utils.api_token_cache import invalidate_api_token
+
+    for token in APIToken.all_objects.filter(pk__in=pks).values_list(
+        "token", flat=True
+    ):
+        invalidate_api_token(token)
+
+
 class APIActivityLog(BaseModel):
     token_identifier = models.CharField(max_length=255)
 
@@ -79,6 +102,10 @@ class APIActivityLog(BaseModel):
         verbose_name_plural = "API Activity Logs"
         db_table = "api_activity_logs"
         ordering = ("-created_at",)
+        # Logs are appended in time order, a block range index stays tiny
+        indexes = [
+            BrinIndex(fields=["created_at"], name="api_logs_created_at_brin")
+        ]
 
     def __str__(self):
         return str(self.token_identifier)
@@ -1,9 +1,12 @@
 # Django imports
 from django.conf import settings
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Module imports
 from .project import ProjectBaseModel
+from plane.db.signals import soft_deleted
 
 
 def get_default_filters():
@@ -94,6 +97,27 @@ class Cycle(ProjectBaseModel):
         return f"{self.name} <{self.project.name}>"
 
 
+@receiver(post_save, sender=Cycle)
+def index_cycle(sender, instance, update_fields=None, **kwargs):
+    from plane.utils.search import update_search_document
+
+    update_search_document(instance, update_fields)
+
+
+@receiver(post_delete, sender=Cycle)
+def remove_cycle_search_document(sender, instance, **kwargs):
+    from plane.utils.search import remove_search_document
+
+    remove_search_document(instance)
+
+
+@receiver(soft_deleted, sender=Cycle)
+def remove_deleted_cycle_search_documents(sender, pks, **kwargs):
+    from plane.utils.search import remove_search_documents
+
+    remove_search_documents("cycle", pks)
+
+
 class CycleIssue(ProjectBaseModel):
     """
     Cycle Issues
@@ -116,6 +140,64 @@ class CycleIssue(ProjectBaseModel):
         return f"{self.cycle}"
 
 
+@receiver(soft_deleted, sender=CycleIssue)
+def refresh_deleted_cycle_issue_rollups(sender, pks, **kwargs):
+    from plane.utils.issue_rollup import refresh_cycle_rollups
+
+    # Issues deleted through a cascade leave the counts of their cycles
+    refresh_cycle_rollups(
+        CycleIssue.all_objects.filter(pk__in=pks)
+        .values_list("cycle_id", flat=True)
+        .distinct()
+    )
+
+
+class CycleIssueRollup(ProjectBaseModel):
+    """
+    Issue count and estimate points of a cycle per state group
+    """
+
+    cycle = models.ForeignKey(
+        Cycle, on_delete=models.CASCADE, related_name="issue_rollups"
+    )
+    state_group = models.CharField(max_length=20)
+    issue_count = models.IntegerField(default=0)
+    estimate_points = models.FloatField(default=0)
+
+    class Meta:
+        unique_together = ["cycle", "state_group"]
+        verbose_name = "Cycle Issue Rollup"
+        verbose_name_plural = "Cycle Issue Rollups"
+        db_table = "cycle_issue_rollups"
+        ordering = ("-created_at",)
+
+    def __str__(self):
+        return f"{self.cycle_id} {self.state_group}"
+
+
+class CycleBurndownSnapshot(ProjectBaseModel):
+    """
+    Pending issues and estimate points of a cycle at the end of a day
+    """
+
+    cycle = models.ForeignKey(
+        Cycle, on_delete=models.CASCADE, related_name="burndown_snapshots"
+    )
+    date = models.DateField()
+    pending_issues = models.IntegerField(default=0)
+    pending_estimate_points = models.FloatField(default=0)
+
+    class Meta:
+        unique_together = ["cycle", "date"]
+        verbose_name = "Cycle Burndown Snapshot"
+        verbose_name_plural = "Cycle Burndown Snapshots"
+        db_table = "cycle_burndown_snapshots"
+        ordering = ("-created_at",)
+
+    def __str__(self):
+        return f"{self.cycle_id} {self.date}"
+
+
 # DEPRECATED TODO: - Remove in next release
 class CycleFavorite(ProjectBaseModel):
     """_summary_
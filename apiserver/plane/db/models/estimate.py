@@ -2,6 +2,8 @@
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 from django.db.models import Q
+from django.db.models.signals import post_save
+from django.dispatch import receiver
 
 # Module imports
 from .project import ProjectBaseModel
@@ -55,3 +57,21 @@ class EstimatePoint(ProjectBaseModel):
         verbose_name_plural = "Estimate Points"
         db_table = "estimate_points"
         ordering = ("value",)
+
+
+@receiver(post_save, sender=Estimate)
+@receiver(post_save, sender=EstimatePoint)
+def refresh_estimate_point_rollups(sender, instance, created, **kwargs):
+    from plane.bgtasks.issue_rollup_task import refresh_estimate_rollups
+
+    # Only the points of estimates of the points type are summed
+    if not created:
+        refresh_estimate_rollups.delay(
+            [
+                str(
+                    instance.id
+                    if sender is Estimate
+                    else instance.estimate_id
+                )
+            ]
+        )
@@ -7,6 +7,8 @@ from django.contrib.postgres.fields import ArrayField
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils import timezone
 from django.db.models import Q
 
@@ -14,6 +16,7 @@ from django.db.models import Q
 from plane.utils.html_processor import strip_tags
 
 from .project import ProjectBaseModel
+from plane.db.signals import soft_deleted
 
 
 def get_default_properties():
@@ -212,28 +215,27 @@ class Issue(ProjectBaseModel):
                 pass
 
         if self._state.adding:
-            with transaction.atomic():
-                last_sequence = (
-                    IssueSequence.objects.filter(project=self.project)
-                    .select_for_update()
-                    .aggregate(largest=models.Max("sequence"))["largest"]
-                )
-                self.sequence_id = last_sequence + 1 if last_sequence else 1
-                # Strip the html tags using html parser
-                self.description_stripped = (
-                    None
-                    if (
-                        self.description_html == ""
-                        or self.description_html is None
-                    )
-                    else strip_tags(self.description_html)
+            from plane.utils.issue_sequence import (
+                next_issue_sort_order,
+                reserve_issue_sequences,
+            )
+
+            # Strip the html tags using html parser
+            self.description_stripped = (
+                None
+                if (
+                    self.description_html == ""
+                    or self.description_html is None
                 )
-                largest_sort_order = Issue.objects.filter(
-                    project=self.project, state=self.state
-                ).aggregate(largest=models.Max("sort_order"))["largest"]
-                if largest_sort_order is not None:
-                    self.sort_order = largest_sort_order + 10000
+                else strip_tags(self.description_html)
+            )
+            self.sort_order = next_issue_sort_order(
+                self.project_id, self.state_id
+            )
 
+            with transaction.atomic():
+                # The counter row of the project stays locked until commit
+                self.sequence_id = reserve_issue_sequences(self.project)
                 super(Issue, self).save(*args, **kwargs)
 
                 IssueSequence.objects.create(
@@ -256,6 +258,27 @@ class Issue(ProjectBaseModel):
         return f"{self.name} <{self.project.name}>"
 
 
+@receiver(post_save, sender=Issue)
+def index_issue(sender, instance, update_fields=None, **kwargs):
+    from plane.utils.search import update_search_document
+
+    update_search_document(instance, update_fields)
+
+
+@receiver(post_delete, sender=Issue)
+def remove_issue_search_document(sender, instance, **kwargs):
+    from plane.utils.search import remove_search_document
+
+    remove_search_document(instance)
+
+
+@receiver(soft_deleted, sender=Issue)
+def remove_deleted_issue_search_documents(sender, pks, **kwargs):
+    from plane.utils.search import remove_search_documents
+
+    remove_search_documents("issue", pks)
+
+
 class IssueBlocker(ProjectBaseModel):
     block = models.ForeignKey(
         Issue, related_name="blocker_issues", on_delete=models.CASCADE
@@ -368,6 +391,34 @@ class IssueAssignee(ProjectBaseModel):
         return f"{self.issue.name} {self.assignee.email}"
 
 
+@receiver(post_save, sender=Issue)
+@receiver(post_delete, sender=Issue)
+@receiver(post_save, sender=IssueAssignee)
+@receiver(post_delete, sender=IssueAssignee)
+def invalidate_issue_dashboard_stats(
+    sender, instance, update_fields=None, **kwargs
+):
+    from plane.utils.dashboard_stats import (
+        invalidate_dashboard_stats,
+        is_dashboard_stats_update,
+    )
+
+    if is_dashboard_stats_update(update_fields):
+        invalidate_dashboard_stats([instance.project_id])
+
+
+@receiver(soft_deleted, sender=Issue)
+@receiver(soft_deleted, sender=IssueAssignee)
+def invalidate_deleted_issue_dashboard_stats(sender, pks, **kwargs):
+    from plane.utils.dashboard_stats import invalidate_dashboard_stats
+
+    invalidate_dashboard_stats(
+        sender.all_objects.filter(pk__in=pks)
+        .values_list("project_id", flat=True)
+        .distinct()
+    )
+
+
 class IssueLink(ProjectBaseModel):
     title = models.CharField(max_length=255, null=True, blank=True)
     url = models.TextField()
@@ -627,6 +678,25 @@ class IssueSequence(ProjectBaseModel):
         ordering = ("-created_at",)
 
 
+class IssueSequenceCounter(ProjectBaseModel):
+    """
+    Last sequence id handed out in a project, incremented in place so that
+    issue creation never scans the sequences of the project
+    """
+
+    last_sequence = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        unique_together = ["project"]
+        verbose_name = "Issue Sequence Counter"
+        verbose_name_plural = "Issue Sequence Counters"
+        db_table = "issue_sequence_counters"
+        ordering = ("-created_at",)
+
+    def __str__(self):
+        return f"{self.project_id} {self.last_sequence}"
+
+
 class IssueSubscriber(ProjectBaseModel):
     issue = models.ForeignKey(
         Issue, on_delete=models.CASCADE, related_name="issue_subscribers"
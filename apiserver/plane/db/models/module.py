@@ -1,10 +1,13 @@
 # Django imports
 from django.conf import settings
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.db.models import Q
 
 # Module imports
 from .project import ProjectBaseModel
+from plane.db.signals import soft_deleted
 
 
 def get_default_filters():
@@ -125,6 +128,27 @@ class Module(ProjectBaseModel):
         return f"{self.name} {self.start_date} {self.target_date}"
 
 
+@receiver(post_save, sender=Module)
+def index_module(sender, instance, update_fields=None, **kwargs):
+    from plane.utils.search import update_search_document
+
+    update_search_document(instance, update_fields)
+
+
+@receiver(post_delete, sender=Module)
+def remove_module_search_document(sender, instance, **kwargs):
+    from plane.utils.search import remove_search_document
+
+    remove_search_document(instance)
+
+
+@receiver(soft_deleted, sender=Module)
+def remove_deleted_module_search_documents(sender, pks, **kwargs):
+    from plane.utils.search import remove_search_documents
+
+    remove_search_documents("module", pks)
+
+
 class ModuleMember(ProjectBaseModel):
     module = models.ForeignKey("db.Module", on_delete=models.CASCADE)
     member = models.ForeignKey("db.User", on_delete=models.CASCADE)
@@ -173,6 +197,64 @@ class ModuleIssue(ProjectBaseModel):
         return f"{self.module.name} {self.issue.name}"
 
 
+@receiver(soft_deleted, sender=ModuleIssue)
+def refresh_deleted_module_issue_rollups(sender, pks, **kwargs):
+    from plane.utils.issue_rollup import refresh_module_rollups
+
+    # Issues deleted through a cascade leave the counts of their modules
+    refresh_module_rollups(
+        ModuleIssue.all_objects.filter(pk__in=pks)
+        .values_list("module_id", flat=True)
+        .distinct()
+    )
+
+
+class ModuleIssueRollup(ProjectBaseModel):
+    """
+    Issue count and estimate points of a module per state group
+    """
+
+    module = models.ForeignKey(
+        "db.Module", on_delete=models.CASCADE, related_name="issue_rollups"
+    )
+    state_group = models.CharField(max_length=20)
+    issue_count = models.IntegerField(default=0)
+    estimate_points = models.FloatField(default=0)
+
+    class Meta:
+        unique_together = ["module", "state_group"]
+        verbose_name = "Module Issue Rollup"
+        verbose_name_plural = "Module Issue Rollups"
+        db_table = "module_issue_rollups"
+        ordering = ("-created_at",)
+
+    def __str__(self):
+        return f"{self.module_id} {self.state_group}"
+
+
+class ModuleBurndownSnapshot(ProjectBaseModel):
+    """
+    Pending issues and estimate points of a module at the end of a day
+    """
+
+    module = models.ForeignKey(
+        "db.Module", on_delete=models.CASCADE, related_name="burndown_snapshots"
+    )
+    date = models.DateField()
+    pending_issues = models.IntegerField(default=0)
+    pending_estimate_points = models.FloatField(default=0)
+
+    class Meta:
+        unique_together = ["module", "date"]
+        verbose_name = "Module Burndown Snapshot"
+        verbose_name_plural = "Module Burndown Snapshots"
+        db_table = "module_burndown_snapshots"
+        ordering = ("-created_at",)
+
+    def __str__(self):
+        return f"{self.module_id} {self.date}"
+
+
 class ModuleLink(ProjectBaseModel):
     title = models.CharField(max_length=255, blank=True, null=True)
     url = models.URLField()
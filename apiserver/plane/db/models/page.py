@@ -5,12 +5,15 @@ from django.utils import timezone
 
 # Django imports
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Module imports
 from plane.utils.html_processor import strip_tags
 
 from .project import ProjectBaseModel
 from .base import BaseModel
+from plane.db.signals import soft_deleted
 
 
 def get_view_props():
@@ -77,6 +80,27 @@ class Page(BaseModel):
         super(Page, self).save(*args, **kwargs)
 
 
+@receiver(post_save, sender=Page)
+def index_page(sender, instance, update_fields=None, **kwargs):
+    from plane.utils.search import update_search_document
+
+    update_search_document(instance, update_fields)
+
+
+@receiver(post_delete, sender=Page)
+def remove_page_search_document(sender, instance, **kwargs):
+    from plane.utils.search import remove_search_document
+
+    remove_search_document(instance)
+
+
+@receiver(soft_deleted, sender=Page)
+def remove_deleted_page_search_documents(sender, pks, **kwargs):
+    from plane.utils.search import remove_search_documents
+
+    remove_search_documents("page", pks)
+
+
 class PageLog(BaseModel):
     TYPE_CHOICES = (
         ("to_do", "To Do"),
@@ -6,9 +6,12 @@ from django.conf import settings
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Modeule imports
 from plane.db.mixins import AuditModel
+from plane.db.signals import soft_deleted
 
 # Module imports
 from .base import BaseModel
@@ -232,6 +235,26 @@ class ProjectMember(ProjectBaseModel):
         return f"{self.member.email} <{self.project.name}>"
 
 
+@receiver(post_save, sender=ProjectMember)
+@receiver(post_delete, sender=ProjectMember)
+def invalidate_project_membership(sender, instance, **kwargs):
+    # Cached roles of the member are resolved again on their next request
+    from plane.utils.membership import invalidate_membership
+
+    invalidate_membership([instance.member_id])
+
+
+@receiver(soft_deleted, sender=ProjectMember)
+def invalidate_deleted_project_memberships(sender, pks, **kwargs):
+    from plane.utils.membership import invalidate_membership
+
+    invalidate_membership(
+        ProjectMember.all_objects.filter(pk__in=pks).values_list(
+            "member_id", flat=True
+        )
+    )
+
+
 # TODO: Remove workspace relation later
 class ProjectIdentifier(AuditModel):
     workspace = models.ForeignKey(
@@ -0,0 +1,41 @@
+# Django imports
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+from django.db.models.functions import Upper
+
+# Module imports
+from .workspace import WorkspaceBaseModel
+
+
+class SearchDocument(WorkspaceBaseModel):
+    """
+    Searchable text of an issue, page, cycle, module or view, indexed for
+    full text search and for trigram matching of the name
+    """
+
+    entity_name = models.CharField(max_length=30)
+    entity_identifier = models.UUIDField()
+    name = models.TextField(blank=True)
+    content = models.TextField(blank=True)
+    search_vector = SearchVectorField(null=True)
+
+    class Meta:
+        unique_together = ["entity_name", "entity_identifier"]
+        indexes = [
+            GinIndex(
+                fields=["search_vector"], name="search_document_vector_idx"
+            ),
+            # Serves the case insensitive substring matches of names
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="search_document_name_trgm_idx",
+            ),
+        ]
+        verbose_name = "Search Document"
+        verbose_name_plural = "Search Documents"
+        db_table = "search_documents"
+        ordering = ("-created_at",)
+
+    def __str__(self):
+        return f"{self.entity_name} {self.entity_identifier}"
@@ -1,5 +1,7 @@
 # Django imports
 from django.db import models
+from django.db.models.signals import post_save
+from django.dispatch import receiver
 from django.template.defaultfilters import slugify
 from django.db.models import Q
 
@@ -62,3 +64,14 @@ class State(ProjectBaseModel):
                 self.sequence = last_id + 15000
 
         return super().save(*args, **kwargs)
+
+
+@receiver(post_save, sender=State)
+def refresh_state_group_rollups(
+    sender, instance, created, update_fields=None, **kwargs
+):
+    from plane.bgtasks.issue_rollup_task import refresh_state_rollups
+
+    # The rollups count the issues of a cycle or module per state group
+    if not created and (update_fields is None or "group" in update_fields):
+        refresh_state_rollups.delay([str(instance.id)])
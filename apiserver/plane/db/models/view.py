@@ -1,11 +1,14 @@
 # Django imports
 from django.conf import settings
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Module import
 from .base import BaseModel
 from .project import ProjectBaseModel
 from .workspace import WorkspaceBaseModel
+from plane.db.signals import soft_deleted
 from plane.utils.issue_filters import issue_filters
 
 
@@ -141,6 +144,27 @@ class IssueView(WorkspaceBaseModel):
         return f"{self.name} <{self.project.name}>"
 
 
+@receiver(post_save, sender=IssueView)
+def index_issue_view(sender, instance, update_fields=None, **kwargs):
+    from plane.utils.search import update_search_document
+
+    update_search_document(instance, update_fields)
+
+
+@receiver(post_delete, sender=IssueView)
+def remove_issue_view_search_document(sender, instance, **kwargs):
+    from plane.utils.search import remove_search_document
+
+    remove_search_document(instance)
+
+
+@receiver(soft_deleted, sender=IssueView)
+def remove_deleted_issue_view_search_documents(sender, pks, **kwargs):
+    from plane.utils.search import remove_search_documents
+
+    remove_search_documents("issue_view", pks)
+
+
 # DEPRECATED TODO: - Remove in next release
 class IssueViewFavorite(ProjectBaseModel):
     user = models.ForeignKey(
@@ -2,9 +2,12 @@
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Module imports
 from .base import BaseModel
+from plane.db.signals import soft_deleted
 from plane.utils.constants import RESTRICTED_WORKSPACE_SLUGS
 
 ROLE_CHOICES = (
@@ -203,6 +206,25 @@ class WorkspaceMember(BaseModel):
         return f"{self.member.email} <{self.workspace.name}>"
 
 
+@receiver(post_save, sender=WorkspaceMember)
+@receiver(post_delete, sender=WorkspaceMember)
+def invalidate_workspace_membership(sender, instance, **kwargs):
+    from plane.utils.membership import invalidate_membership
+
+    invalidate_membership([instance.member_id])
+
+
+@receiver(soft_deleted, sender=WorkspaceMember)
+def invalidate_deleted_workspace_memberships(sender, pks, **kwargs):
+    from plane.utils.membership import invalidate_membership
+
+    invalidate_membership(
+        WorkspaceMember.all_objects.filter(pk__in=pks).values_list(
+            "member_id", flat=True
+        )
+    )
+
+
 class WorkspaceMemberInvite(BaseModel):
     workspace = models.ForeignKey(
         "db.Workspace",
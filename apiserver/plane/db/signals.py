@@ -0,0 +1,7 @@
+# Django imports
+from django.dispatch import Signal
+
+# Sent with the model as the sender and the primary keys of the rows that a
+# soft delete cascade marked as deleted with a single update, such rows do
+# not go through save so the receivers of post_save are not called for them
+soft_deleted = Signal()
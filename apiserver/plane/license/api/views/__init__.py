@@ -1,5 +1,6 @@
 from .instance import (
     InstanceEndpoint,
+    InstanceMetricsEndpoint,
     SignUpScreenVisitedEndpoint,
 )
 
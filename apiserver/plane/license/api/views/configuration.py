@@ -27,6 +27,7 @@ from plane.license.utils.encryption import encrypt_data
 from plane.utils.cache import cache_response, invalidate_cache
 from plane.license.utils.instance_value import (
     get_email_configuration,
+    invalidate_configuration_values,
 )
 
 
@@ -62,6 +63,8 @@ class InstanceConfigurationEndpoint(BaseAPIView):
         InstanceConfiguration.objects.bulk_update(
             bulk_configurations, ["value"], batch_size=100
         )
+        # Bulk updates do not send the save signals
+        invalidate_configuration_values()
 
         serializer = InstanceConfigurationSerializer(configurations, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
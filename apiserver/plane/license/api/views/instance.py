@@ -23,6 +23,7 @@ from plane.license.utils.instance_value import (
     get_configuration_value,
 )
 from plane.utils.cache import cache_response, invalidate_cache
+from plane.utils.metrics import get_metrics
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_control
 
@@ -212,3 +213,12 @@ class SignUpScreenVisitedEndpoint(BaseAPIView):
         instance.is_signup_screen_visited = True
         instance.save()
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class InstanceMetricsEndpoint(BaseAPIView):
+    permission_classes = [
+        InstanceAdminPermission,
+    ]
+
+    def get(self, request):
+        return Response(get_metrics(), status=status.HTTP_200_OK)
@@ -4,6 +4,8 @@ from enum import Enum
 # Django imports
 from django.db import models
 from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Module imports
 from plane.db.models import BaseModel
@@ -83,6 +85,16 @@ class InstanceConfiguration(BaseModel):
         ordering = ("-created_at",)
 
 
+@receiver(post_save, sender=InstanceConfiguration)
+@receiver(post_delete, sender=InstanceConfiguration)
+def invalidate_instance_configuration(sender, instance, **kwargs):
+    from plane.license.utils.instance_value import (
+        invalidate_configuration_values,
+    )
+
+    invalidate_configuration_values()
+
+
 class ChangeLog(BaseModel):
     """Change Log model to store the release changelogs made in the application."""
 
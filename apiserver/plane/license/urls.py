@@ -7,6 +7,7 @@ from plane.license.api.views import (
     InstanceAdminSignUpEndpoint,
     InstanceConfigurationEndpoint,
     InstanceEndpoint,
+    InstanceMetricsEndpoint,
     SignUpScreenVisitedEndpoint,
     InstanceAdminUserMeEndpoint,
     InstanceAdminSignOutEndpoint,
@@ -69,4 +70,9 @@ urlpatterns = [
         EmailCredentialCheckEndpoint.as_view(),
         name="email-credential-check",
     ),
+    path(
+        "metrics/",
+        InstanceMetricsEndpoint.as_view(),
+        name="instance-metrics",
+    ),
 ]
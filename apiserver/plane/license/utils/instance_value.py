@@ -1,36 +1,108 @@
 # Python imports
+import logging
 import os
+import threading
+import time
+from uuid import uuid4
 
 # Django imports
 from django.conf import settings
+from django.core.cache import cache
 
 # Module imports
 from plane.license.models import InstanceConfiguration
 from plane.license.utils.encryption import decrypt_data
 
+# Changed whenever a configuration is written, every process reloads its
+# decrypted values once it sees a new version
+INSTANCE_CONFIGURATION_VERSION_KEY = "instance:configuration:version"
+
+logger = logging.getLogger("plane")
+
+
+class ConfigurationCache:
+    """Decrypted configuration values of the process, keyed by their key"""
+
+    def __init__(self):
+        self.values = None
+        self.version = None
+        self.checked_at = 0
+        self.lock = threading.Lock()
+
+    def get_version(self):
+        version = cache.get(INSTANCE_CONFIGURATION_VERSION_KEY)
+        if version is None:
+            version = uuid4().hex
+            if not cache.add(
+                INSTANCE_CONFIGURATION_VERSION_KEY, version, None
+            ):
+                version = cache.get(INSTANCE_CONFIGURATION_VERSION_KEY)
+        return version
+
+    def get_values(self):
+        now = time.monotonic()
+        if (
+            self.values is not None
+            and now - self.checked_at
+            < settings.INSTANCE_CONFIGURATION_CHECK_INTERVAL
+        ):
+            return self.values
+
+        with self.lock:
+            try:
+                version = self.get_version()
+            except Exception as e:
+                logger.warning(f"Configuration version was not read: {e}")
+                return load_configuration_values()
+            if self.values is None or version != self.version:
+                self.values = load_configuration_values()
+                self.version = version
+            self.checked_at = now
+            return self.values
+
+    def clear(self):
+        with self.lock:
+            self.values = None
+            self.version = None
+
+
+configuration_cache = ConfigurationCache()
+
+
+def load_configuration_values():
+    return {
+        item["key"]: (
+            decrypt_data(item["value"])
+            if item["is_encrypted"]
+            else item["value"]
+        )
+        for item in InstanceConfiguration.objects.values(
+            "key", "value", "is_encrypted"
+        )
+    }
+
+
+def invalidate_configuration_values():
+    """Make every process reload the configuration on its next lookup"""
+    configuration_cache.clear()
+    try:
+        cache.set(INSTANCE_CONFIGURATION_VERSION_KEY, uuid4().hex, None)
+    except Exception as e:
+        logger.warning(f"Configuration version was not changed: {e}")
+
 
 # Helper function to return value from the passed key
 def get_configuration_value(keys):
     environment_list = []
     if settings.SKIP_ENV_VAR:
         # Get the configurations
-        instance_configuration = InstanceConfiguration.objects.values(
-            "key", "value", "is_encrypted"
-        )
-
+        values = configuration_cache.get_values()
         for key in keys:
-            for item in instance_configuration:
-                if key.get("key") == item.get("key"):
-                    if item.get("is_encrypted", False):
-                        environment_list.append(
-                            decrypt_data(item.get("value"))
-                        )
-                    else:
-                        environment_list.append(item.get("value"))
-
-                    break
-            else:
-                environment_list.append(key.get("default"))
+            environment_list.append(
+                values[key["key"]]
+                if key["key"] in values
+                else key.get("default")
+            )
     else:
         # Get the configuration from os
         for key in keys:
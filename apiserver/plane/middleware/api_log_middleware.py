@@ -1,4 +1,112 @@
+# Python imports
+import atexit
+import logging
+import os
+import queue
+import random
+import threading
+
+# Django imports
+from django.conf import settings
+from django.db import connection
+
+# Module imports
 from plane.db.models import APIActivityLog
+from plane.utils.metrics import increment_metric
+
+logger = logging.getLogger("plane")
+
+
+class APILogBuffer:
+    """
+    Bounded in process buffer of API logs, drained with bulk inserts by a
+    background thread so requests never wait on the database. Logs are
+    dropped and counted when the buffer is full.
+    """
+
+    def __init__(self, capacity, batch_size, flush_interval):
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self.pid = None
+        self.lock = threading.Lock()
+
+    def start(self):
+        # Threads do not survive a fork, every worker process starts its own
+        with self.lock:
+            if self.pid == os.getpid():
+                return
+            self.logs = queue.Queue(maxsize=self.capacity)
+            self.wakeup = threading.Event()
+            threading.Thread(
+                target=self.run, name="api-log-flusher", daemon=True
+            ).start()
+            self.pid = os.getpid()
+
+    def add(self, log):
+        if self.pid != os.getpid():
+            self.start()
+        try:
+            self.logs.put_nowait(log)
+        except queue.Full:
+            self.dropped += 1
+            return
+        if self.logs.qsize() >= self.batch_size:
+            self.wakeup.set()
+
+    def run(self):
+        while True:
+            self.wakeup.wait(self.flush_interval)
+            self.wakeup.clear()
+            self.flush()
+
+    def flush(self):
+        logs = []
+        while True:
+            try:
+                logs.append(self.logs.get_nowait())
+            except queue.Empty:
+                break
+
+        dropped, self.dropped = self.dropped, 0
+        if dropped:
+            increment_metric("api_log.dropped", dropped)
+        if not logs:
+            return
+
+        try:
+            APIActivityLog.objects.bulk_create(
+                logs, batch_size=self.batch_size
+            )
+            increment_metric("api_log.written", len(logs))
+        except Exception as e:
+            logger.warning(f"Dropped {len(logs)} API logs: {e}")
+            increment_metric("api_log.dropped", len(logs))
+        finally:
+            # The flusher thread holds its own connection
+            connection.close()
+
+
+api_log_buffer = APILogBuffer(
+    capacity=settings.API_LOG_BUFFER_SIZE,
+    batch_size=settings.API_LOG_BATCH_SIZE,
+    flush_interval=settings.API_LOG_FLUSH_INTERVAL,
+)
+
+
+@atexit.register
+def flush_api_logs():
+    if api_log_buffer.pid == os.getpid():
+        api_log_buffer.flush()
+
+
+def truncate(value):
+    if not value:
+        return None
+    value = value.decode("utf-8", errors="replace")
+    limit = settings.API_LOG_BODY_LIMIT
+    return value[:limit] if limit else value
 
 
 class APITokenLogMiddleware:
@@ -16,24 +124,31 @@ class APITokenLogMiddleware:
         api_key = request.headers.get(api_key_header)
         # If the API key is present, log the request
         if api_key:
+            user_agent = request.META.get("HTTP_USER_AGENT", None)
+            # Failed requests are always logged
+            if (
+                response.status_code < 400
+                and random.random() >= settings.API_LOG_SAMPLE_RATE
+            ):
+                return None
             try:
-                APIActivityLog.objects.create(
-                    token_identifier=api_key,
-                    path=request.path,
-                    method=request.method,
-                    query_params=request.META.get("QUERY_STRING", ""),
-                    headers=str(request.headers),
-                    body=(
-                        request_body.decode("utf-8") if request_body else None
-                    ),
-                    response_body=(
-                        response.content.decode("utf-8")
-                        if response.content
-                        else None
-                    ),
-                    response_code=response.status_code,
-                    ip_address=request.META.get("REMOTE_ADDR", None),
-                    user_agent=request.META.get("HTTP_USER_AGENT", None),
+                api_log_buffer.add(
+                    APIActivityLog(
+                        token_identifier=api_key[:255],
+                        path=request.path[:255],
+                        method=request.method,
+                        query_params=request.META.get("QUERY_STRING", ""),
+                        headers=str(request.headers),
+                        body=truncate(request_body),
+                        response_body=(
+                            truncate(response.content)
+                            if not response.streaming
+                            else None
+                        ),
+                        response_code=response.status_code,
+                        ip_address=request.META.get("REMOTE_ADDR", None),
+                        user_agent=user_agent[:512] if user_agent else None,
+                    )
                 )
 
             except Exception as e:
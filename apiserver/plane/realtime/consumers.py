@@ -0,0 +1,84 @@
+# Python imports
+import time
+
+# Third party imports
+from asgiref.sync import async_to_sync
+from channels.generic.websocket import JsonWebsocketConsumer
+
+# Module imports
+from plane.realtime.events import project_group, workspace_group
+from plane.utils.membership import get_cached_membership
+from plane.utils.metrics import increment_metric, observe_metric
+
+
+class PushConsumer(JsonWebsocketConsumer):
+    """
+    Websocket of a member in a workspace, pushing the notifications of the
+    member and the changes of the projects it subscribed to. Clients send
+    {"action": "subscribe" | "unsubscribe", "project_id": ...}
+    """
+
+    def connect(self):
+        self.slug = self.scope["url_route"]["kwargs"]["slug"]
+        self.subscriptions = set()
+        user = self.scope.get("user")
+        if user is None or not user.is_authenticated:
+            self.close()
+            return
+        self.user_id = str(user.id)
+        if get_cached_membership(user.id, self.slug).workspace_role is None:
+            self.close()
+            return
+
+        self.join(workspace_group(self.slug))
+        self.accept()
+        increment_metric("realtime.connections")
+
+    def disconnect(self, code):
+        if not self.subscriptions:
+            return
+        for group in list(self.subscriptions):
+            self.leave(group)
+        increment_metric("realtime.connections", -1)
+
+    def join(self, group):
+        async_to_sync(self.channel_layer.group_add)(group, self.channel_name)
+        self.subscriptions.add(group)
+
+    def leave(self, group):
+        async_to_sync(self.channel_layer.group_discard)(
+            group, self.channel_name
+        )
+        self.subscriptions.discard(group)
+
+    def receive_json(self, content, **kwargs):
+        action = content.get("action")
+        project_id = str(content.get("project_id"))
+        if action == "unsubscribe":
+            self.leave(project_group(project_id))
+        elif action == "subscribe":
+            # Read again so that removed members stop receiving changes
+            membership = get_cached_membership(self.user_id, self.slug)
+            if project_id not in membership.project_ids:
+                self.send_json(
+                    {"error": "You are not a member of this project"}
+                )
+                return
+            self.join(project_group(project_id))
+        else:
+            self.send_json(
+                {"error": "Action should be subscribe or unsubscribe"}
+            )
+
+    def push_events(self, message):
+        events = [
+            event
+            for event in message["events"]
+            if event.get("receiver_id") in (None, self.user_id)
+        ]
+        if not events:
+            return
+        self.send_json({"events": events})
+        observe_metric(
+            "realtime.fanout_seconds", time.time() - message["sent_at"]
+        )
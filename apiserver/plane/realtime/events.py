@@ -0,0 +1,95 @@
+# Python imports
+import logging
+import time
+from collections import Counter
+
+# Third party imports
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+
+# Module imports
+from plane.utils.metrics import increment_metric
+
+# Handler of the consumers receiving the events sent to their groups
+PUSH_EVENTS_TYPE = "push.events"
+
+logger = logging.getLogger("plane")
+
+
+def workspace_group(slug):
+    return f"workspace.{slug}"
+
+
+def project_group(project_id):
+    return f"project.{project_id}"
+
+
+def publish_events(group, events):
+    """
+    Send compact change events to the connections of a group, pushing
+    never fails the caller and clients fall back to fetching on reconnect
+    """
+    if not events:
+        return
+    try:
+        async_to_sync(get_channel_layer().group_send)(
+            group,
+            {
+                "type": PUSH_EVENTS_TYPE,
+                "events": events,
+                "sent_at": time.time(),
+            },
+        )
+        increment_metric("realtime.events", len(events))
+    except Exception as e:
+        logger.warning(f"Events of {group} were not pushed: {e}")
+
+
+def publish_issue_events(project_id, issue_ids, activities=()):
+    """Issues changed in a project and the activities recorded for them"""
+    issue_ids = sorted({str(issue_id) for issue_id in issue_ids if issue_id})
+    events = []
+    if issue_ids:
+        events.append(
+            {
+                "event": "issue.updated",
+                "project_id": str(project_id),
+                "issue_ids": issue_ids,
+            }
+        )
+    if activities:
+        events.append(
+            {
+                "event": "activity.created",
+                "project_id": str(project_id),
+                "issue_ids": sorted(
+                    {
+                        str(activity.issue_id)
+                        for activity in activities
+                        if activity.issue_id
+                    }
+                ),
+                "activity_ids": [str(activity.id) for activity in activities],
+            }
+        )
+    publish_events(project_group(project_id), events)
+
+
+def publish_notification_events(slug, notifications):
+    """
+    New notifications of a workspace, sent once to the workspace and only
+    delivered to the connections of their receivers
+    """
+    publish_events(
+        workspace_group(slug),
+        [
+            {
+                "event": "notification.created",
+                "receiver_id": str(receiver_id),
+                "count": count,
+            }
+            for receiver_id, count in Counter(
+                notification.receiver_id for notification in notifications
+            ).items()
+        ],
+    )
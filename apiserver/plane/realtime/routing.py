@@ -0,0 +1,10 @@
+# Django imports
+from django.urls import path
+
+# Module imports
+from plane.realtime.consumers import PushConsumer
+
+# Served under /api/ which the proxy already forwards with the upgrade headers
+websocket_urlpatterns = [
+    path("api/ws/workspaces/<str:slug>/", PushConsumer.as_asgi()),
+]
@@ -10,6 +10,7 @@ import certifi
 # Third party imports
 import dj_database_url
 import sentry_sdk
+from kombu import Queue
 
 # Django imports
 from django.core.management.utils import get_random_secret_key
@@ -46,6 +47,7 @@ INSTALLED_APPS = [
     "plane.license",
     "plane.api",
     "plane.authentication",
+    "plane.realtime",
     # Third-party things
     "rest_framework",
     "corsheaders",
@@ -184,6 +186,22 @@ else:
         }
     }
 
+# Channel layer of the websocket push events, shared by the api and workers
+CHANNEL_LAYERS = {
+    "default": {
+        "BACKEND": "channels_redis.core.RedisChannelLayer",
+        "CONFIG": {
+            "hosts": [
+                (
+                    {"address": REDIS_URL, "ssl_cert_reqs": None}
+                    if REDIS_SSL
+                    else REDIS_URL
+                )
+            ]
+        },
+    }
+}
+
 # Password validations
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -274,10 +292,56 @@ CELERY_IMPORTS = (
     "plane.bgtasks.file_asset_task",
     "plane.bgtasks.email_notification_task",
     "plane.bgtasks.api_logs_task",
+    "plane.bgtasks.burndown_snapshot_task",
+    "plane.bgtasks.api_token_task",
+    "plane.bgtasks.notification_counter_task",
+    "plane.bgtasks.queue_depth_task",
     # management tasks
     "plane.bgtasks.dummy_data_task",
 )
 
+# Queues of the workers, every pool is sized on its own so that long bulk
+# tasks never hold back the emails and activities users wait for
+CELERY_TASK_DEFAULT_QUEUE = "default"
+CELERY_TASK_QUEUES = (
+    Queue("realtime"),
+    Queue("default"),
+    Queue("webhooks"),
+    Queue("bulk"),
+)
+CELERY_TASK_ROUTES = {
+    # Auth emails and the activity of user actions
+    "plane.bgtasks.magic_link_code_task.magic_link": {"queue": "realtime"},
+    "plane.bgtasks.forgot_password_task.forgot_password": {
+        "queue": "realtime"
+    },
+    "plane.bgtasks.workspace_invitation_task.workspace_invitation": {
+        "queue": "realtime"
+    },
+    "plane.bgtasks.project_invitation_task.project_invitation": {
+        "queue": "realtime"
+    },
+    "plane.bgtasks.user_activation_email_task.user_activation_email": {
+        "queue": "realtime"
+    },
+    "plane.bgtasks.issue_activities_task.issue_activity": {
+        "queue": "realtime"
+    },
+    "plane.bgtasks.notification_task.notifications": {"queue": "realtime"},
+    # Deliveries to external endpoints, retried with backoff
+    "plane.bgtasks.webhook_task.*": {"queue": "webhooks"},
+    # Exports, seeding, deletions and the daily maintenance
+    "plane.bgtasks.export_task.*": {"queue": "bulk"},
+    "plane.bgtasks.analytic_plot_export.*": {"queue": "bulk"},
+    "plane.bgtasks.deletion_task.*": {"queue": "bulk"},
+    "plane.bgtasks.dummy_data_task.*": {"queue": "bulk"},
+    "plane.bgtasks.issue_automation_task.*": {"queue": "bulk"},
+    "plane.bgtasks.exporter_expired_task.*": {"queue": "bulk"},
+    "plane.bgtasks.file_asset_task.*": {"queue": "bulk"},
+    "plane.bgtasks.api_logs_task.*": {"queue": "bulk"},
+    "plane.bgtasks.burndown_snapshot_task.*": {"queue": "bulk"},
+}
+
 # Sentry Settings
 # Enable Sentry Settings
 if bool(os.environ.get("SENTRY_DSN", False)) and os.environ.get(
@@ -354,3 +418,77 @@ SPACE_BASE_URL = os.environ.get("SPACE_BASE_URL", None)
 APP_BASE_URL = os.environ.get("APP_BASE_URL")
 
 HARD_DELETE_AFTER_DAYS = int(os.environ.get("HARD_DELETE_AFTER_DAYS", 60))
+# Rows of a model deleted per batch by the hard delete purge, with the
+# seconds it waits between two batches
+HARD_DELETE_BATCH_SIZE = int(os.environ.get("HARD_DELETE_BATCH_SIZE", 500))
+HARD_DELETE_BATCH_PAUSE = float(os.environ.get("HARD_DELETE_BATCH_PAUSE", 0.2))
+# Rows of a table marked as deleted by one update of a soft delete cascade
+SOFT_DELETE_BATCH_SIZE = int(os.environ.get("SOFT_DELETE_BATCH_SIZE", 1000))
+
+# Webhook delivery
+# Seconds batched webhooks coalesce events for before they are delivered
+WEBHOOK_BATCH_WINDOW = int(os.environ.get("WEBHOOK_BATCH_WINDOW", 10))
+WEBHOOK_BATCH_SIZE = int(os.environ.get("WEBHOOK_BATCH_SIZE", 100))
+# Connections kept open per webhook host in every worker
+WEBHOOK_POOL_SIZE = int(os.environ.get("WEBHOOK_POOL_SIZE", 10))
+
+# API activity logs
+# Logs kept in memory by every process before new ones are dropped
+API_LOG_BUFFER_SIZE = int(os.environ.get("API_LOG_BUFFER_SIZE", 10000))
+API_LOG_BATCH_SIZE = int(os.environ.get("API_LOG_BATCH_SIZE", 500))
+API_LOG_FLUSH_INTERVAL = float(os.environ.get("API_LOG_FLUSH_INTERVAL", 5))
+# Characters of the request and response bodies kept, 0 keeps everything
+API_LOG_BODY_LIMIT = int(os.environ.get("API_LOG_BODY_LIMIT", 10000))
+# Share of the successful requests logged
+API_LOG_SAMPLE_RATE = float(os.environ.get("API_LOG_SAMPLE_RATE", 1))
+
+# API token authentication
+API_TOKEN_CACHE_TTL = int(os.environ.get("API_TOKEN_CACHE_TTL", 300))
+# Seconds a revoked token can still be served from a process cache
+API_TOKEN_LOCAL_CACHE_TTL = int(
+    os.environ.get("API_TOKEN_LOCAL_CACHE_TTL", 10)
+)
+API_TOKEN_LOCAL_CACHE_SIZE = int(
+    os.environ.get("API_TOKEN_LOCAL_CACHE_SIZE", 1024)
+)
+# Seconds between two last used updates of a token
+API_TOKEN_LAST_USED_INTERVAL = int(
+    os.environ.get("API_TOKEN_LAST_USED_INTERVAL", 60)
+)
+
+# Seconds the workspace and project roles of a user are cached, 0 disables it
+MEMBERSHIP_CACHE_TTL = int(os.environ.get("MEMBERSHIP_CACHE_TTL", 300))
+
+# Seconds the unread notification counters of a user stay in Redis
+NOTIFICATION_COUNTERS_TTL = int(
+    os.environ.get("NOTIFICATION_COUNTERS_TTL", 60 * 60 * 24)
+)
+
+# Seconds the largest sort order of a state is cached before being reloaded
+ISSUE_SORT_ORDER_CACHE_TTL = int(
+    os.environ.get("ISSUE_SORT_ORDER_CACHE_TTL", 60 * 60)
+)
+
+# Issues accepted by a single bulk upsert request of the API
+ISSUE_BULK_UPSERT_LIMIT = int(os.environ.get("ISSUE_BULK_UPSERT_LIMIT", 500))
+
+# Seconds the dashboard counters of a user are cached, 0 disables it
+DASHBOARD_STATS_CACHE_TTL = int(
+    os.environ.get("DASHBOARD_STATS_CACHE_TTL", 60)
+)
+
+# Email notification logs grouped into digests by one stacking run
+EMAIL_NOTIFICATION_BATCH_SIZE = int(
+    os.environ.get("EMAIL_NOTIFICATION_BATCH_SIZE", 5000)
+)
+
+# Seconds between two checks of the instance configuration version, the
+# decrypted configuration is held in the memory of every process
+INSTANCE_CONFIGURATION_CHECK_INTERVAL = float(
+    os.environ.get("INSTANCE_CONFIGURATION_CHECK_INTERVAL", 1)
+)
+
+# Seconds between two flushes of the Redis command latencies of a process
+REDIS_METRICS_FLUSH_INTERVAL = int(
+    os.environ.get("REDIS_METRICS_FLUSH_INTERVAL", 30)
+)
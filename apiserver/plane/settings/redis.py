@@ -1,20 +1,160 @@
+import logging
+import os
+import threading
+import time
+from urllib.parse import urlparse
+
 import redis
 from django.conf import settings
-from urllib.parse import urlparse
 
+# Redis hash holding the counters of every process
+METRICS_KEY = "plane:metrics"
+
+logger = logging.getLogger("plane")
+
+
+class CommandStats:
+    """
+    Latency of the commands sent by the process, kept in memory and added
+    to the metrics every REDIS_METRICS_FLUSH_INTERVAL seconds
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.commands = {}
+        self.flushed_at = time.monotonic()
+        self.created_connections = 0
+
+    def record(self, command, seconds, pool):
+        with self.lock:
+            total, count = self.commands.get(command, (0, 0))
+            self.commands[command] = (total + seconds, count + 1)
+            if (
+                time.monotonic() - self.flushed_at
+                < settings.REDIS_METRICS_FLUSH_INTERVAL
+            ):
+                return
+            commands = self.commands
+            self.commands = {}
+            self.flushed_at = time.monotonic()
+            created = get_pool_stats(pool)["created"]
+            opened = created - self.created_connections
+            self.created_connections = created
+        self.flush(commands, opened, pool)
+
+    def flush(self, commands, opened, pool):
+        # Sent without instrumentation, the flush is not a command of ours
+        pipeline = redis.Redis(connection_pool=pool).pipeline()
+        for command, (total, count) in commands.items():
+            name = f"redis.command_seconds.{command}"
+            pipeline.hincrbyfloat(METRICS_KEY, f"{name}.sum", total)
+            pipeline.hincrby(METRICS_KEY, f"{name}.count", count)
+            pipeline.hset(METRICS_KEY, f"{name}.last", total / count)
+        if opened:
+            pipeline.hincrby(METRICS_KEY, "redis.connections.opened", opened)
+        in_use = get_pool_stats(pool)["in_use"]
+        pipeline.hincrby(METRICS_KEY, "redis.connections.in_use.sum", in_use)
+        pipeline.hincrby(METRICS_KEY, "redis.connections.in_use.count", 1)
+        try:
+            pipeline.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Redis command metrics were not recorded: {e}")
+
+
+command_stats = CommandStats()
+
+
+class InstrumentedPipeline(redis.client.Pipeline):
+    def execute(self, raise_on_error=True):
+        started = time.perf_counter()
+        try:
+            return super().execute(raise_on_error)
+        finally:
+            command_stats.record(
+                "PIPELINE",
+                time.perf_counter() - started,
+                self.connection_pool,
+            )
+
+
+class InstrumentedRedis(redis.Redis):
+    """Client recording the latency of every command it sends"""
+
+    def execute_command(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            return super().execute_command(*args, **options)
+        finally:
+            command_stats.record(
+                str(args[0]).upper(),
+                time.perf_counter() - started,
+                self.connection_pool,
+            )
+
+    def pipeline(self, transaction=True, shard_hint=None):
+        return InstrumentedPipeline(
+            self.connection_pool,
+            self.response_callbacks,
+            transaction,
+            shard_hint,
+        )
+
+
+def get_pool_stats(pool):
+    """Connections opened by the pool of the process and the ones in use"""
+    return {
+        "created": getattr(pool, "_created_connections", 0),
+        "in_use": len(getattr(pool, "_in_use_connections", ())),
+    }
+
+
+def get_connection_pool():
+    # The pool of the cache when it is served by Redis, so that the cache
+    # and the direct commands share their connections
+    try:
+        from django_redis import get_redis_connection
+
+        return get_redis_connection("default").connection_pool
+    except (ImportError, NotImplementedError, AttributeError):
+        pass
 
-def redis_instance():
-    # connect to redis
     if settings.REDIS_SSL:
         url = urlparse(settings.REDIS_URL)
-        ri = redis.Redis(
+        return redis.ConnectionPool(
             host=url.hostname,
             port=url.port,
             password=url.password,
-            ssl=True,
+            connection_class=redis.SSLConnection,
             ssl_cert_reqs=None,
         )
-    else:
-        ri = redis.Redis.from_url(settings.REDIS_URL, db=0)
+    return redis.ConnectionPool.from_url(settings.REDIS_URL, db=0)
 
-    return ri
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def reset_client():
+    """
+    Forget the client, locks and stats of the parent in a forked child, the
+    pools of redis-py also drop the connections they inherited
+    """
+    global _client, _client_lock, command_stats
+    _client = None
+    _client_lock = threading.Lock()
+    command_stats = CommandStats()
+
+
+os.register_at_fork(after_in_child=reset_client)
+
+
+def redis_instance():
+    """Client shared by every caller of the process, with a pooled connection"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = InstrumentedRedis(
+                    connection_pool=get_connection_pool()
+                )
+    return _client
@@ -1 +1,237 @@
-# TODO: Write Test for Issue Endpoints
+# Python imports
+from unittest import mock
+from uuid import uuid4
+
+# Django imports
+from django.test import override_settings
+from django.urls import reverse
+
+# Third party imports
+from rest_framework import status
+
+# Module imports
+from plane.db.models import (
+    APIToken,
+    Issue,
+    IssueAssignee,
+    IssueLabel,
+    IssueSequence,
+    Label,
+    Project,
+    ProjectMember,
+    State,
+    User,
+    Workspace,
+)
+from plane.tests.api.base import BaseAPITest
+
+
+class IssueBulkUpsertTest(BaseAPITest):
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create(email="user@plane.so")
+        self.assignee = User.objects.create(email="assignee@plane.so")
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        self.project = Project.objects.create(
+            name="Web", identifier="WEB", workspace=self.workspace
+        )
+        for member, role in ((self.user, 20), (self.assignee, 15)):
+            ProjectMember.objects.create(
+                member=member,
+                role=role,
+                project=self.project,
+                workspace=self.workspace,
+            )
+        self.backlog = State.objects.create(
+            name="Backlog",
+            group="backlog",
+            default=True,
+            project=self.project,
+            workspace=self.workspace,
+        )
+        self.bug, self.feature = (
+            Label.objects.create(
+                name=name, project=self.project, workspace=self.workspace
+            )
+            for name in ("Bug", "Feature")
+        )
+        api_token = APIToken.objects.create(
+            user=self.user, workspace=self.workspace
+        )
+        self.client.credentials(HTTP_X_API_KEY=api_token.token)
+        self.url = reverse(
+            "issue-bulk-upsert",
+            kwargs={"slug": "plane", "project_id": self.project.id},
+        )
+
+        # Side effects of the batch are covered by their own tests
+        for target in (
+            "plane.api.views.issue.bulk_issue_activity",
+            "plane.api.views.issue.index_search_documents",
+            "plane.api.views.issue.invalidate_dashboard_stats",
+        ):
+            patcher = mock.patch(target)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def create_issue(self, external_id, **fields):
+        return Issue.objects.create(
+            name=f"Issue {external_id}",
+            external_id=external_id,
+            external_source="jira",
+            project=self.project,
+            workspace=self.workspace,
+            **fields,
+        )
+
+    def upsert(self, *issues):
+        return self.client.put(
+            self.url,
+            {
+                "issues": [
+                    {"external_source": "jira", **issue} for issue in issues
+                ]
+            },
+            format="json",
+        )
+
+    def test_issues_are_created_and_updated_in_one_batch(self):
+        issue = self.create_issue("1")
+        response = self.upsert(
+            {"external_id": "1", "name": "Renamed", "priority": "high"},
+            {"external_id": "2", "name": "Imported"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        updated, created = response.data["results"]
+        self.assertEqual(updated["status"], "updated")
+        self.assertEqual(updated["id"], issue.id)
+        self.assertEqual(created["status"], "created")
+
+        issue.refresh_from_db()
+        self.assertEqual((issue.name, issue.priority), ("Renamed", "high"))
+        imported = Issue.objects.get(pk=created["id"])
+        self.assertEqual(
+            (imported.name, imported.external_id, imported.state_id),
+            ("Imported", "2", self.backlog.id),
+        )
+
+    def test_invalid_issues_do_not_stop_the_batch(self):
+        response = self.upsert(
+            {"external_id": "1", "name": "Valid"},
+            {"external_id": "2", "name": "Unknown state", "state": uuid4()},
+            {
+                "external_id": "3",
+                "name": "Later start",
+                "start_date": "2024-06-02",
+                "target_date": "2024-06-01",
+            },
+            {"external_id": "1", "name": "Repeated"},
+            {"name": "No external id"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]
+        self.assertEqual(
+            [result["status"] for result in results],
+            ["created", "failed", "failed", "failed", "failed"],
+        )
+        self.assertEqual(
+            results[1]["errors"],
+            ["State is not valid please pass a valid state_id"],
+        )
+        self.assertIn("non_field_errors", results[2]["errors"])
+        self.assertEqual(
+            results[3]["errors"],
+            ["The issue is present more than once in the request"],
+        )
+        self.assertIn("external_id", results[4]["errors"])
+        self.assertEqual(
+            list(Issue.objects.values_list("name", flat=True)), ["Valid"]
+        )
+
+    def test_assignees_and_labels_are_replaced(self):
+        issue = self.create_issue("1", state=self.backlog)
+        IssueAssignee.objects.create(
+            assignee=self.user,
+            issue=issue,
+            project=self.project,
+            workspace=self.workspace,
+        )
+        IssueLabel.objects.create(
+            label=self.bug,
+            issue=issue,
+            project=self.project,
+            workspace=self.workspace,
+        )
+        # A user outside the project is dropped, as the serializer does
+        outsider = User.objects.create(email="outsider@plane.so")
+
+        response = self.upsert(
+            {
+                "external_id": "1",
+                "assignees": [self.assignee.id, outsider.id],
+                "labels": [self.feature.id, self.feature.id],
+            }
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            list(
+                IssueAssignee.objects.filter(issue=issue).values_list(
+                    "assignee_id", flat=True
+                )
+            ),
+            [self.assignee.id],
+        )
+        self.assertEqual(
+            list(
+                IssueLabel.objects.filter(issue=issue).values_list(
+                    "label_id", flat=True
+                )
+            ),
+            [self.feature.id],
+        )
+
+    @override_settings(ISSUE_BULK_UPSERT_LIMIT=2)
+    def test_batch_size_is_limited(self):
+        response = self.upsert(
+            *(
+                {"external_id": str(index), "name": f"Issue {index}"}
+                for index in range(3)
+            )
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["error"],
+            "At most 2 issues can be upserted in a request",
+        )
+        self.assertFalse(Issue.objects.exists())
+
+    def test_sequence_ids_are_contiguous(self):
+        self.create_issue("1")
+        response = self.upsert(
+            *(
+                {"external_id": str(index), "name": f"Issue {index}"}
+                for index in range(2, 5)
+            )
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [result["sequence_id"] for result in response.data["results"]],
+            [2, 3, 4],
+        )
+        self.assertEqual(
+            sorted(
+                IssueSequence.objects.filter(
+                    project=self.project
+                ).values_list("sequence", flat=True)
+            ),
+            [1, 2, 3, 4],
+        )
+        # The next issue follows the reserved block
+        self.assertEqual(self.create_issue("5").sequence_id, 5)
@@ -0,0 +1,160 @@
+# Python imports
+import json
+import uuid
+from io import StringIO
+from unittest import mock
+
+# Django imports
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase
+from django.utils import timezone
+
+# Module imports
+from plane.bgtasks.deletion_task import (
+    SoftDeleteCascade,
+    get_purge_order,
+    get_soft_delete_relations,
+)
+from plane.db.models import (
+    EstimatePoint,
+    Issue,
+    IssueComment,
+    IssueLink,
+    Project,
+)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+
+
+class SoftDeleteRelationsTest(SimpleTestCase):
+    def test_only_cascading_relations_are_followed(self):
+        self.assertIn((Issue, "project"), get_soft_delete_relations(Project))
+        self.assertIn((Issue, "parent"), get_soft_delete_relations(Issue))
+        self.assertIn(
+            (IssueComment, "issue"), get_soft_delete_relations(Issue)
+        )
+        # Issues only lose their estimate point when it is deleted
+        self.assertNotIn(
+            (Issue, "estimate_point"), get_soft_delete_relations(EstimatePoint)
+        )
+
+
+class SoftDeleteCascadeTest(SimpleTestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        patcher = mock.patch(
+            "plane.bgtasks.deletion_task.redis_instance",
+            return_value=self.redis,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.issue = Issue(id=uuid.uuid4(), deleted_at=timezone.now())
+
+    def get_cascade(self, batches):
+        cascade = SoftDeleteCascade(self.issue)
+        cascade.get_batches = mock.Mock(
+            side_effect=lambda model, field_name, parent_pks, last_pk=None: (
+                batches.get((model, field_name), [])
+                if parent_pks == [self.issue.pk]
+                else []
+            )
+        )
+        cascade.delete_batch = mock.Mock()
+        return cascade
+
+    def test_every_relation_is_checkpointed(self):
+        cascade = self.get_cascade({(IssueLink, "issue"): [[1, 2], [3]]})
+        cascade.run()
+
+        self.assertEqual(
+            [call.args[1] for call in cascade.delete_batch.call_args_list],
+            [[1, 2], [3]],
+        )
+        progress = json.loads(self.redis.get(cascade.key))
+        self.assertTrue(progress["completed"])
+        # A completed cascade is not walked again
+        completed = self.get_cascade({})
+        completed.run()
+        completed.get_batches.assert_not_called()
+
+    def test_interrupted_cascade_resumes_from_the_checkpoint(self):
+        relations = [
+            f"{model._meta.label}.{field_name}"
+            for model, field_name in get_soft_delete_relations(Issue)
+        ]
+        resumed_relation = relations.index("db.IssueLink.issue")
+        self.redis.set(
+            SoftDeleteCascade(self.issue).key,
+            json.dumps(
+                {
+                    "relation": "db.IssueLink.issue",
+                    "last_pk": 2,
+                    "counts": {"issue_links": 2},
+                    "deleted_at": SoftDeleteCascade(
+                        self.issue
+                    ).get_deleted_at(),
+                }
+            ),
+        )
+        cascade = self.get_cascade({})
+        cascade.run()
+
+        self.assertTrue(cascade.resuming)
+        first_call = cascade.get_batches.call_args_list[0]
+        self.assertEqual(first_call.args[:2], (IssueLink, "issue"))
+        self.assertEqual(first_call.args[3], 2)
+        # Relations before the checkpoint are skipped
+        self.assertEqual(
+            cascade.get_batches.call_count,
+            len(relations) - resumed_relation,
+        )
+
+
+    def test_progress_is_printed_per_table(self):
+        cascade = SoftDeleteCascade(self.issue)
+        cascade.progress.update(
+            relation="db.IssueLink.issue",
+            last_pk=2,
+            counts={"issue_links": 2, "issue_comments": 5},
+        )
+        cascade.save_progress()
+
+        stdout = StringIO()
+        call_command(
+            "soft_delete_progress",
+            "db.Issue",
+            str(self.issue.pk),
+            stdout=stdout,
+        )
+        self.assertEqual(
+            stdout.getvalue().splitlines(),
+            [
+                "issue_comments: 5",
+                "issue_links: 2",
+                "Running, at db.IssueLink.issue after 2, "
+                "7 rows soft deleted so far",
+            ],
+        )
+
+        with self.assertRaises(CommandError):
+            call_command("soft_delete_progress", "db.Issue", str(uuid.uuid4()))
+
+class HardDeletePurgeTest(SimpleTestCase):
+    def test_cascading_models_are_purged_first(self):
+        order = get_purge_order()
+        for parent, child in (
+            (Project, Issue),
+            (Issue, IssueComment),
+            (Issue, IssueLink),
+        ):
+            self.assertLess(order.index(child), order.index(parent))
+        self.assertEqual(len(order), len(set(order)))
@@ -0,0 +1,165 @@
+# Python imports
+from unittest import mock
+
+# Django imports
+from django.core import mail
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+# Module imports
+from plane.bgtasks import email_notification_task
+from plane.bgtasks.email_notification_task import (
+    send_email_digest,
+    stack_email_notification,
+)
+from plane.db.models import (
+    EmailNotificationLog,
+    Issue,
+    Project,
+    State,
+    User,
+    Workspace,
+)
+
+
+@override_settings(
+    EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend"
+)
+class EmailDigestTest(TestCase):
+    def setUp(self):
+        self.receiver = User.objects.create(
+            email="receiver@plane.so", username="receiver"
+        )
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.receiver
+        )
+        self.project = Project.objects.create(
+            name="Web", identifier="WEB", workspace=self.workspace
+        )
+        self.state = State.objects.create(
+            name="Backlog",
+            group="backlog",
+            default=True,
+            project=self.project,
+            workspace=self.workspace,
+        )
+        self.issues = [
+            Issue.objects.create(
+                name=f"Digest {index}",
+                state=self.state,
+                project=self.project,
+                workspace=self.workspace,
+            )
+            for index in range(2)
+        ]
+        redis = mock.MagicMock()
+        redis.set.return_value = True
+        redis.mget.side_effect = lambda keys: [
+            b"https://app.plane.so" for _ in keys
+        ]
+        patcher = mock.patch.object(
+            email_notification_task, "redis_instance", return_value=redis
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def add_logs(self, actors):
+        for actor in actors:
+            mentioned = User.objects.create(
+                email=f"mentioned-{actor.username}@plane.so",
+                username=f"mentioned-{actor.username}",
+                display_name=f"mentioned-{actor.username}",
+            )
+            for issue in self.issues:
+                EmailNotificationLog.objects.create(
+                    receiver=self.receiver,
+                    triggered_by=actor,
+                    entity_identifier=issue.id,
+                    entity_name="issue",
+                    data={
+                        "issue_activity": {
+                            "field": "mention",
+                            "actor": str(actor.id),
+                            "new_value": (
+                                "<mention-component "
+                                f'entity_identifier="{mentioned.id}">'
+                                "</mention-component>"
+                            ),
+                            "old_value": "",
+                            "activity_time": "2024-01-01T10:00:00Z",
+                        }
+                    },
+                )
+
+    def create_actors(self, start, count):
+        return [
+            User.objects.create(
+                email=f"actor{index}@plane.so", username=f"actor{index}"
+            )
+            for index in range(start, start + count)
+        ]
+
+    def send(self):
+        mail.outbox = []
+        with mock.patch.object(
+            send_email_digest, "delay", side_effect=send_email_digest
+        ) as delay, mock.patch.object(
+            email_notification_task,
+            "get_connection",
+            wraps=email_notification_task.get_connection,
+        ) as get_connection, CaptureQueriesContext(connection) as queries:
+            stack_email_notification()
+        return delay, get_connection, len(queries)
+
+    def test_receiver_emails_are_sent_from_one_task(self):
+        self.add_logs(self.create_actors(0, 2))
+        delay, get_connection, _ = self.send()
+
+        delay.assert_called_once()
+        get_connection.assert_called_once()
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(mail.outbox[0].to, ["receiver@plane.so"])
+        self.assertIn("@mentioned-actor0", mail.outbox[0].alternatives[0][0])
+        self.assertFalse(
+            EmailNotificationLog.objects.filter(sent_at__isnull=True).exists()
+        )
+
+    def test_query_count_does_not_grow_with_actors(self):
+        self.add_logs(self.create_actors(0, 2))
+        *_, few_actors = self.send()
+
+        self.add_logs(self.create_actors(2, 10))
+        *_, many_actors = self.send()
+
+        self.assertEqual(few_actors, many_actors)
+        self.assertEqual(len(mail.outbox), 2)
+
+    def test_failing_issue_does_not_hold_back_the_others(self):
+        self.add_logs(self.create_actors(0, 1))
+        failing = self.issues[0]
+        render_issue_email = email_notification_task.render_issue_email
+
+        def render(issue, **kwargs):
+            if issue.id == failing.id:
+                raise ValueError("Template could not be rendered")
+            return render_issue_email(issue=issue, **kwargs)
+
+        with mock.patch.object(
+            email_notification_task, "render_issue_email", side_effect=render
+        ), mock.patch.object(
+            email_notification_task, "log_exception"
+        ) as log_exception:
+            self.send()
+
+        log_exception.assert_called_once()
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn(self.issues[1].name, mail.outbox[0].subject)
+        self.assertEqual(
+            list(
+                EmailNotificationLog.objects.filter(
+                    sent_at__isnull=True
+                ).values_list("entity_identifier", flat=True)
+            ),
+            [failing.id],
+        )
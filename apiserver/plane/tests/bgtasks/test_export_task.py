@@ -0,0 +1,191 @@
+# Python imports
+import csv
+import io
+import json
+import zipfile
+from datetime import date, datetime, timezone
+
+# Django imports
+from django.test import SimpleTestCase, TestCase
+
+# Third party imports
+from openpyxl import load_workbook
+
+# Module imports
+from plane.bgtasks.export_task import (
+    generate_csv,
+    generate_json,
+    generate_xlsx,
+    get_export_queryset,
+)
+from plane.db.models import (
+    Issue,
+    IssueLabel,
+    Label,
+    Project,
+    ProjectMember,
+    State,
+    User,
+    Workspace,
+)
+
+HEADER = ["ID", "Project", "Name", "Labels", "Created At"]
+
+
+class Issues(list):
+    """Rows of an export queryset, read with a server side cursor"""
+
+    def iterator(self, chunk_size=None):
+        self.chunk_size = chunk_size
+        return iter(self)
+
+
+def get_issue(sequence_id, label_names=None):
+    return {
+        "project__identifier": "WEB",
+        "project__name": "Web",
+        "sequence_id": sequence_id,
+        "name": f"Issue, {sequence_id}",
+        "description_stripped": "",
+        "state__name": "Backlog",
+        "priority": "none",
+        "created_by__first_name": "Jane",
+        "created_by__last_name": "Doe",
+        "assignee_names": None,
+        "label_names": label_names,
+        "cycle_name": None,
+        "cycle_start_date": None,
+        "cycle_end_date": None,
+        "module_name": "Launch",
+        "module_start_date": date(2024, 6, 1),
+        "module_target_date": None,
+        "created_at": datetime(2024, 6, 1, 10, tzinfo=timezone.utc),
+        "updated_at": None,
+        "completed_at": None,
+        "archived_at": None,
+    }
+
+
+class ExportFileTest(SimpleTestCase):
+    def setUp(self):
+        self.issues = Issues(
+            [get_issue(1, ["Bug", "UI"]), get_issue(2), get_issue(3)]
+        )
+
+    def export(self, exporter, extension):
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zip_file:
+            exporter(HEADER, "project", self.issues, zip_file)
+        with zipfile.ZipFile(archive) as zip_file:
+            self.assertEqual(zip_file.namelist(), [f"project.{extension}"])
+            return zip_file.read(f"project.{extension}")
+
+    def test_csv_rows_are_streamed(self):
+        rows = list(
+            csv.reader(io.StringIO(self.export(generate_csv, "csv").decode()))
+        )
+        self.assertEqual(rows[0], HEADER)
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(rows[1][:3], ["WEB-1", "Web", "Issue, 1"])
+        self.assertEqual(rows[1][8], "Bug, UI")
+        self.assertEqual(rows[2][12], "Launch")
+        self.assertIsNotNone(self.issues.chunk_size)
+
+    def test_json_is_one_array(self):
+        rows = json.loads(self.export(generate_json, "json"))
+        self.assertEqual(
+            [row["ID"] for row in rows], ["WEB-1", "WEB-2", "WEB-3"]
+        )
+        self.assertEqual(rows[0]["Labels"], "Bug, UI")
+        self.assertIsNone(rows[1]["Labels"])
+        self.assertEqual(rows[0]["Module Start Date"], "Sat, 01 Jun 2024")
+
+    def test_empty_json_export(self):
+        self.issues = Issues()
+        self.assertEqual(json.loads(self.export(generate_json, "json")), [])
+
+    def test_xlsx_rows_are_streamed(self):
+        exported = self.export(generate_xlsx, "xlsx")
+        workbook = load_workbook(io.BytesIO(exported))
+        rows = list(workbook.active.iter_rows(values_only=True))
+        self.assertEqual(list(rows[0][: len(HEADER)]), HEADER)
+        self.assertEqual(
+            [row[0] for row in rows[1:]], ["WEB-1", "WEB-2", "WEB-3"]
+        )
+
+
+class ExportQuerysetTest(TestCase):
+    def setUp(self):
+        self.member = User.objects.create(
+            email="member@plane.so", username="member"
+        )
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.member
+        )
+        self.project = Project.objects.create(
+            name="Web", identifier="WEB", workspace=self.workspace
+        )
+        state = State.objects.create(
+            name="Backlog",
+            group="backlog",
+            default=True,
+            project=self.project,
+            workspace=self.workspace,
+        )
+        label = Label.objects.create(
+            name="Bug", project=self.project, workspace=self.workspace
+        )
+        self.issues = [
+            Issue.objects.create(
+                name=f"Issue {index}",
+                state=state,
+                project=self.project,
+                workspace=self.workspace,
+            )
+            for index in range(2)
+        ]
+        IssueLabel.objects.create(
+            issue=self.issues[0],
+            label=label,
+            project=self.project,
+            workspace=self.workspace,
+        )
+
+    def add_membership(self, member, deleted=False):
+        membership = ProjectMember.objects.create(
+            member=member,
+            role=15,
+            project=self.project,
+            workspace=self.workspace,
+        )
+        if deleted:
+            ProjectMember.all_objects.filter(pk=membership.pk).update(
+                deleted_at=datetime.now(timezone.utc)
+            )
+
+    def get_rows(self, member):
+        return list(
+            get_export_queryset(
+                workspace_id=self.workspace.id,
+                project_ids=[self.project.id],
+                member_id=member.id,
+            )
+        )
+
+    def test_deleted_memberships_do_not_repeat_issues(self):
+        # A member who left the project and joined it again
+        self.add_membership(self.member, deleted=True)
+        self.add_membership(self.member)
+
+        rows = self.get_rows(self.member)
+        self.assertEqual(
+            [row["id"] for row in rows], [issue.id for issue in self.issues]
+        )
+        self.assertEqual(rows[0]["label_names"], ["Bug"])
+
+    def test_only_projects_of_the_member_are_exported(self):
+        outsider = User.objects.create(
+            email="outsider@plane.so", username="outsider"
+        )
+        self.add_membership(outsider, deleted=True)
+        self.assertEqual(self.get_rows(outsider), [])
@@ -0,0 +1,125 @@
+# Python imports
+import json
+
+# Django imports
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+# Module imports
+from plane.bgtasks.notification_task import notifications
+from plane.db.models import (
+    EmailNotificationLog,
+    Issue,
+    IssueComment,
+    IssueSubscriber,
+    Notification,
+    Project,
+    State,
+    User,
+    UserNotificationPreference,
+    Workspace,
+)
+
+
+class NotificationFanOutTest(TestCase):
+    def setUp(self):
+        self.actor = User.objects.create(
+            email="actor@plane.so", username="actor"
+        )
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.actor
+        )
+        self.project = Project.objects.create(
+            name="Web", identifier="WEB", workspace=self.workspace
+        )
+        self.backlog = State.objects.create(
+            name="Backlog",
+            group="backlog",
+            default=True,
+            project=self.project,
+            workspace=self.workspace,
+        )
+        self.done = State.objects.create(
+            name="Done",
+            group="completed",
+            project=self.project,
+            workspace=self.workspace,
+        )
+        self.issue = Issue.objects.create(
+            name="Fan out",
+            state=self.backlog,
+            project=self.project,
+            workspace=self.workspace,
+        )
+        self.comment = IssueComment.objects.create(
+            comment_html="<p>Looks good</p>",
+            issue=self.issue,
+            project=self.project,
+            workspace=self.workspace,
+        )
+        self.subscribers = []
+
+    def add_subscribers(self, count):
+        for _ in range(count):
+            index = len(self.subscribers)
+            user = User.objects.create(
+                email=f"subscriber{index}@plane.so",
+                username=f"subscriber{index}",
+            )
+            IssueSubscriber.objects.create(
+                issue=self.issue,
+                subscriber=user,
+                project=self.project,
+                workspace=self.workspace,
+            )
+            self.subscribers.append(user)
+        UserNotificationPreference.objects.filter(
+            user__in=self.subscribers
+        ).update(property_change=True, issue_completed=True)
+
+    def send_notifications(self):
+        activity = {
+            "issue_detail": {"id": str(self.issue.id)},
+            "actor_id": str(self.actor.id),
+            "verb": "updated",
+            "created_at": "2024-01-01 00:00:00",
+        }
+        issue_activities = [
+            {**activity, "field": "state", "new_identifier": str(self.done.id)},
+            {**activity, "field": "priority", "new_value": "high"},
+            {
+                **activity,
+                "field": "comment",
+                "issue_comment": str(self.comment.id),
+            },
+        ]
+        description = json.dumps({"description_html": "<p></p>"})
+        with CaptureQueriesContext(connection) as queries:
+            notifications(
+                type="issue.activity.updated",
+                issue_id=str(self.issue.id),
+                project_id=str(self.project.id),
+                actor_id=str(self.actor.id),
+                subscriber=False,
+                issue_activities_created=json.dumps(issue_activities),
+                requested_data=description,
+                current_instance=description,
+            )
+        return len(queries)
+
+    def test_query_count_does_not_grow_with_subscribers(self):
+        self.add_subscribers(2)
+        few_subscribers = self.send_notifications()
+
+        self.add_subscribers(18)
+        many_subscribers = self.send_notifications()
+
+        self.assertEqual(few_subscribers, many_subscribers)
+        self.assertEqual(Notification.objects.count(), 2 * 3 + 20 * 3)
+        self.assertEqual(
+            EmailNotificationLog.objects.filter(
+                data__issue_activity__issue_comment="Looks good"
+            ).count(),
+            2 + 20,
+        )
@@ -0,0 +1,44 @@
+# Python imports
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.celery import app, observe_queue_wait
+
+
+class QueueRoutingTest(SimpleTestCase):
+    def get_queue(self, task_name):
+        return app.amqp.router.route({}, task_name)["queue"].name
+
+    def test_tasks_are_routed_by_name(self):
+        for task_name, queue in [
+            ("plane.bgtasks.magic_link_code_task.magic_link", "realtime"),
+            ("plane.bgtasks.issue_activities_task.issue_activity", "realtime"),
+            ("plane.bgtasks.webhook_task.webhook_send_task", "webhooks"),
+            ("plane.bgtasks.export_task.issue_export_task", "bulk"),
+            ("plane.bgtasks.deletion_task.hard_delete", "bulk"),
+            ("plane.bgtasks.page_version_task.page_version", "default"),
+        ]:
+            with self.subTest(task_name=task_name):
+                self.assertEqual(self.get_queue(task_name), queue)
+
+    def test_wait_is_observed_per_queue(self):
+        task = SimpleNamespace(
+            request=SimpleNamespace(
+                published_at=time.time() - 5,
+                eta=None,
+                delivery_info={"routing_key": "bulk"},
+            )
+        )
+        with mock.patch(
+            "plane.utils.metrics.observe_metric"
+        ) as observe_metric:
+            observe_queue_wait(task=task)
+
+        name, wait = observe_metric.call_args[0]
+        self.assertEqual(name, "celery.wait_seconds.bulk")
+        self.assertAlmostEqual(wait, 5, delta=1)
@@ -0,0 +1,129 @@
+# Python imports
+import hashlib
+import hmac
+import json
+import socket
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+# Third party imports
+import requests
+
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.bgtasks.webhook_task import (
+    get_batch_payload,
+    get_webhook_headers,
+    send_webhook,
+    webhook_batch_send_task,
+)
+from plane.db.models import Webhook, WebhookLog
+
+
+class WebhookReceiver(BaseHTTPRequestHandler):
+    # Keep the connections alive between the deliveries
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.deliveries.append(
+            (self.client_address, dict(self.headers), body)
+        )
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, format, *args):
+        return
+
+
+class WebhookDeliveryTest(SimpleTestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), WebhookReceiver)
+        self.server.deliveries = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.webhook = Webhook(
+            id=uuid.uuid4(),
+            workspace_id=uuid.uuid4(),
+            url=f"http://127.0.0.1:{self.server.server_port}/",
+            secret_key="plane_wh_secret",
+        )
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_deliveries_reuse_the_connection(self):
+        for _ in range(3):
+            payload = {"event": "issue"}
+            response = send_webhook(
+                self.webhook,
+                get_webhook_headers(self.webhook, "issue", payload),
+                payload,
+            )
+            self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(len(self.server.deliveries), 3)
+        self.assertEqual(
+            len({client for client, _, _ in self.server.deliveries}), 1
+        )
+
+    def test_batch_payload_is_signed(self):
+        events = [
+            {
+                "event": "issue",
+                "action": "update",
+                "data": {"id": str(uuid.uuid4())},
+                "activity": {"field": "state"},
+                "queued_at": 0,
+            }
+            for _ in range(2)
+        ]
+        payload = get_batch_payload(self.webhook, events)
+        send_webhook(
+            self.webhook,
+            get_webhook_headers(self.webhook, "batch", payload),
+            payload,
+        )
+
+        _, headers, body = self.server.deliveries[0]
+        self.assertEqual(headers["X-Plane-Event"], "batch")
+        self.assertEqual(len(json.loads(body)["data"]), 2)
+        self.assertEqual(
+            headers["X-Plane-Signature"],
+            hmac.new(b"plane_wh_secret", body, hashlib.sha256).hexdigest(),
+        )
+
+    def test_failed_deliveries_are_logged_with_their_headers(self):
+        # Nothing listens on the port once the socket is closed
+        with socket.socket() as closed:
+            closed.bind(("127.0.0.1", 0))
+            self.webhook.url = f"http://127.0.0.1:{closed.getsockname()[1]}/"
+
+        with mock.patch.object(
+            Webhook.objects, "get", return_value=self.webhook
+        ), mock.patch.object(WebhookLog, "save", autospec=True) as save:
+            with self.assertRaises(requests.RequestException):
+                webhook_batch_send_task(
+                    webhook=str(self.webhook.id),
+                    events=[
+                        {
+                            "event": "issue",
+                            "action": "update",
+                            "data": {"id": str(uuid.uuid4())},
+                            "activity": {"field": "state"},
+                            "queued_at": 0,
+                        }
+                    ],
+                    current_site="https://app.plane.so",
+                )
+
+        (webhook_log,), _ = save.call_args
+        self.assertEqual(webhook_log.response_status, 500)
+        self.assertIn("X-Plane-Delivery", webhook_log.request_headers)
+        self.assertIn("X-Plane-Signature", webhook_log.request_headers)
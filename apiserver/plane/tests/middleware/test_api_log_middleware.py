@@ -0,0 +1,16 @@
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.db.models import APIActivityLog
+from plane.middleware.api_log_middleware import APILogBuffer
+
+
+class APILogBufferTest(SimpleTestCase):
+    def test_full_buffer_drops_logs(self):
+        buffer = APILogBuffer(capacity=2, batch_size=10, flush_interval=3600)
+        for _ in range(3):
+            buffer.add(APIActivityLog(path="/api/v1/", response_code=200))
+
+        self.assertEqual(buffer.logs.qsize(), 2)
+        self.assertEqual(buffer.dropped, 1)
@@ -0,0 +1,126 @@
+# Python imports
+import time
+from types import SimpleNamespace
+from unittest import mock
+from uuid import uuid4
+
+# Third party imports
+from channels.layers import get_channel_layer
+from channels.routing import URLRouter
+from channels.testing import WebsocketCommunicator
+
+# Django imports
+from django.contrib.auth.models import AnonymousUser
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.realtime import consumers
+from plane.realtime.events import project_group, workspace_group
+from plane.realtime.routing import websocket_urlpatterns
+from plane.utils.membership import Membership
+
+application = URLRouter(websocket_urlpatterns)
+
+
+class PushConsumerTest(SimpleTestCase):
+    def setUp(self):
+        self.project_id = str(uuid4())
+        self.user = SimpleNamespace(id=uuid4(), is_authenticated=True)
+        self.membership = Membership(20, {self.project_id: 15})
+        for name, value in (
+            ("get_cached_membership", lambda *args: self.membership),
+            ("increment_metric", None),
+            ("observe_metric", None),
+        ):
+            patcher = mock.patch.object(consumers, name, side_effect=value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.layer = get_channel_layer()
+
+    async def connect(self, user=None):
+        communicator = WebsocketCommunicator(
+            application, "/api/ws/workspaces/acme/"
+        )
+        communicator.scope["user"] = user or self.user
+        connected, _ = await communicator.connect()
+        return communicator, connected
+
+    async def test_anonymous_users_are_refused(self):
+        _, connected = await self.connect(AnonymousUser())
+        self.assertFalse(connected)
+
+    async def test_users_outside_the_workspace_are_refused(self):
+        self.membership = Membership()
+        _, connected = await self.connect()
+        self.assertFalse(connected)
+
+    async def test_only_projects_of_the_member_are_subscribed(self):
+        communicator, connected = await self.connect()
+        self.assertTrue(connected)
+
+        other_project_id = str(uuid4())
+        for project_id in (self.project_id, other_project_id):
+            await communicator.send_json_to(
+                {"action": "subscribe", "project_id": project_id}
+            )
+        # Messages are handled in order, only the second one is refused
+        self.assertEqual(
+            await communicator.receive_json_from(),
+            {"error": "You are not a member of this project"},
+        )
+
+        for project_id in (other_project_id, self.project_id):
+            await self.layer.group_send(
+                project_group(project_id),
+                {
+                    "type": "push.events",
+                    "events": [{"event": "issue.updated"}],
+                    "project_id": project_id,
+                    "sent_at": time.time(),
+                },
+            )
+        self.assertEqual(
+            await communicator.receive_json_from(),
+            {"events": [{"event": "issue.updated"}]},
+        )
+        self.assertTrue(await communicator.receive_nothing())
+        await communicator.disconnect()
+
+    async def test_notifications_of_other_receivers_are_dropped(self):
+        communicator, _ = await self.connect()
+        own = {
+            "event": "notification.created",
+            "receiver_id": str(self.user.id),
+        }
+        shared = {"event": "workspace.updated"}
+
+        await self.layer.group_send(
+            workspace_group("acme"),
+            {
+                "type": "push.events",
+                "events": [
+                    own,
+                    {
+                        "event": "notification.created",
+                        "receiver_id": str(uuid4()),
+                    },
+                    shared,
+                ],
+                "sent_at": time.time(),
+            },
+        )
+        self.assertEqual(
+            await communicator.receive_json_from(), {"events": [own, shared]}
+        )
+
+        # Nothing is sent when every event is for someone else
+        await self.layer.group_send(
+            workspace_group("acme"),
+            {
+                "type": "push.events",
+                "events": [{"receiver_id": str(uuid4())}],
+                "sent_at": time.time(),
+            },
+        )
+        self.assertTrue(await communicator.receive_nothing())
+        await communicator.disconnect()
@@ -0,0 +1,96 @@
+# Python imports
+from types import SimpleNamespace
+from unittest import mock
+from uuid import uuid4
+
+# Third party imports
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.realtime import consumers, events
+from plane.realtime.consumers import PushConsumer
+from plane.realtime.events import (
+    project_group,
+    publish_issue_events,
+    publish_notification_events,
+)
+from plane.realtime.routing import websocket_urlpatterns
+
+
+class PushEventsTest(SimpleTestCase):
+    def setUp(self):
+        for module in (events, consumers):
+            for name in ("increment_metric", "observe_metric"):
+                if hasattr(module, name):
+                    patcher = mock.patch.object(module, name)
+                    patcher.start()
+                    self.addCleanup(patcher.stop)
+        self.layer = get_channel_layer()
+        self.channel = async_to_sync(self.layer.new_channel)()
+
+    def receive(self):
+        return async_to_sync(self.layer.receive)(self.channel)
+
+    def test_issue_changes_are_sent_to_the_project_group(self):
+        project_id, issue_id = uuid4(), uuid4()
+        async_to_sync(self.layer.group_add)(
+            project_group(project_id), self.channel
+        )
+        activity = SimpleNamespace(id=uuid4(), issue_id=issue_id)
+
+        publish_issue_events(project_id, [issue_id, None], [activity])
+
+        message = self.receive()
+        self.assertEqual(message["type"], "push.events")
+        self.assertEqual(
+            [event["event"] for event in message["events"]],
+            ["issue.updated", "activity.created"],
+        )
+        self.assertEqual(message["events"][0]["issue_ids"], [str(issue_id)])
+        self.assertEqual(
+            message["events"][1]["activity_ids"], [str(activity.id)]
+        )
+
+    def test_notifications_are_delivered_to_their_receivers(self):
+        receiver, other = uuid4(), uuid4()
+        async_to_sync(self.layer.group_add)("workspace.acme", self.channel)
+        publish_notification_events(
+            "acme",
+            [
+                SimpleNamespace(receiver_id=receiver),
+                SimpleNamespace(receiver_id=receiver),
+                SimpleNamespace(receiver_id=other),
+            ],
+        )
+        message = self.receive()
+
+        consumer = PushConsumer()
+        consumer.user_id = str(receiver)
+        with mock.patch.object(consumer, "send_json") as send_json:
+            consumer.push_events(message)
+        send_json.assert_called_once_with(
+            {
+                "events": [
+                    {
+                        "event": "notification.created",
+                        "receiver_id": str(receiver),
+                        "count": 2,
+                    }
+                ]
+            }
+        )
+
+
+class PushRoutingTest(SimpleTestCase):
+    def test_socket_is_served_under_the_api_path(self):
+        # Only /api/ is proxied to the api with the upgrade headers
+        (pattern,) = websocket_urlpatterns
+        self.assertEqual(
+            pattern.pattern.match("api/ws/workspaces/acme/")[2],
+            {"slug": "acme"},
+        )
+        self.assertIsNone(pattern.pattern.match("ws/workspaces/acme/"))
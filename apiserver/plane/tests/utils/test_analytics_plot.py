@@ -0,0 +1,40 @@
+# Python imports
+from datetime import date
+
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.utils.analytics_plot import burndown_chart, burndown_date_range
+
+
+class BurndownChartTest(SimpleTestCase):
+    def test_pending_values_per_date(self):
+        distribution = [
+            {"date": None, "issue_count": 3, "estimate_points": 5.0},
+            {
+                "date": date(2024, 1, 2),
+                "issue_count": 2,
+                "estimate_points": None,
+            },
+            {
+                "date": date(2023, 12, 1),
+                "issue_count": 1,
+                "estimate_points": 2.0,
+            },
+        ]
+        chart = burndown_chart(
+            distribution,
+            burndown_date_range(date(2024, 1, 1), date(2024, 1, 3)),
+        )
+        self.assertEqual(
+            chart,
+            {
+                date(2024, 1, 1): (5, 5.0),
+                date(2024, 1, 2): (3, 5.0),
+                date(2024, 1, 3): (3, 5.0),
+            },
+        )
+
+    def test_missing_dates(self):
+        self.assertEqual(burndown_date_range(None, date(2024, 1, 3)), [])
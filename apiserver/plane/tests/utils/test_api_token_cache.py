@@ -0,0 +1,28 @@
+# Python imports
+import time
+
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.utils.api_token_cache import LRUCache
+
+
+class LRUCacheTest(SimpleTestCase):
+    def test_least_recently_used_entry_is_evicted(self):
+        lru = LRUCache(max_size=2, ttl=60)
+        lru.set("a", 1)
+        lru.set("b", 2)
+        lru.get("a")
+        lru.set("c", 3)
+
+        self.assertEqual(lru.get("a"), 1)
+        self.assertIsNone(lru.get("b"))
+        self.assertEqual(lru.get("c"), 3)
+
+    def test_entries_expire(self):
+        lru = LRUCache(max_size=2, ttl=0.01)
+        lru.set("a", 1)
+        time.sleep(0.02)
+
+        self.assertIsNone(lru.get("a"))
@@ -0,0 +1,110 @@
+# Python imports
+from types import SimpleNamespace
+from unittest import mock
+from uuid import uuid4
+
+# Django imports
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+
+# Third party imports
+from rest_framework.response import Response
+
+# Module imports
+from plane.utils import cache
+from plane.utils.cache import (
+    cache_response,
+    invalidate_cache_directly,
+    invalidate_cache_tags,
+    user_tag,
+    workspace_tag,
+)
+
+LOCAL_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+class MembersView:
+    def __init__(self):
+        self.calls = 0
+
+    @cache_response(60)
+    def list(self, request, slug):
+        self.calls += 1
+        return Response({"calls": self.calls})
+
+
+@override_settings(CACHES=LOCAL_CACHES, DEBUG=False)
+class CacheResponseTest(SimpleTestCase):
+    def setUp(self):
+        caches["default"].clear()
+        metric = mock.patch.object(cache, "increment_metric")
+        self.increment_metric = metric.start()
+        self.addCleanup(metric.stop)
+        self.view = MembersView()
+
+    def get_request(self, path, user_id):
+        return SimpleNamespace(
+            user=SimpleNamespace(id=user_id, is_anonymous=False),
+            get_full_path=lambda: path,
+        )
+
+    def get(self, user_id, path="/api/workspaces/acme/members/?fields=id"):
+        return self.view.list(self.get_request(path, user_id), slug="acme")
+
+    def test_responses_are_cached_per_user(self):
+        first, second = uuid4(), uuid4()
+        self.assertEqual(self.get(first).data, {"calls": 1})
+        self.assertEqual(self.get(first).data, {"calls": 1})
+        self.assertEqual(self.get(second).data, {"calls": 2})
+        self.increment_metric.assert_any_call("cache.MembersView.list.hit")
+        self.increment_metric.assert_any_call("cache.MembersView.list.miss")
+
+    def test_path_invalidation_covers_every_query_and_user(self):
+        first, second = uuid4(), uuid4()
+        self.get(first)
+        self.get(second)
+
+        invalidate_cache_directly(
+            path="/api/workspaces/acme/", user=False, multiple=True
+        )
+        self.assertEqual(self.get(first).data, {"calls": 3})
+        self.assertEqual(self.get(second).data, {"calls": 4})
+
+    def test_user_path_invalidation_leaves_other_users_alone(self):
+        first, second = uuid4(), uuid4()
+        self.get(first)
+        self.get(second)
+
+        invalidate_cache_directly(
+            path="/api/workspaces/acme/members/",
+            request=self.get_request("/", first),
+            multiple=True,
+        )
+        self.assertEqual(self.get(first).data, {"calls": 3})
+        self.assertEqual(self.get(second).data, {"calls": 2})
+
+    def test_user_and_workspace_tags(self):
+        first, second = uuid4(), uuid4()
+        self.get(first)
+        self.get(second)
+
+        invalidate_cache_tags(user_tag(first))
+        self.assertEqual(self.get(first).data, {"calls": 3})
+        self.assertEqual(self.get(second).data, {"calls": 2})
+
+        invalidate_cache_tags(workspace_tag("acme"))
+        self.assertEqual(self.get(first).data, {"calls": 4})
+        self.assertEqual(self.get(second).data, {"calls": 5})
+
+    def test_invalidation_does_not_scan_keys(self):
+        with mock.patch.object(
+            cache.cache, "keys", create=True
+        ) as keys, mock.patch.object(
+            cache.cache, "delete_pattern", create=True
+        ):
+            invalidate_cache_directly(
+                path="/api/users/me/workspaces/", user=False, multiple=True
+            )
+        keys.assert_not_called()
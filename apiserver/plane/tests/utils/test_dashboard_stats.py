@@ -0,0 +1,66 @@
+# Python imports
+from unittest import mock
+from uuid import uuid4
+
+# Django imports
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+
+# Module imports
+from plane.utils import dashboard_stats
+from plane.utils.dashboard_stats import (
+    get_dashboard_stats,
+    invalidate_dashboard_stats,
+    is_dashboard_stats_update,
+)
+
+LOCAL_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@override_settings(CACHES=LOCAL_CACHES, DASHBOARD_STATS_CACHE_TTL=60)
+class DashboardStatsTest(SimpleTestCase):
+    def setUp(self):
+        caches["default"].clear()
+        self.user_id = uuid4()
+        self.project_ids = [uuid4(), uuid4()]
+        patcher = mock.patch.object(
+            dashboard_stats,
+            "compute_dashboard_stats",
+            side_effect=lambda *args: {"assigned": 1},
+        )
+        self.compute = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_stats(self, project_ids=None, filters=None):
+        return get_dashboard_stats(
+            "acme",
+            self.user_id,
+            project_ids or self.project_ids,
+            filters=filters,
+        )
+
+    def test_every_widget_is_served_from_one_snapshot(self):
+        self.assertEqual(self.get_stats(), {"assigned": 1})
+        self.get_stats()
+        self.assertEqual(self.compute.call_count, 1)
+        # Filtered counters are a snapshot of their own
+        self.get_stats(filters={"priority__in": ["high"]})
+        self.assertEqual(self.compute.call_count, 2)
+
+    def test_issue_writes_invalidate_their_projects(self):
+        other_project_id = uuid4()
+        self.get_stats()
+        invalidate_dashboard_stats([other_project_id])
+        self.get_stats()
+        self.assertEqual(self.compute.call_count, 1)
+
+        invalidate_dashboard_stats([self.project_ids[1]])
+        self.get_stats()
+        self.assertEqual(self.compute.call_count, 2)
+
+    def test_saves_of_other_fields_keep_the_snapshot(self):
+        self.assertTrue(is_dashboard_stats_update(None))
+        self.assertTrue(is_dashboard_stats_update(["state", "updated_at"]))
+        self.assertFalse(is_dashboard_stats_update(["updated_at"]))
@@ -0,0 +1,61 @@
+# Python imports
+import time
+import uuid
+
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.utils.grouper import issue_group_buckets
+
+
+class IssueGroupBucketsTest(SimpleTestCase):
+    def get_rows(self, issue_count, label_count, labels_per_issue=3):
+        # One row per issue and label as returned by the grouped queryset
+        labels = [str(uuid.uuid4()) for _ in range(label_count)]
+        rows = []
+        for index in range(issue_count):
+            issue_id = str(uuid.uuid4())
+            for offset in range(labels_per_issue):
+                rows.append(
+                    {
+                        "id": issue_id,
+                        "labels__id": labels[
+                            (index + offset * 7) % label_count
+                        ],
+                    }
+                )
+        return rows
+
+    def bucket_time(self, rows):
+        start = time.perf_counter()
+        issue_group_buckets(issues=rows, field="labels__id")
+        return time.perf_counter() - start
+
+    def test_issue_is_added_once_to_each_group(self):
+        rows = [
+            {"id": "1", "labels__id": "a"},
+            {"id": "1", "labels__id": "b"},
+            {"id": "2", "labels__id": "a"},
+            {"id": "3", "labels__id": None},
+        ]
+        buckets = issue_group_buckets(issues=rows, field="labels__id")
+
+        self.assertEqual([row["id"] for row in buckets["a"]], ["1", "2"])
+        self.assertEqual([row["id"] for row in buckets["b"]], ["1"])
+        self.assertEqual([row["id"] for row in buckets["None"]], ["3"])
+        self.assertEqual(buckets["a"][0]["label_ids"], ["a", "b"])
+        self.assertEqual(buckets["None"][0]["label_ids"], [])
+
+    def test_bucketing_scales_linearly(self):
+        # 1,000 issues over 300 labels against twice the page size
+        small = min(
+            self.bucket_time(self.get_rows(1000, 300)) for _ in range(3)
+        )
+        large = min(
+            self.bucket_time(self.get_rows(2000, 300)) for _ in range(3)
+        )
+
+        # A quadratic grouper takes ~4x as long for twice the rows
+        self.assertLess(large, small * 3)
+        self.assertLess(small, 0.5)
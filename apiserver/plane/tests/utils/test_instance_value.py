@@ -0,0 +1,66 @@
+# Python imports
+from unittest import mock
+
+# Django imports
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+
+# Module imports
+from plane.license.utils import instance_value
+from plane.license.utils.instance_value import (
+    configuration_cache,
+    get_configuration_value,
+    invalidate_configuration_values,
+)
+
+LOCAL_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@override_settings(
+    CACHES=LOCAL_CACHES,
+    SKIP_ENV_VAR=True,
+    INSTANCE_CONFIGURATION_CHECK_INTERVAL=0,
+)
+class ConfigurationCacheTest(SimpleTestCase):
+    def setUp(self):
+        caches["default"].clear()
+        configuration_cache.clear()
+        self.values = {"EMAIL_HOST": "smtp.plane.so", "EMAIL_PORT": None}
+        loader = mock.patch.object(
+            instance_value,
+            "load_configuration_values",
+            side_effect=lambda: dict(self.values),
+        )
+        self.load = loader.start()
+        self.addCleanup(loader.stop)
+        self.addCleanup(configuration_cache.clear)
+
+    def get(self):
+        return get_configuration_value(
+            [
+                {"key": "EMAIL_HOST"},
+                {"key": "EMAIL_PORT", "default": 587},
+                {"key": "EMAIL_FROM", "default": "team@plane.so"},
+            ]
+        )
+
+    def test_values_are_loaded_once(self):
+        self.assertEqual(self.get(), ("smtp.plane.so", None, "team@plane.so"))
+        self.get()
+        self.assertEqual(self.load.call_count, 1)
+
+    def test_new_version_reloads_the_values(self):
+        self.get()
+        self.values["EMAIL_HOST"] = "mail.plane.so"
+        # Another process changed the configuration
+        caches["default"].set(
+            instance_value.INSTANCE_CONFIGURATION_VERSION_KEY, "changed"
+        )
+        self.assertEqual(self.get()[0], "mail.plane.so")
+        self.assertEqual(self.load.call_count, 2)
+
+        invalidate_configuration_values()
+        self.get()
+        self.assertEqual(self.load.call_count, 3)
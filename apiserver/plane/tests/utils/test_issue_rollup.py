@@ -0,0 +1,240 @@
+# Python imports
+import json
+from unittest import mock
+
+# Django imports
+from django.db import OperationalError
+from django.test import TestCase
+from django.utils import timezone
+
+# Module imports
+from plane.bgtasks import issue_activities_task, issue_rollup_task
+from plane.bgtasks.deletion_task import SoftDeleteCascade
+from plane.db.models import (
+    Cycle,
+    CycleIssue,
+    CycleIssueRollup,
+    Estimate,
+    EstimatePoint,
+    Issue,
+    Module,
+    ModuleIssue,
+    ModuleIssueRollup,
+    Project,
+    State,
+    User,
+    Workspace,
+)
+from plane.utils.issue_rollup import (
+    STATE_GROUPS,
+    refresh_cycle_rollups,
+    refresh_module_rollups,
+    rollup_annotations,
+)
+
+
+class IssueRollupTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(
+            email="user@plane.so", username="user"
+        )
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        self.project = Project.objects.create(
+            name="Web", identifier="WEB", workspace=self.workspace
+        )
+        self.backlog = self.create_state("Backlog", "backlog")
+        self.done = self.create_state("Done", "completed")
+        self.estimate = Estimate.objects.create(
+            name="Points",
+            type="points",
+            project=self.project,
+            workspace=self.workspace,
+        )
+        self.points = {
+            value: EstimatePoint.objects.create(
+                estimate=self.estimate,
+                key=key,
+                value=str(value),
+                project=self.project,
+                workspace=self.workspace,
+            )
+            for key, value in enumerate((2, 3, 5))
+        }
+        self.cycle = Cycle.objects.create(
+            name="Sprint",
+            owned_by=self.user,
+            project=self.project,
+            workspace=self.workspace,
+        )
+        self.module = Module.objects.create(
+            name="Launch", project=self.project, workspace=self.workspace
+        )
+        self.issues = [
+            self.create_issue(self.backlog, 3),
+            self.create_issue(self.backlog, 5),
+            self.create_issue(self.done, 2),
+        ]
+        # Archived issues are left out of the counts
+        archived = self.create_issue(self.done, 5)
+        Issue.objects.filter(pk=archived.pk).update(
+            archived_at=timezone.now()
+        )
+
+        # The refresh tasks run in the test process
+        for task in (
+            issue_rollup_task.refresh_state_rollups,
+            issue_rollup_task.refresh_estimate_rollups,
+        ):
+            patcher = mock.patch.object(task, "delay", side_effect=task)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def create_state(self, name, group):
+        return State.objects.create(
+            name=name,
+            group=group,
+            project=self.project,
+            workspace=self.workspace,
+        )
+
+    def create_issue(self, state, points):
+        issue = Issue.objects.create(
+            name=f"Issue {points}",
+            state=state,
+            estimate_point=self.points[points],
+            project=self.project,
+            workspace=self.workspace,
+        )
+        CycleIssue.objects.create(
+            cycle=self.cycle,
+            issue=issue,
+            project=self.project,
+            workspace=self.workspace,
+        )
+        ModuleIssue.objects.create(
+            module=self.module,
+            issue=issue,
+            project=self.project,
+            workspace=self.workspace,
+        )
+        return issue
+
+    def get_rollups(self, rollup_model=CycleIssueRollup):
+        return {
+            rollup.state_group: (rollup.issue_count, rollup.estimate_points)
+            for rollup in rollup_model.objects.all()
+        }
+
+    def get_annotations(self, model=Cycle, rollup_model=CycleIssueRollup):
+        return (
+            model.objects.filter(project=self.project)
+            .annotate(**rollup_annotations(rollup_model))
+            .values(
+                "total_issues",
+                "total_estimate_points",
+                "backlog_issues",
+                "backlog_estimate_points",
+                "completed_issues",
+                "started_issues",
+            )
+            .get()
+        )
+
+    def test_rollups_are_counted_per_state_group(self):
+        refresh_cycle_rollups([self.cycle.id])
+        refresh_module_rollups([self.module.id])
+
+        expected = {group: (0, 0) for group in STATE_GROUPS}
+        expected.update(backlog=(2, 8), completed=(1, 2))
+        self.assertEqual(self.get_rollups(), expected)
+        self.assertEqual(self.get_rollups(ModuleIssueRollup), expected)
+
+    def test_annotations_read_the_rollups(self):
+        # Without rollups every value is zero
+        self.assertEqual(set(self.get_annotations().values()), {0})
+
+        refresh_cycle_rollups([self.cycle.id])
+        self.assertEqual(
+            self.get_annotations(),
+            {
+                "total_issues": 3,
+                "total_estimate_points": 10,
+                "backlog_issues": 2,
+                "backlog_estimate_points": 8,
+                "completed_issues": 1,
+                "started_issues": 0,
+            },
+        )
+
+    def test_state_group_change_refreshes_the_rollups(self):
+        refresh_cycle_rollups([self.cycle.id])
+        self.backlog.group = "started"
+        self.backlog.save()
+
+        self.assertEqual(self.get_rollups()["backlog"], (0, 0))
+        self.assertEqual(self.get_rollups()["started"], (2, 8))
+        self.assertEqual(
+            self.get_rollups(ModuleIssueRollup)["started"], (2, 8)
+        )
+
+    def test_estimate_changes_refresh_the_rollups(self):
+        refresh_cycle_rollups([self.cycle.id])
+        point = self.points[5]
+        point.value = "8"
+        point.save()
+        self.assertEqual(self.get_rollups()["backlog"], (2, 11))
+
+        self.estimate.type = "categories"
+        self.estimate.save()
+        self.assertEqual(self.get_rollups()["backlog"], (2, 0))
+
+    def test_cascaded_issue_deletes_refresh_the_rollups(self):
+        refresh_cycle_rollups([self.cycle.id])
+        refresh_module_rollups([self.module.id])
+
+        issue = self.issues[0]
+        Issue.objects.filter(pk=issue.pk).update(deleted_at=timezone.now())
+        with mock.patch(
+            "plane.bgtasks.deletion_task.redis_instance"
+        ) as redis_instance:
+            redis_instance.return_value.get.return_value = None
+            SoftDeleteCascade(Issue.all_objects.get(pk=issue.pk)).run()
+
+        self.assertEqual(self.get_rollups()["backlog"], (1, 5))
+        self.assertEqual(
+            self.get_rollups(ModuleIssueRollup)["backlog"], (1, 5)
+        )
+
+    def test_failed_refresh_does_not_drop_the_fan_out(self):
+        patchers = {
+            name: mock.patch.object(issue_activities_task, name)
+            for name in (
+                "dispatch_webhook_activities",
+                "publish_issue_events",
+                "notifications",
+                "invalidate_dashboard_stats",
+                "refresh_activity_rollups",
+            )
+        }
+        mocks = {name: patcher.start() for name, patcher in patchers.items()}
+        for patcher in patchers.values():
+            self.addCleanup(patcher.stop)
+        # Concurrent refreshes of the same rollup rows can deadlock
+        mocks["refresh_activity_rollups"].side_effect = OperationalError
+
+        issue_activities_task.issue_activity(
+            type="issue.activity.updated",
+            requested_data=json.dumps({"priority": "high"}),
+            current_instance=json.dumps({"priority": "none"}),
+            issue_id=str(self.issues[0].id),
+            actor_id=str(self.user.id),
+            project_id=str(self.project.id),
+            epoch=int(timezone.now().timestamp()),
+            notification=True,
+        )
+
+        mocks["refresh_activity_rollups"].assert_called_once()
+        mocks["dispatch_webhook_activities"].assert_called_once()
+        mocks["notifications"].delay.assert_called_once()
@@ -0,0 +1,169 @@
+# Python imports
+from unittest import mock
+
+# Django imports
+from django.test import SimpleTestCase, TestCase, override_settings
+
+# Module imports
+from plane.db.models import (
+    IssueSequence,
+    IssueSequenceCounter,
+    Project,
+    User,
+    Workspace,
+)
+from plane.utils.issue_sequence import (
+    DEFAULT_SORT_ORDER,
+    SORT_ORDER_STEP,
+    reserve_issue_sequences,
+    reserve_issue_sort_orders,
+)
+
+
+class FakeRedis:
+    """Runs the reservation script on a dict, keys expire when asked to"""
+
+    def __init__(self):
+        self.values = {}
+        self.ttls = {}
+
+    def expire_now(self, key):
+        self.values.pop(key, None)
+        self.ttls.pop(key, None)
+
+    def register_script(self, script):
+        def reserve(keys, args):
+            key = keys[0]
+            if key not in self.values:
+                if len(args) < 3:
+                    return None
+                self.values[key] = float(args[1])
+                self.ttls[key] = args[2]
+            self.values[key] += float(args[0])
+            return str(self.values[key]).encode()
+
+        return reserve
+
+
+@override_settings(ISSUE_SORT_ORDER_CACHE_TTL=3600)
+@mock.patch("plane.utils.issue_sequence.get_largest_sort_order")
+class ReserveIssueSortOrdersTest(SimpleTestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        patcher = mock.patch(
+            "plane.utils.issue_sequence.redis_instance",
+            return_value=self.redis,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_blocks_follow_each_other(self, get_largest_sort_order):
+        get_largest_sort_order.return_value = 100000
+        self.assertEqual(
+            reserve_issue_sort_orders("project", "state", 3),
+            [110000, 120000, 130000],
+        )
+        self.assertEqual(
+            reserve_issue_sort_orders("project", "state"), [140000]
+        )
+        # The largest sort order is only read from the issues once
+        self.assertEqual(get_largest_sort_order.call_count, 1)
+
+    def test_empty_state_starts_from_the_default(self, get_largest_sort_order):
+        get_largest_sort_order.return_value = None
+        self.assertEqual(
+            reserve_issue_sort_orders("project", "state", 2),
+            [DEFAULT_SORT_ORDER, DEFAULT_SORT_ORDER + SORT_ORDER_STEP],
+        )
+
+    def test_expired_mark_is_seeded_again_with_a_ttl(
+        self, get_largest_sort_order
+    ):
+        get_largest_sort_order.return_value = 100000
+        reserve_issue_sort_orders("project", "state")
+        self.redis.expire_now("issue:sort_order:project:state")
+
+        # The issues moved on meanwhile, the mark never restarts from zero
+        get_largest_sort_order.return_value = 500000
+        self.assertEqual(
+            reserve_issue_sort_orders("project", "state"), [510000]
+        )
+        self.assertEqual(
+            self.redis.ttls["issue:sort_order:project:state"], 3600
+        )
+
+    def test_issues_without_a_state_are_ordered_per_project(
+        self, get_largest_sort_order
+    ):
+        get_largest_sort_order.side_effect = lambda project_id, state_id: {
+            "web": 100000,
+            "api": None,
+        }[project_id]
+        self.assertEqual(reserve_issue_sort_orders("web", None), [110000])
+        self.assertEqual(
+            reserve_issue_sort_orders("api", None), [DEFAULT_SORT_ORDER]
+        )
+
+    def test_issues_are_read_without_redis(self, get_largest_sort_order):
+        get_largest_sort_order.return_value = 100000
+        with mock.patch(
+            "plane.utils.issue_sequence.redis_instance",
+            side_effect=ConnectionError,
+        ):
+            self.assertEqual(
+                reserve_issue_sort_orders("project", "state", 2),
+                [110000, 120000],
+            )
+
+
+class ReserveIssueSequencesTest(TestCase):
+    def setUp(self):
+        owner = User.objects.create(email="user@plane.so", username="user")
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=owner
+        )
+        self.project = self.create_project("WEB")
+
+    def create_project(self, identifier):
+        return Project.objects.create(
+            name=identifier, identifier=identifier, workspace=self.workspace
+        )
+
+    def get_last_sequence(self, project):
+        return IssueSequenceCounter.objects.get(
+            project=project
+        ).last_sequence
+
+    def test_counter_is_seeded_from_the_sequences(self):
+        for sequence in (3, 7):
+            IssueSequence.objects.create(
+                sequence=sequence,
+                project=self.project,
+                workspace=self.workspace,
+            )
+        self.assertEqual(reserve_issue_sequences(self.project), 8)
+        self.assertEqual(self.get_last_sequence(self.project), 8)
+
+    def test_blocks_are_contiguous(self):
+        self.assertEqual(reserve_issue_sequences(self.project, 3), 1)
+        self.assertEqual(reserve_issue_sequences(self.project, 2), 4)
+        self.assertEqual(reserve_issue_sequences(self.project), 6)
+        self.assertEqual(self.get_last_sequence(self.project), 6)
+
+    def test_existing_counter_is_updated_in_place(self):
+        reserve_issue_sequences(self.project, 5)
+        # Sequences are only read to seed the counter
+        IssueSequence.objects.create(
+            sequence=100, project=self.project, workspace=self.workspace
+        )
+        self.assertEqual(reserve_issue_sequences(self.project), 6)
+        self.assertEqual(
+            IssueSequenceCounter.objects.filter(project=self.project).count(),
+            1,
+        )
+
+    def test_projects_are_counted_apart(self):
+        other = self.create_project("API")
+        reserve_issue_sequences(self.project, 10)
+        self.assertEqual(reserve_issue_sequences(other), 1)
+        self.assertEqual(self.get_last_sequence(self.project), 10)
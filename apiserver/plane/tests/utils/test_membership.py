@@ -0,0 +1,59 @@
+# Python imports
+from types import SimpleNamespace
+from unittest import mock
+from uuid import uuid4
+
+# Django imports
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+
+# Module imports
+from plane.utils import membership
+from plane.utils.membership import Membership
+
+LOCAL_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@override_settings(CACHES=LOCAL_CACHES, MEMBERSHIP_CACHE_TTL=60)
+class MembershipTest(SimpleTestCase):
+    def setUp(self):
+        caches["default"].clear()
+        self.user_id = uuid4()
+        self.project_id = uuid4()
+        loader = mock.patch.object(
+            membership,
+            "load_membership",
+            side_effect=lambda user_id, slug: Membership(
+                20, {str(self.project_id): 15}
+            ),
+        )
+        self.load_membership = loader.start()
+        self.addCleanup(loader.stop)
+
+    def get_request(self):
+        http_request = SimpleNamespace()
+        return SimpleNamespace(
+            user=SimpleNamespace(id=self.user_id), _request=http_request
+        )
+
+    def test_roles_are_resolved_once_per_request(self):
+        request = self.get_request()
+        first = membership.get_membership(request, "acme")
+        second = membership.get_membership(request, "acme")
+
+        self.assertIs(first, second)
+        self.assertTrue(first.has_workspace_role([20]))
+        self.assertTrue(first.has_project_role(self.project_id, [15, 20]))
+        self.assertFalse(first.has_project_role(uuid4(), [15, 20]))
+        self.assertEqual(self.load_membership.call_count, 1)
+
+    def test_invalidation_reloads_cached_roles(self):
+        membership.get_membership(self.get_request(), "acme")
+        membership.get_membership(self.get_request(), "acme")
+        self.assertEqual(self.load_membership.call_count, 1)
+
+        membership.invalidate_membership([self.user_id])
+        membership.get_membership(self.get_request(), "acme")
+        self.assertEqual(self.load_membership.call_count, 2)
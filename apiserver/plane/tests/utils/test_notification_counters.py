@@ -0,0 +1,59 @@
+# Python imports
+from unittest import mock
+from uuid import uuid4
+
+# Django imports
+from django.test import SimpleTestCase
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import Notification
+from plane.utils import notification_counters
+from plane.utils.notification_counters import (
+    get_counter_field,
+    is_counted,
+    track_notification_change,
+)
+
+
+class NotificationCountersTest(SimpleTestCase):
+    def setUp(self):
+        patcher = mock.patch.object(
+            notification_counters, "update_notification_counters"
+        )
+        self.update_counters = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_notification(self, sender="in_app:issue_activities:subscribed"):
+        return Notification(receiver_id=uuid4(), sender=sender)
+
+    def test_mentions_are_counted_apart(self):
+        self.assertEqual(get_counter_field(self.get_notification()), "unread")
+        self.assertEqual(
+            get_counter_field(
+                self.get_notification("in_app:issue_activities:mentioned")
+            ),
+            "mention",
+        )
+
+    def test_reading_decrements_and_unreading_increments(self):
+        notification = self.get_notification()
+        was_counted = is_counted(notification)
+        notification.read_at = timezone.now()
+        track_notification_change("acme", notification, was_counted)
+        self.update_counters.assert_called_once_with(
+            "acme", [notification], -1
+        )
+
+        was_counted = is_counted(notification)
+        notification.read_at = None
+        track_notification_change("acme", notification, was_counted)
+        self.update_counters.assert_called_with("acme", [notification], 1)
+
+    def test_archiving_a_read_notification_keeps_counters(self):
+        notification = self.get_notification()
+        notification.read_at = timezone.now()
+        was_counted = is_counted(notification)
+        notification.archived_at = timezone.now()
+        track_notification_change("acme", notification, was_counted)
+        self.update_counters.assert_not_called()
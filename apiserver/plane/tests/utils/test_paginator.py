@@ -0,0 +1,460 @@
+# Python imports
+from datetime import date, datetime, timedelta, timezone
+from uuid import UUID
+
+# Django imports
+from django.db.models import Q
+from django.test import SimpleTestCase, TestCase
+
+# Module imports
+from plane.db.models import (
+    Issue,
+    IssueActivity,
+    IssueAssignee,
+    IssueComment,
+    IssueLabel,
+    Label,
+    Project,
+    State,
+    User,
+    Workspace,
+)
+from plane.utils.paginator import (
+    GroupedOffsetPaginator,
+    KeysetCursor,
+    KeysetPaginator,
+    MergedKeysetPaginator,
+    SubGroupedOffsetPaginator,
+)
+
+CREATED_AT = "2024-06-01T10:00:00Z"
+
+# Rows created within the same millisecond
+BOUNDARY_TIME = datetime(2024, 6, 1, 10, 0, 0, 123456, tzinfo=timezone.utc)
+
+
+class KeysetCursorTest(SimpleTestCase):
+    def test_position_survives_the_round_trip(self):
+        pk = UUID("8f2b5b8e-3c6e-4f8e-9a57-1a2b3c4d5e6f")
+        cursor = KeysetCursor(("High", BOUNDARY_TIME, pk), True)
+
+        parsed = KeysetCursor.from_string(str(cursor))
+        self.assertEqual(
+            parsed.position,
+            ("High", "2024-06-01T10:00:00.123456+00:00", str(pk)),
+        )
+        self.assertTrue(parsed.is_prev)
+        self.assertEqual(
+            datetime.fromisoformat(parsed.position[1]), BOUNDARY_TIME
+        )
+
+    def test_offset_cursors_are_still_accepted(self):
+        cursor = KeysetCursor.from_string("100:2:0")
+        self.assertEqual((cursor.value, cursor.offset), (100, 2))
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(ValueError):
+            KeysetCursor.from_string("k:not-a-cursor")
+
+
+class KeysetPaginatorTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(
+            email="user@plane.so", username="user"
+        )
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        self.project = Project.objects.create(
+            name="Web", identifier="WEB", workspace=self.workspace
+        )
+        self.state = State.objects.create(
+            name="Backlog",
+            group="backlog",
+            default=True,
+            project=self.project,
+            workspace=self.workspace,
+        )
+
+    def create_issues(self, rows):
+        issues = []
+        for index, (target_date, created_at) in enumerate(rows):
+            issue = Issue.objects.create(
+                name=f"Issue {index}",
+                target_date=target_date,
+                state=self.state,
+                project=self.project,
+                workspace=self.workspace,
+            )
+            # created_at is set on insert, move it to the wanted time
+            Issue.objects.filter(pk=issue.pk).update(created_at=created_at)
+            issues.append(issue.pk)
+        return issues
+
+    def get_page(self, order_by, cursor=None, limit=2):
+        paginator = KeysetPaginator(
+            queryset=Issue.objects.filter(project=self.project),
+            order_by=order_by,
+        )
+        # Cursors reach the paginator through their string form
+        if cursor is not None:
+            cursor = KeysetCursor.from_string(str(cursor))
+        return paginator.get_result(limit=limit, cursor=cursor)
+
+    def get_all_pages(self, order_by, limit=2):
+        pages, cursor = [], None
+        while True:
+            page = self.get_page(order_by, cursor, limit)
+            pages.append([issue.pk for issue in page])
+            if not page.next:
+                return pages
+            cursor = page.next
+
+    def test_rows_of_the_same_millisecond_are_not_skipped(self):
+        issues = self.create_issues(
+            [
+                (None, BOUNDARY_TIME + timedelta(microseconds=offset))
+                for offset in (0, 100, 200, 300)
+            ]
+        )
+        pages = self.get_all_pages("-created_at", limit=1)
+        self.assertEqual(pages, [[pk] for pk in reversed(issues)])
+
+    def test_ties_are_broken_by_created_at_and_id(self):
+        target_date = date(2024, 7, 1)
+        issues = self.create_issues(
+            [
+                (target_date, BOUNDARY_TIME),
+                (target_date, BOUNDARY_TIME),
+                (target_date, BOUNDARY_TIME + timedelta(seconds=1)),
+            ]
+        )
+        # Same creation time, the larger id comes first
+        tied = sorted(issues[:2], reverse=True)
+        pages = self.get_all_pages("target_date", limit=1)
+        self.assertEqual(pages, [[issues[2]], [tied[0]], [tied[1]]])
+
+    def test_nulls_are_last_in_both_directions(self):
+        issues = self.create_issues(
+            [
+                (None, BOUNDARY_TIME),
+                (date(2024, 7, 2), BOUNDARY_TIME),
+                (None, BOUNDARY_TIME + timedelta(seconds=1)),
+                (date(2024, 7, 1), BOUNDARY_TIME),
+            ]
+        )
+        expected = [[issues[3], issues[1]], [issues[2], issues[0]]]
+        self.assertEqual(self.get_all_pages("target_date"), expected)
+        self.assertEqual(
+            self.get_all_pages("-target_date"),
+            [[issues[1], issues[3]], [issues[2], issues[0]]],
+        )
+
+    def test_backward_pages_return_the_previous_rows(self):
+        issues = self.create_issues(
+            [
+                (None, BOUNDARY_TIME + timedelta(microseconds=offset))
+                for offset in range(5)
+            ]
+        )
+        ordered = list(reversed(issues))
+
+        first = self.get_page("-created_at")
+        second = self.get_page("-created_at", first.next)
+        third = self.get_page("-created_at", second.next)
+        self.assertEqual([issue.pk for issue in third], ordered[4:])
+        self.assertFalse(third.next)
+
+        back = self.get_page("-created_at", third.prev)
+        self.assertEqual([issue.pk for issue in back], ordered[2:4])
+        self.assertTrue(back.prev)
+
+        first_again = self.get_page("-created_at", back.prev)
+        self.assertEqual([issue.pk for issue in first_again], ordered[:2])
+        self.assertFalse(first_again.prev)
+        self.assertTrue(first_again.next)
+
+
+class GroupedPaginatorTest(TestCase):
+    def setUp(self):
+        self.workspace = Workspace.objects.create(
+            name="Plane",
+            slug="plane",
+            owner=User.objects.create(email="user@plane.so", username="user"),
+        )
+        self.project = Project.objects.create(
+            name="Web", identifier="WEB", workspace=self.workspace
+        )
+        self.backlog, self.todo = (
+            State.objects.create(
+                name=name,
+                group=group,
+                project=self.project,
+                workspace=self.workspace,
+            )
+            for name, group in (("Backlog", "backlog"), ("Todo", "unstarted"))
+        )
+        self.bug, self.ui, self.api = (
+            Label.objects.create(
+                name=name, project=self.project, workspace=self.workspace
+            )
+            for name in ("Bug", "UI", "API")
+        )
+        self.alice, self.bob = (
+            User.objects.create(email=f"{name}@plane.so", username=name)
+            for name in ("alice", "bob")
+        )
+        # Created in order, the latest issue of a group is paged first
+        self.both = self.create_issue(
+            self.backlog, [self.bug, self.ui], [self.alice, self.bob], "high"
+        )
+        self.bug_only = self.create_issue(self.backlog, [self.bug], [self.bob])
+        self.todo_ui = self.create_issue(self.todo, [self.ui], [self.alice])
+        self.excluded = self.create_issue(self.backlog, [self.api], [])
+
+    def create_issue(self, state, labels, assignees, priority="none"):
+        issue = Issue.objects.create(
+            name=f"Issue {Issue.objects.count()}",
+            priority=priority,
+            state=state,
+            project=self.project,
+            workspace=self.workspace,
+        )
+        for label in labels:
+            IssueLabel.objects.create(
+                issue=issue,
+                label=label,
+                project=self.project,
+                workspace=self.workspace,
+            )
+        for assignee in assignees:
+            IssueAssignee.objects.create(
+                issue=issue,
+                assignee=assignee,
+                project=self.project,
+                workspace=self.workspace,
+            )
+        return issue
+
+    def get_queryset(self):
+        # Both filters join a row per matching label and assignee
+        return Issue.issue_objects.filter(
+            project=self.project,
+            labels__in=[self.bug, self.ui],
+            assignees__in=[self.alice, self.bob],
+        ).distinct()
+
+    def test_grouped_pages_count_every_issue_once(self):
+        paginator = GroupedOffsetPaginator(
+            self.get_queryset(),
+            group_by_field_name="state_id",
+            group_by_fields=[self.backlog.id, self.todo.id],
+            count_filter=Q(archived_at__isnull=True),
+            order_by="-created_at",
+        )
+        page = paginator.get_result(limit=1)
+
+        self.assertEqual(
+            {issue.pk for issue in page.results},
+            {self.bug_only.pk, self.todo_ui.pk},
+        )
+        self.assertTrue(page.next)
+        self.assertEqual(page.hits, 3)
+        self.assertEqual(page.max_hits, 2)
+        self.assertEqual(
+            paginator.partition_totals["group_total"],
+            {(str(self.backlog.id),): 2, (str(self.todo.id),): 1},
+        )
+
+        last = paginator.get_result(limit=1, cursor=page.next)
+        self.assertEqual([issue.pk for issue in last.results], [self.both.pk])
+        self.assertFalse(last.next)
+
+    def test_group_totals_keep_the_count_filter(self):
+        paginator = GroupedOffsetPaginator(
+            self.get_queryset(),
+            group_by_field_name="state_id",
+            group_by_fields=[self.backlog.id, self.todo.id],
+            count_filter=Q(priority="high"),
+            order_by="-created_at",
+        )
+        paginator.get_result(limit=10)
+        self.assertEqual(
+            paginator.partition_totals["group_total"],
+            {(str(self.backlog.id),): 1, (str(self.todo.id),): 0},
+        )
+
+    def test_m2m_groups_hold_one_row_per_issue(self):
+        paginator = GroupedOffsetPaginator(
+            self.get_queryset(),
+            group_by_field_name="labels__id",
+            group_by_fields=[self.bug.id, self.ui.id],
+            count_filter=Q(archived_at__isnull=True),
+            order_by="-created_at",
+        )
+        page = paginator.get_result(limit=1)
+
+        self.assertEqual(
+            paginator.page_rows,
+            {
+                (str(self.bug_only.id), str(self.bug.id)),
+                (str(self.todo_ui.id), str(self.ui.id)),
+            },
+        )
+        self.assertTrue(page.next)
+        self.assertEqual(
+            paginator.partition_totals["group_total"],
+            {(str(self.bug.id),): 2, (str(self.ui.id),): 2},
+        )
+
+    def test_sub_grouped_pages_count_every_issue_once(self):
+        paginator = SubGroupedOffsetPaginator(
+            self.get_queryset(),
+            group_by_field_name="state_id",
+            sub_group_by_field_name="labels__id",
+            group_by_fields=[self.backlog.id, self.todo.id],
+            sub_group_by_fields=[self.bug.id, self.ui.id],
+            count_filter=Q(archived_at__isnull=True),
+            order_by="-created_at",
+        )
+        page = paginator.get_result(limit=1)
+
+        self.assertEqual(
+            paginator.page_rows,
+            {
+                (
+                    str(self.bug_only.id),
+                    str(self.backlog.id),
+                    str(self.bug.id),
+                ),
+                (str(self.both.id), str(self.backlog.id), str(self.ui.id)),
+                (str(self.todo_ui.id), str(self.todo.id), str(self.ui.id)),
+            },
+        )
+        self.assertTrue(page.next)
+        self.assertEqual(
+            paginator.partition_totals["sub_group_total"],
+            {
+                (str(self.backlog.id), str(self.bug.id)): 2,
+                (str(self.backlog.id), str(self.ui.id)): 1,
+                (str(self.todo.id), str(self.ui.id)): 1,
+            },
+        )
+
+
+class MergedKeysetPaginatorTest(SimpleTestCase):
+    def setUp(self):
+        self.paginator = MergedKeysetPaginator(querysets=[])
+        self.position = (CREATED_AT, 1, "id")
+
+    def test_rows_of_the_same_source_seek_past_the_id(self):
+        self.assertEqual(
+            self.paginator.get_seek_filter(1, self.position),
+            Q(created_at__gt=CREATED_AT)
+            | Q(created_at=CREATED_AT, id__gt="id"),
+        )
+        self.assertEqual(
+            self.paginator.get_seek_filter(1, self.position, reverse=True),
+            Q(created_at__lt=CREATED_AT)
+            | Q(created_at=CREATED_AT, id__lt="id"),
+        )
+
+    def test_ties_of_other_sources_follow_the_source_order(self):
+        # Later sources are ordered after the boundary row on ties
+        self.assertEqual(
+            self.paginator.get_seek_filter(2, self.position),
+            Q(created_at__gte=CREATED_AT),
+        )
+        self.assertEqual(
+            self.paginator.get_seek_filter(0, self.position),
+            Q(created_at__gt=CREATED_AT),
+        )
+        self.assertEqual(
+            self.paginator.get_seek_filter(0, self.position, reverse=True),
+            Q(created_at__lte=CREATED_AT),
+        )
+        self.assertEqual(
+            self.paginator.get_seek_filter(2, self.position, reverse=True),
+            Q(created_at__lt=CREATED_AT),
+        )
+
+
+class MergedKeysetPaginatorQueryTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(
+            email="user@plane.so", username="user"
+        )
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        self.project = Project.objects.create(
+            name="Web", identifier="WEB", workspace=self.workspace
+        )
+        self.issue = Issue.objects.create(
+            name="Issue", project=self.project, workspace=self.workspace
+        )
+        # Entries of the timeline within the same millisecond, the last
+        # activity and comment are created at the same time
+        self.timeline = [
+            self.create_entry(IssueActivity, 0),
+            self.create_entry(IssueComment, 50),
+            self.create_entry(IssueActivity, 100),
+            self.create_entry(IssueActivity, 200),
+            self.create_entry(IssueComment, 200),
+        ]
+
+    def create_entry(self, model, microseconds):
+        fields = {"verb": "updated"} if model is IssueActivity else {}
+        entry = model.objects.create(
+            issue=self.issue,
+            actor=self.user,
+            project=self.project,
+            workspace=self.workspace,
+            **fields,
+        )
+        # created_at is set on insert, move it to the wanted time
+        model.objects.filter(pk=entry.pk).update(
+            created_at=BOUNDARY_TIME + timedelta(microseconds=microseconds)
+        )
+        return entry.pk
+
+    def get_page(self, cursor=None, limit=2):
+        paginator = MergedKeysetPaginator(
+            querysets=[
+                IssueActivity.objects.filter(issue=self.issue),
+                IssueComment.objects.filter(issue=self.issue),
+            ]
+        )
+        # Cursors reach the paginator through their string form
+        if cursor is not None:
+            cursor = KeysetCursor.from_string(str(cursor))
+        return paginator.get_result(limit=limit, cursor=cursor)
+
+    def test_next_pages_do_not_repeat_the_last_entry(self):
+        pages, page = [], self.get_page()
+        pages.append([entry.pk for entry in page])
+        while page.next:
+            page = self.get_page(page.next)
+            pages.append([entry.pk for entry in page])
+
+        self.assertEqual(
+            pages,
+            [self.timeline[:2], self.timeline[2:4], self.timeline[4:]],
+        )
+
+        # Polling the last page only returns the newer entries
+        self.assertEqual(list(self.get_page(page.next)), [])
+        newer = self.create_entry(IssueComment, 300)
+        self.assertEqual(
+            [entry.pk for entry in self.get_page(page.next)], [newer]
+        )
+
+    def test_previous_page_stops_before_the_first_entry(self):
+        first = self.get_page(limit=3)
+        last = self.get_page(first.next, limit=3)
+        self.assertEqual([entry.pk for entry in last], self.timeline[3:])
+
+        previous = self.get_page(last.prev, limit=2)
+        self.assertEqual(
+            [entry.pk for entry in previous], self.timeline[1:3]
+        )
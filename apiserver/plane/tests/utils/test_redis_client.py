@@ -0,0 +1,52 @@
+# Python imports
+from unittest import mock
+
+# Django imports
+from django.test import SimpleTestCase, override_settings
+
+# Module imports
+from plane.settings import redis as redis_client
+from plane.settings.redis import CommandStats, redis_instance
+
+LOCAL_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+@override_settings(
+    CACHES=LOCAL_CACHES, REDIS_URL="redis://localhost:6379", REDIS_SSL=False
+)
+class RedisClientTest(SimpleTestCase):
+    def setUp(self):
+        redis_client.reset_client()
+        self.addCleanup(redis_client.reset_client)
+
+    def test_client_and_pool_are_shared(self):
+        client = redis_instance()
+        self.assertIs(redis_instance(), client)
+        self.assertIs(
+            redis_instance().pipeline().connection_pool,
+            client.connection_pool,
+        )
+
+    def test_forked_child_builds_its_own_client(self):
+        client = redis_instance()
+        # What the child runs after a fork
+        redis_client.reset_client()
+        self.assertIsNot(redis_instance(), client)
+
+    @override_settings(REDIS_METRICS_FLUSH_INTERVAL=60)
+    def test_command_latency_is_flushed_once_per_interval(self):
+        stats = CommandStats()
+        pool = mock.Mock(_created_connections=2, _in_use_connections=[1])
+        with mock.patch.object(stats, "flush") as flush:
+            stats.record("GET", 0.5, pool)
+            stats.record("GET", 0.25, pool)
+            flush.assert_not_called()
+
+            stats.flushed_at -= 60
+            stats.record("SET", 0.25, pool)
+        flush.assert_called_once_with(
+            {"GET": (0.75, 2), "SET": (0.25, 1)}, 2, pool
+        )
+        self.assertEqual(stats.commands, {})
@@ -0,0 +1,32 @@
+# Django imports
+from django.db.models import Q
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.utils.search import (
+    exact_match_filter,
+    get_search_query,
+    is_search_update,
+)
+
+
+class SearchTest(SimpleTestCase):
+    def test_every_word_is_matched_as_a_prefix(self):
+        search_query = get_search_query("login pa'ge")
+        self.assertEqual(
+            search_query.source_expressions[-1].value, "login:* & pa:* & ge:*"
+        )
+        self.assertIsNone(get_search_query("!?"))
+
+    def test_issue_references_are_exact_matches(self):
+        self.assertEqual(
+            exact_match_filter("WEB-12"),
+            Q(project__identifier__iexact="WEB", sequence_id="12"),
+        )
+        self.assertEqual(exact_match_filter("fix 7"), Q(sequence_id="7"))
+        self.assertIsNone(exact_match_filter("login"))
+
+    def test_saves_of_other_fields_are_not_indexed(self):
+        self.assertTrue(is_search_update(None))
+        self.assertTrue(is_search_update(["name", "sort_order"]))
+        self.assertFalse(is_search_update(["sort_order"]))
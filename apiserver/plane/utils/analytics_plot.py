@@ -9,6 +9,7 @@ from django.db.models import (
     CharField,
     Count,
     F,
+    Q,
     Sum,
     Value,
     When,
@@ -25,7 +26,20 @@ from django.db.models.functions import (
 from django.utils import timezone
 
 # Module imports
-from plane.db.models import Issue, Project
+from plane.db.models import (
+    CycleBurndownSnapshot,
+    Issue,
+    ModuleBurndownSnapshot,
+)
+
+# Burndown entity -> issue relation
+BURNDOWN_RELATIONS = {"cycle": "issue_cycle", "module": "issue_module"}
+
+# Burndown entity -> daily snapshot model
+BURNDOWN_SNAPSHOTS = {
+    "cycle": CycleBurndownSnapshot,
+    "module": ModuleBurndownSnapshot,
+}
 
 
 def annotate_with_monthly_dimension(queryset, field_name, attribute):
@@ -120,6 +134,66 @@ def build_graph_plot(queryset, x_axis, y_axis, segment=None):
     return sort_data(grouped_data, temp_axis)
 
 
+def burndown_date_range(start_date, end_date):
+    # Get all dates between the two dates
+    if not start_date or not end_date:
+        return []
+    return [
+        start_date + timedelta(days=x)
+        for x in range((end_date - start_date).days + 1)
+    ]
+
+
+def burndown_distribution(field, entity_id, **filters):
+    """
+    Issue count and estimate points of a cycle or module per completion date,
+    issues that are not completed are under a None date
+    """
+    relation = BURNDOWN_RELATIONS[field]
+    return list(
+        Issue.issue_objects.filter(
+            **{
+                f"{relation}__{field}_id": entity_id,
+                f"{relation}__deleted_at__isnull": True,
+            },
+            **filters,
+        )
+        .annotate(date=TruncDate("completed_at"))
+        .values("date")
+        .annotate(
+            issue_count=Count("id", distinct=True),
+            estimate_points=Sum(
+                Cast("estimate_point__value", FloatField()),
+                filter=Q(estimate_point__estimate__type="points"),
+            ),
+        )
+        .order_by()
+    )
+
+
+def burndown_chart(distribution, dates):
+    """
+    Pending issues and estimate points at the end of every date, walking the
+    sorted dates and completion distribution together in a single pass
+    """
+    pending_issues = sum(item["issue_count"] for item in distribution)
+    pending_points = sum(item["estimate_points"] or 0 for item in distribution)
+    completed = sorted(
+        (item for item in distribution if item["date"] is not None),
+        key=lambda item: item["date"],
+    )
+
+    chart = {}
+    index = 0
+    for date in sorted(dates):
+        while index < len(completed) and completed[index]["date"] <= date:
+            pending_issues -= completed[index]["issue_count"]
+            pending_points -= completed[index]["estimate_points"] or 0
+            index += 1
+        chart[date] = (pending_issues, pending_points)
+    return chart
+
+
 def burndown_plot(
     queryset,
     slug,
@@ -128,143 +202,57 @@ def burndown_plot(
     cycle_id=None,
     module_id=None,
 ):
-    # Total Issues in Cycle or Module
-    total_issues = queryset.total_issues
-    # check whether the estimate is a point or not
-    estimate_type = Project.objects.filter(
-        workspace__slug=slug,
-        pk=project_id,
-        estimate__isnull=False,
-        estimate__type="points",
-    ).exists()
-    if estimate_type and plot_type == "points" and cycle_id:
-        issue_estimates = Issue.objects.filter(
-            workspace__slug=slug,
-            project_id=project_id,
-            issue_cycle__cycle_id=cycle_id,
-            estimate_point__isnull=False,
-        ).values_list("estimate_point__value", flat=True)
-
-        issue_estimates = [float(value) for value in issue_estimates]
-        total_estimate_points = sum(issue_estimates)
-
-    if estimate_type and plot_type == "points" and module_id:
-        issue_estimates = Issue.objects.filter(
-            workspace__slug=slug,
-            project_id=project_id,
-            issue_module__module_id=module_id,
-            estimate_point__isnull=False,
-        ).values_list("estimate_point__value", flat=True)
-
-        issue_estimates = [float(value) for value in issue_estimates]
-        total_estimate_points = sum(issue_estimates)
-
     if cycle_id:
-        if queryset.end_date and queryset.start_date:
-            # Get all dates between the two dates
-            date_range = [
-                queryset.start_date + timedelta(days=x)
-                for x in range(
-                    (queryset.end_date - queryset.start_date).days + 1
-                )
-            ]
-        else:
-            date_range = []
-
-        chart_data = {str(date): 0 for date in date_range}
-
-        if plot_type == "points":
-            completed_issues_estimate_point_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_cycle__cycle_id=cycle_id,
-                    estimate_point__isnull=False,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .values("date", "estimate_point__value")
-                .order_by("date")
-            )
-        else:
-            completed_issues_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_cycle__cycle_id=cycle_id,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .annotate(total_completed=Count("id"))
-                .values("date", "total_completed")
-                .order_by("date")
-            )
-
-    if module_id:
-        # Get all dates between the two dates
-        date_range = [
-            queryset.start_date + timedelta(days=x)
-            for x in range(
-                (queryset.target_date - queryset.start_date).days + 1
-            )
-        ]
+        field, entity_id = "cycle", cycle_id
+        date_range = burndown_date_range(
+            queryset.start_date, queryset.end_date
+        )
+    else:
+        field, entity_id = "module", module_id
+        date_range = burndown_date_range(
+            queryset.start_date, queryset.target_date
+        )
 
-        chart_data = {str(date): 0 for date in date_range}
+    today = timezone.now().date()
+    chart_data = {str(date): None for date in date_range}
 
-        if plot_type == "points":
-            completed_issues_estimate_point_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_module__module_id=module_id,
-                    estimate_point__isnull=False,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .values("date", "estimate_point__value")
-                .order_by("date")
-            )
-        else:
-            completed_issues_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_module__module_id=module_id,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .annotate(total_completed=Count("id"))
-                .values("date", "total_completed")
-                .order_by("date")
+    # Past days are served from the daily snapshots
+    value_field = (
+        "pending_estimate_points"
+        if plot_type == "points"
+        else "pending_issues"
+    )
+    snapshots = {}
+    if date_range:
+        snapshots = dict(
+            BURNDOWN_SNAPSHOTS[field]
+            .objects.filter(
+                **{f"{field}_id": entity_id},
+                date__range=(date_range[0], date_range[-1]),
+                date__lt=today,
             )
+            .values_list("date", value_field)
+        )
+    for date, value in snapshots.items():
+        chart_data[str(date)] = value
 
-    if plot_type == "points":
-        for date in date_range:
-            cumulative_pending_issues = total_estimate_points
-            total_completed = 0
-            total_completed = sum(
-                float(item["estimate_point__value"])
-                for item in completed_issues_estimate_point_distribution
-                if item["date"] is not None and item["date"] <= date
-            )
-            cumulative_pending_issues -= total_completed
-            if date > timezone.now().date():
-                chart_data[str(date)] = None
-            else:
-                chart_data[str(date)] = cumulative_pending_issues
-    else:
-        for date in date_range:
-            cumulative_pending_issues = total_issues
-            total_completed = 0
-            total_completed = sum(
-                item["total_completed"]
-                for item in completed_issues_distribution
-                if item["date"] is not None and item["date"] <= date
+    # Today and the days without a snapshot are computed
+    dates = [
+        date for date in date_range if date <= today and date not in snapshots
+    ]
+    if dates:
+        chart = burndown_chart(
+            burndown_distribution(
+                field,
+                entity_id,
+                workspace__slug=slug,
+                project_id=project_id,
+            ),
+            dates,
+        )
+        for date, (pending_issues, pending_points) in chart.items():
+            chart_data[str(date)] = (
+                pending_points if plot_type == "points" else pending_issues
             )
-            cumulative_pending_issues -= total_completed
-            if date > timezone.now().date():
-                chart_data[str(date)] = None
-            else:
-                chart_data[str(date)] = cumulative_pending_issues
 
     return chart_data
@@ -0,0 +1,121 @@
+# Python imports
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+# Django imports
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import APIToken, User
+from plane.settings.redis import redis_instance
+
+API_TOKEN_CACHE_KEY = "api_token:{digest}"
+
+# Redis hash of token id -> last used timestamp, flushed by a beat task
+API_TOKEN_LAST_USED_KEY = "api_token:last_used"
+
+
+class LRUCache:
+    """Thread safe in process LRU cache whose entries expire after ttl seconds"""
+
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.items = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            item = self.items.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at <= time.monotonic():
+                del self.items[key]
+                return None
+            self.items.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self.lock:
+            self.items[key] = (value, time.monotonic() + self.ttl)
+            self.items.move_to_end(key)
+            while len(self.items) > self.max_size:
+                self.items.popitem(last=False)
+
+    def delete(self, key):
+        with self.lock:
+            self.items.pop(key, None)
+
+
+# Other processes see a revoked token once their local entry expires
+local_tokens = LRUCache(
+    settings.API_TOKEN_LOCAL_CACHE_SIZE, settings.API_TOKEN_LOCAL_CACHE_TTL
+)
+local_users = LRUCache(
+    settings.API_TOKEN_LOCAL_CACHE_SIZE, settings.API_TOKEN_LOCAL_CACHE_TTL
+)
+local_last_used = LRUCache(
+    settings.API_TOKEN_LOCAL_CACHE_SIZE, settings.API_TOKEN_LAST_USED_INTERVAL
+)
+
+
+def get_api_token_key(token):
+    # Tokens are never written to the cache in plain text
+    digest = hashlib.sha256(token.encode("utf-8")).hexdigest()
+    return API_TOKEN_CACHE_KEY.format(digest=digest)
+
+
+def get_api_token(token):
+    """
+    Resolve an active API token to its id, user and service flag from the
+    process cache, then Redis, then the database. None when not valid.
+    """
+    key = get_api_token_key(token)
+    api_token = local_tokens.get(key)
+    if api_token is None:
+        api_token = cache.get(key)
+        if api_token is None:
+            api_token = (
+                APIToken.objects.filter(token=token, is_active=True)
+                .values("id", "user_id", "is_service", "expired_at")
+                .first()
+            )
+            if api_token is None:
+                return None
+            cache.set(key, api_token, settings.API_TOKEN_CACHE_TTL)
+        local_tokens.set(key, api_token)
+
+    if api_token["expired_at"] and api_token["expired_at"] <= timezone.now():
+        return None
+    return api_token
+
+
+def get_api_token_user(api_token):
+    user = local_users.get(api_token["user_id"])
+    if user is None:
+        user = User.objects.get(pk=api_token["user_id"])
+        local_users.set(api_token["user_id"], user)
+    # Requests get their own instance to change
+    return copy.copy(user)
+
+
+def touch_api_token(api_token):
+    """Record the token use at most once per interval per process"""
+    if local_last_used.get(api_token["id"]):
+        return
+    local_last_used.set(api_token["id"], True)
+    redis_instance().hset(
+        API_TOKEN_LAST_USED_KEY, str(api_token["id"]), time.time()
+    )
+
+
+def invalidate_api_token(token):
+    key = get_api_token_key(token)
+    cache.delete(key)
+    local_tokens.delete(key)
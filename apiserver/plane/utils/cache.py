@@ -1,5 +1,6 @@
 # Python imports
 from functools import wraps
+from uuid import uuid4
 
 # Django imports
 from django.conf import settings
@@ -8,6 +9,13 @@ from django.core.cache import cache
 # Third party imports
 from rest_framework.response import Response
 
+# Module imports
+from plane.utils.metrics import increment_metric
+
+# Generation of a tag, cached entries hold the generations of their tags
+# and are stale once any of them moved on
+CACHE_TAG_KEY = "cache:tag:{tag}"
+
 
 def generate_cache_key(custom_path, auth_header=None):
     """Generate a cache key with the given params"""
@@ -18,12 +26,84 @@ def generate_cache_key(custom_path, auth_header=None):
     return key_data
 
 
+def path_tag(path, user_id=None):
+    path = path.split("?")[0]
+    if user_id:
+        return f"path:{path}:{user_id}"
+    return f"path:{path}"
+
+
+def user_tag(user_id):
+    return f"user:{user_id}"
+
+
+def workspace_tag(slug):
+    return f"workspace:{slug}"
+
+
+def get_path_prefixes(path):
+    """Every prefix of the path ending with a slash, e.g. /api/ for /api/me/"""
+    path = path.split("?")[0]
+    prefixes = [
+        path[: index + 1] for index, char in enumerate(path) if char == "/"
+    ]
+    if path not in prefixes:
+        prefixes.append(path)
+    return prefixes
+
+
+def get_cache_tags(custom_path, user_id=None, slug=None):
+    """
+    Tags of a cached entry, invalidating the tag of a path covers the entries
+    of every path below it like the key patterns it replaces
+    """
+    tags = []
+    for prefix in get_path_prefixes(custom_path):
+        tags.append(path_tag(prefix))
+        if user_id:
+            tags.append(path_tag(prefix, user_id))
+    if user_id:
+        tags.append(user_tag(user_id))
+    if slug:
+        tags.append(workspace_tag(slug))
+    return tags
+
+
+def get_tag_generations(tags, cached=None):
+    """Current generation of the tags, starting the ones that are missing"""
+    keys = {tag: CACHE_TAG_KEY.format(tag=tag) for tag in tags}
+    if cached is None:
+        cached = cache.get_many(keys.values())
+    generations = {}
+    for tag, key in keys.items():
+        if key not in cached:
+            generation = uuid4().hex
+            # Another process may have started the tag meanwhile
+            if not cache.add(key, generation, None):
+                generation = cache.get(key)
+            cached[key] = generation
+        generations[tag] = cached[key]
+    return generations
+
+
+def invalidate_cache_tags(*tags):
+    """Mark every entry cached under the tags as stale, without any scan"""
+    cache.set_many(
+        {CACHE_TAG_KEY.format(tag=tag): uuid4().hex for tag in tags}, None
+    )
+
+
+def get_view_name(instance, view_func):
+    return f"{type(instance).__name__}.{view_func.__name__}"
+
+
 def cache_response(timeout=60 * 60, path=None, user=True):
     """decorator to create cache per user"""
 
     def decorator(view_func):
         @wraps(view_func)
         def _wrapped_view(instance, request, *args, **kwargs):
+            view_name = get_view_name(instance, view_func)
             # Function to generate cache key
             auth_header = (
                 None
@@ -32,17 +112,35 @@ def cache_response(timeout=60 * 60, path=None, user=True):
             )
             custom_path = path if path is not None else request.get_full_path()
             key = generate_cache_key(custom_path, auth_header)
-            cached_result = cache.get(key)
+            tags = get_cache_tags(
+                custom_path, auth_header, kwargs.get("slug")
+            )
 
-            if cached_result is not None:
+            # The entry and the generations of its tags are read at once
+            cached = cache.get_many(
+                [key] + [CACHE_TAG_KEY.format(tag=tag) for tag in tags]
+            )
+            cached_result = cached.pop(key, None)
+            generations = get_tag_generations(tags, cached)
+
+            if (
+                cached_result is not None
+                and cached_result.get("tags") == generations
+            ):
+                increment_metric(f"cache.{view_name}.hit")
                 return Response(
                     cached_result["data"], status=cached_result["status"]
                 )
+            increment_metric(f"cache.{view_name}.miss")
             response = view_func(instance, request, *args, **kwargs)
             if response.status_code == 200 and not settings.DEBUG:
                 cache.set(
                     key,
-                    {"data": response.data, "status": response.status_code},
+                    {
+                        "data": response.data,
+                        "status": response.status_code,
+                        "tags": generations,
+                    },
                     timeout,
                 )
 
@@ -69,12 +167,13 @@ def invalidate_cache_directly(
         if request and request.user.is_anonymous
         else str(request.user.id) if user else None
     )
-    key = generate_cache_key(custom_path, auth_header)
 
     if multiple:
-        cache.delete_many(keys=cache.keys(f"*{key}*"))
+        # Every entry of the path and the paths below it, for the user only
+        # when the cache is per user
+        invalidate_cache_tags(path_tag(custom_path, auth_header))
     else:
-        cache.delete(key)
+        cache.delete(generate_cache_key(custom_path, auth_header))
 
 
 def invalidate_cache(path=None, url_params=False, user=True, multiple=False):
@@ -89,6 +188,9 @@ def invalidate_cache(path=None, url_params=False, user=True, multiple=False):
                 request=request,
                 multiple=multiple,
             )
+            increment_metric(
+                f"cache.{get_view_name(instance, view_func)}.invalidation"
+            )
             return view_func(instance, request, *args, **kwargs)
 
         return _wrapped_view
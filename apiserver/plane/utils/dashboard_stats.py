@@ -0,0 +1,143 @@
+# Python imports
+import hashlib
+import json
+from uuid import uuid4
+
+# Django imports
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, Exists, OuterRef, Q
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import Issue, IssueAssignee
+
+DASHBOARD_STATS_KEY = "dashboard:stats:{user_id}:{slug}:{digest}"
+DASHBOARD_STATS_VERSION_KEY = "dashboard:stats:version:{project_id}"
+
+STATE_GROUPS = ["backlog", "unstarted", "started", "completed", "cancelled"]
+PRIORITIES = ["urgent", "high", "medium", "low", "none"]
+
+# Issue fields the counters depend on, saves of other fields keep them
+DASHBOARD_STATS_FIELDS = {
+    "state",
+    "state_id",
+    "priority",
+    "target_date",
+    "created_by",
+    "created_by_id",
+    "project",
+    "project_id",
+    "archived_at",
+    "is_draft",
+    "deleted_at",
+}
+
+
+def compute_dashboard_stats(
+    slug, user_id, project_ids, filters=None, created_by_id=None
+):
+    """
+    Counters of the issues assigned to and created by a user in the given
+    projects, computed with a single conditional aggregation
+    """
+    issues = Issue.issue_objects.filter(
+        workspace__slug=slug, project_id__in=project_ids
+    ).filter(**(filters or {}))
+    if created_by_id is not None:
+        issues = issues.filter(created_by_id=created_by_id)
+
+    assigned = Q(is_assigned=True)
+    open_states = ~Q(state__group__in=["completed", "cancelled"])
+
+    def count(condition):
+        # Filters across many to many relations can repeat an issue
+        return Count("id", filter=condition, distinct=True)
+
+    return (
+        issues.annotate(
+            is_assigned=Exists(
+                IssueAssignee.objects.filter(
+                    issue_id=OuterRef("pk"), assignee_id=user_id
+                )
+            )
+        )
+        .filter(assigned | Q(created_by_id=user_id))
+        .aggregate(
+            assigned=count(assigned),
+            created=count(Q(created_by_id=user_id)),
+            completed=count(assigned & Q(state__group="completed")),
+            pending=count(assigned & open_states),
+            overdue=count(
+                assigned
+                & open_states
+                & Q(target_date__lt=timezone.now().date())
+            ),
+            **{
+                f"state_{group}": count(assigned & Q(state__group=group))
+                for group in STATE_GROUPS
+            },
+            **{
+                f"priority_{priority}": count(assigned & Q(priority=priority))
+                for priority in PRIORITIES
+            },
+        )
+    )
+
+
+def get_dashboard_stats(
+    slug, user_id, project_ids, filters=None, created_by_id=None
+):
+    """
+    Counters of compute_dashboard_stats served from a snapshot cached for a
+    short while. The key holds the version stamps of the projects, so any
+    issue write in one of them makes the next read compute it again.
+    """
+    project_ids = sorted(str(project_id) for project_id in project_ids)
+    if not settings.DASHBOARD_STATS_CACHE_TTL:
+        return compute_dashboard_stats(
+            slug, user_id, project_ids, filters, created_by_id
+        )
+
+    versions = cache.get_many(
+        [
+            DASHBOARD_STATS_VERSION_KEY.format(project_id=project_id)
+            for project_id in project_ids
+        ]
+    )
+    digest = hashlib.md5(
+        json.dumps(
+            [project_ids, versions, filters, created_by_id],
+            sort_keys=True,
+            cls=DjangoJSONEncoder,
+        ).encode()
+    ).hexdigest()
+    key = DASHBOARD_STATS_KEY.format(user_id=user_id, slug=slug, digest=digest)
+
+    stats = cache.get(key)
+    if stats is None:
+        stats = compute_dashboard_stats(
+            slug, user_id, project_ids, filters, created_by_id
+        )
+        cache.set(key, stats, settings.DASHBOARD_STATS_CACHE_TTL)
+    return stats
+
+
+def invalidate_dashboard_stats(project_ids):
+    cache.set_many(
+        {
+            DASHBOARD_STATS_VERSION_KEY.format(project_id=project_id): (
+                uuid4().hex
+            )
+            for project_id in set(project_ids)
+            if project_id
+        },
+        timeout=None,
+    )
+
+
+def is_dashboard_stats_update(update_fields):
+    return update_fields is None or bool(
+        DASHBOARD_STATS_FIELDS & set(update_fields)
+    )
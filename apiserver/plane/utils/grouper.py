@@ -1,3 +1,6 @@
+# Python imports
+from collections import defaultdict
+
 # Django imports
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.fields import ArrayField
@@ -16,6 +19,44 @@ from plane.db.models import (
     WorkspaceMember,
 )
 
+# m2m fields the issues can be grouped by and the key holding their ids
+ISSUE_M2M_GROUP_FIELDS = {
+    "labels__id": "label_ids",
+    "assignees__id": "assignee_ids",
+    "issue_module__module_id": "module_ids",
+}
+
+
+def issue_group_ids(issues, field):
+    """Map every issue id to the ids of the groups it is in"""
+    group_ids = defaultdict(dict)
+    for issue in issues:
+        # dict keys keep the order of appearance with O(1) membership
+        group_ids[str(issue["id"])][str(issue[field])] = None
+    return {issue_id: list(ids) for issue_id, ids in group_ids.items()}
+
+
+def issue_group_buckets(issues, field):
+    """
+    Bucket the rows of an m2m group by, the first row of every issue is
+    added once to each of its groups and carries the list of group ids
+    """
+    list_field = ISSUE_M2M_GROUP_FIELDS[field]
+    group_ids = issue_group_ids(issues, field)
+
+    buckets = defaultdict(list)
+    bucketed = set()
+    for issue in issues:
+        issue_id = str(issue["id"])
+        ids = group_ids[issue_id]
+        issue[list_field] = [] if "None" in ids else ids
+        if issue_id in bucketed:
+            continue
+        bucketed.add(issue_id)
+        for group_id in ids:
+            buckets[group_id].append(issue)
+    return buckets
+
 
 def issue_queryset_grouper(queryset, group_by, sub_group_by):
     FIELD_MAPPER = {
@@ -53,11 +94,7 @@ def issue_queryset_grouper(queryset, group_by, sub_group_by):
 
 
 def issue_on_results(issues, group_by, sub_group_by):
-    FIELD_MAPPER = {
-        "labels__id": "label_ids",
-        "assignees__id": "assignee_ids",
-        "issue_module__module_id": "module_ids",
-    }
+    FIELD_MAPPER = ISSUE_M2M_GROUP_FIELDS
 
     original_list = ["assignee_ids", "label_ids", "module_ids"]
 
@@ -0,0 +1,179 @@
+# Django imports
+from django.db.models import (
+    Count,
+    FloatField,
+    IntegerField,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+)
+from django.db.models.functions import Cast, Coalesce
+
+# Module imports
+from plane.db.models import (
+    Cycle,
+    CycleIssue,
+    CycleIssueRollup,
+    Issue,
+    Module,
+    ModuleIssue,
+    ModuleIssueRollup,
+)
+
+STATE_GROUPS = ["backlog", "unstarted", "started", "completed", "cancelled"]
+
+# Rollup model -> (entity field, entity model, issue relation)
+ROLLUP_SOURCES = {
+    CycleIssueRollup: ("cycle", Cycle, "issue_cycle"),
+    ModuleIssueRollup: ("module", Module, "issue_module"),
+}
+
+
+def refresh_rollups(rollup_model, entity_ids):
+    """Recompute the state group rollups of the given cycles or modules"""
+    entity_ids = {str(entity_id) for entity_id in entity_ids if entity_id}
+    if not entity_ids:
+        return
+
+    field, entity_model, relation = ROLLUP_SOURCES[rollup_model]
+    entities = entity_model.objects.filter(pk__in=entity_ids).values_list(
+        "id", "project_id", "workspace_id"
+    )
+
+    # Count the issues and sum the estimate points in one query
+    totals = {
+        (str(total[f"{relation}__{field}_id"]), total["state__group"]): total
+        for total in Issue.issue_objects.filter(
+            **{
+                f"{relation}__{field}_id__in": entity_ids,
+                f"{relation}__deleted_at__isnull": True,
+            }
+        )
+        .values(f"{relation}__{field}_id", "state__group")
+        .annotate(
+            issue_count=Count("id", distinct=True),
+            estimate_points=Sum(
+                Cast("estimate_point__value", FloatField()),
+                filter=Q(estimate_point__estimate__type="points"),
+            ),
+        )
+        .order_by()
+    }
+
+    rollups = []
+    for entity_id, project_id, workspace_id in entities:
+        for state_group in STATE_GROUPS:
+            total = totals.get((str(entity_id), state_group), {})
+            rollups.append(
+                rollup_model(
+                    **{f"{field}_id": entity_id},
+                    project_id=project_id,
+                    workspace_id=workspace_id,
+                    state_group=state_group,
+                    issue_count=total.get("issue_count") or 0,
+                    estimate_points=total.get("estimate_points") or 0,
+                )
+            )
+
+    rollup_model.objects.bulk_create(
+        rollups,
+        update_conflicts=True,
+        unique_fields=[field, "state_group"],
+        update_fields=[
+            "issue_count",
+            "estimate_points",
+            "deleted_at",
+            "updated_at",
+        ],
+        batch_size=1000,
+    )
+
+
+def refresh_cycle_rollups(cycle_ids):
+    refresh_rollups(CycleIssueRollup, cycle_ids)
+
+
+def refresh_module_rollups(module_ids):
+    refresh_rollups(ModuleIssueRollup, module_ids)
+
+
+def refresh_issue_rollups(issue_ids, cycle_ids=(), module_ids=()):
+    """
+    Recompute the rollups of the cycles and modules the issues belong to,
+    along with the cycles and modules they were just removed from
+    """
+    issue_ids = [issue_id for issue_id in issue_ids if issue_id]
+    cycle_ids = set(cycle_ids)
+    module_ids = set(module_ids)
+    if issue_ids:
+        # Deleted issues have their links soft deleted
+        cycle_ids.update(
+            CycleIssue.all_objects.filter(issue_id__in=issue_ids).values_list(
+                "cycle_id", flat=True
+            )
+        )
+        module_ids.update(
+            ModuleIssue.all_objects.filter(
+                issue_id__in=issue_ids
+            ).values_list("module_id", flat=True)
+        )
+
+    refresh_cycle_rollups(cycle_ids)
+    refresh_module_rollups(module_ids)
+
+
+def refresh_linked_rollups(issues):
+    """Recompute the rollups of every cycle and module holding the issues"""
+    refresh_cycle_rollups(
+        CycleIssue.objects.filter(issue__in=issues)
+        .values_list("cycle_id", flat=True)
+        .distinct()
+    )
+    refresh_module_rollups(
+        ModuleIssue.objects.filter(issue__in=issues)
+        .values_list("module_id", flat=True)
+        .distinct()
+    )
+
+
+def rollup_annotations(rollup_model):
+    """
+    Annotations reading the issue counts and estimate points of every
+    state group from the rollup table
+    """
+    field = ROLLUP_SOURCES[rollup_model][0]
+    rollups = rollup_model.objects.filter(**{field: OuterRef("pk")})
+
+    def rollup_value(value_field, output_field, state_group=None):
+        if state_group:
+            queryset = rollups.filter(state_group=state_group).values(
+                value_field
+            )
+        else:
+            queryset = (
+                rollups.values(field)
+                .annotate(total=Sum(value_field))
+                .values("total")
+            )
+        return Coalesce(
+            Subquery(queryset[:1]),
+            Value(0, output_field=output_field),
+            output_field=output_field,
+        )
+
+    annotations = {
+        "total_issues": rollup_value("issue_count", IntegerField()),
+        "total_estimate_points": rollup_value(
+            "estimate_points", FloatField()
+        ),
+    }
+    for state_group in STATE_GROUPS:
+        annotations[f"{state_group}_issues"] = rollup_value(
+            "issue_count", IntegerField(), state_group
+        )
+        annotations[f"{state_group}_estimate_points"] = rollup_value(
+            "estimate_points", FloatField(), state_group
+        )
+    return annotations
@@ -1,22 +1,47 @@
-# Python imports
-import re
-
 # Django imports
-from django.db.models import Q
+from django.db.models import FloatField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
 
 # Module imports
+from plane.db.models import SearchDocument
+from plane.utils.search import (
+    exact_match_filter,
+    get_search_rank,
+    search_documents,
+)
+
+
+def search_issues(query, queryset, **filters):
+    """
+    Issues of the queryset matching the query, ranked with the ones referenced
+    by their id first. The filters narrow down the searched documents.
+    """
+    documents = search_documents(query, entity_name="issue", **filters)
+    rank = (
+        SearchDocument.objects.filter(
+            entity_name="issue", entity_identifier=OuterRef("pk")
+        )
+        .order_by()
+        .annotate(rank=get_search_rank(query))
+        .values("rank")[:1]
+    )
+    queryset = queryset.annotate(
+        search_rank=Coalesce(
+            Subquery(rank), Value(0.0), output_field=FloatField()
+        )
+    )
 
+    exact_match = exact_match_filter(query)
+    if exact_match is None:
+        return queryset.filter(
+            pk__in=documents.values("entity_identifier")
+        ).order_by("-search_rank")
 
-def search_issues(query, queryset):
-    fields = ["name", "sequence_id", "project__identifier"]
-    q = Q()
-    for field in fields:
-        if field == "sequence_id" and len(query) <= 20:
-            sequences = re.findall(r"\b\d+\b", query)
-            for sequence_id in sequences:
-                q |= Q(**{"sequence_id": sequence_id})
-        else:
-            q |= Q(**{f"{field}__icontains": query})
-    return queryset.filter(
-        q,
-    ).distinct()
+    # Issues referenced by their id come first
+    return (
+        queryset.filter(
+            Q(pk__in=documents.values("entity_identifier")) | exact_match
+        )
+        .alias(exact_match=Q(exact_match))
+        .order_by("-exact_match", "-search_rank")
+    )
@@ -0,0 +1,120 @@
+# Python imports
+import logging
+import uuid
+
+# Django imports
+from django.conf import settings
+from django.db import connection
+from django.db.models import Max
+
+# Module imports
+from plane.db.models import Issue
+from plane.settings.redis import redis_instance
+
+# Seeded from the sequences of the project the first time it is used, then
+# only the counter row of the project is updated
+RESERVE_SEQUENCES_SQL = """
+INSERT INTO issue_sequence_counters
+    (id, created_at, updated_at, project_id, workspace_id, last_sequence)
+VALUES (
+    %(id)s, now(), now(), %(project_id)s, %(workspace_id)s,
+    (
+        SELECT COALESCE(MAX(sequence), 0) FROM issue_sequences
+        WHERE project_id = %(project_id)s
+    ) + %(count)s
+)
+ON CONFLICT (project_id) DO UPDATE SET
+    last_sequence = issue_sequence_counters.last_sequence + %(count)s,
+    updated_at = now()
+RETURNING last_sequence
+"""
+
+# Largest sort order handed out in a state of a project, issues without a
+# state are ordered apart in every project
+SORT_ORDER_KEY = "issue:sort_order:{project_id}:{state_id}"
+
+SORT_ORDER_STEP = 10000
+
+DEFAULT_SORT_ORDER = Issue._meta.get_field("sort_order").default
+
+# Seeds the mark with its expiry when it is missing and reserves a block in
+# the same call, so the key can not expire in between and be recreated by
+# INCRBYFLOAT from zero without a TTL. A missing mark without a seed is
+# returned as nil for the caller to read the seed from the issues
+RESERVE_SORT_ORDERS = """
+if redis.call("EXISTS", KEYS[1]) == 0 then
+    if #ARGV < 3 then
+        return false
+    end
+    redis.call("SET", KEYS[1], ARGV[2], "EX", ARGV[3])
+end
+return redis.call("INCRBYFLOAT", KEYS[1], ARGV[1])
+"""
+
+logger = logging.getLogger("plane")
+
+
+def reserve_issue_sequences(project, count=1):
+    """
+    Reserve a block of count consecutive sequence ids of the project with a
+    single row update and return the first one
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            RESERVE_SEQUENCES_SQL,
+            {
+                "id": uuid.uuid4(),
+                "project_id": project.id,
+                "workspace_id": project.workspace_id,
+                "count": count,
+            },
+        )
+        last_sequence = cursor.fetchone()[0]
+    return last_sequence - count + 1
+
+
+def get_largest_sort_order(project_id, state_id):
+    return Issue.objects.filter(
+        project_id=project_id, state_id=state_id
+    ).aggregate(largest=Max("sort_order"))["largest"]
+
+
+def get_sort_order_mark(project_id, state_id):
+    """Sort order the next block follows, an empty state starts at default"""
+    largest = get_largest_sort_order(project_id, state_id)
+    return DEFAULT_SORT_ORDER - SORT_ORDER_STEP if largest is None else largest
+
+
+def reserve_issue_sort_orders(project_id, state_id, count=1):
+    """
+    Sort orders placing count new issues last in their state, in order. The
+    high water mark of the state in the project is kept in Redis and
+    reloaded from the issues once it expires.
+    """
+    key = SORT_ORDER_KEY.format(project_id=project_id, state_id=state_id)
+    amount = count * SORT_ORDER_STEP
+    try:
+        reserve = redis_instance().register_script(RESERVE_SORT_ORDERS)
+        last = reserve(keys=[key], args=[amount])
+        if last is None:
+            # Another process may seed the mark first, its seed is kept
+            last = reserve(
+                keys=[key],
+                args=[
+                    amount,
+                    get_sort_order_mark(project_id, state_id),
+                    settings.ISSUE_SORT_ORDER_CACHE_TTL,
+                ],
+            )
+        last = float(last)
+    except Exception as e:
+        logger.warning(f"Sort order of state {state_id} was not cached: {e}")
+        last = get_sort_order_mark(project_id, state_id) + amount
+    return [
+        last - (count - 1 - index) * SORT_ORDER_STEP for index in range(count)
+    ]
+
+
+def next_issue_sort_order(project_id, state_id):
+    """Sort order placing a new issue last in its state"""
+    return reserve_issue_sort_orders(project_id, state_id)[0]
@@ -0,0 +1,96 @@
+# Python imports
+from uuid import uuid4
+
+# Django imports
+from django.conf import settings
+from django.core.cache import cache
+
+# Module imports
+from plane.db.models import ProjectMember, WorkspaceMember
+
+MEMBERSHIP_CACHE_KEY = "membership:{user_id}:{slug}:{version}"
+MEMBERSHIP_VERSION_KEY = "membership:version:{user_id}"
+
+
+class Membership:
+    """Active workspace role and project roles of a user in a workspace"""
+
+    def __init__(self, workspace_role=None, project_roles=None):
+        self.workspace_role = workspace_role
+        self.project_roles = project_roles or {}
+
+    @property
+    def project_ids(self):
+        return set(self.project_roles)
+
+    def has_workspace_role(self, roles):
+        return self.workspace_role in roles
+
+    def has_project_role(self, project_id, roles):
+        return self.project_roles.get(str(project_id)) in roles
+
+
+def load_membership(user_id, slug):
+    workspace_role = (
+        WorkspaceMember.objects.filter(
+            member_id=user_id, workspace__slug=slug, is_active=True
+        )
+        .values_list("role", flat=True)
+        .first()
+    )
+    project_roles = {
+        str(project_id): role
+        for project_id, role in ProjectMember.objects.filter(
+            member_id=user_id, workspace__slug=slug, is_active=True
+        ).values_list("project_id", "role")
+    }
+    return Membership(workspace_role, project_roles)
+
+
+def get_cached_membership(user_id, slug):
+    if not settings.MEMBERSHIP_CACHE_TTL:
+        return load_membership(user_id, slug)
+
+    # Changing the version stamp orphans every cached entry of the user
+    version = cache.get(MEMBERSHIP_VERSION_KEY.format(user_id=user_id), 0)
+    key = MEMBERSHIP_CACHE_KEY.format(
+        user_id=user_id, slug=slug, version=version
+    )
+    roles = cache.get(key)
+    if roles is None:
+        membership = load_membership(user_id, slug)
+        cache.set(
+            key,
+            (membership.workspace_role, membership.project_roles),
+            settings.MEMBERSHIP_CACHE_TTL,
+        )
+        return membership
+    return Membership(*roles)
+
+
+def get_membership(request, slug):
+    """
+    Roles of the request user in the workspace, resolved once per request
+    """
+    user_id = request.user.id
+    # Shared by the django request and every rest framework wrapper of it
+    request = getattr(request, "_request", request)
+    memberships = request.__dict__.setdefault("_memberships", {})
+    if slug not in memberships:
+        memberships[slug] = get_cached_membership(user_id, slug)
+    return memberships[slug]
+
+
+def get_member_project_ids(request, slug):
+    """Ids of the projects the request user is an active member of"""
+    return get_membership(request, slug).project_ids
+
+
+def invalidate_membership(user_ids):
+    cache.set_many(
+        {
+            MEMBERSHIP_VERSION_KEY.format(user_id=user_id): uuid4().hex
+            for user_id in set(user_ids)
+        },
+        timeout=None,
+    )
@@ -0,0 +1,42 @@
+# Python imports
+import logging
+
+# Module imports
+from plane.settings.redis import METRICS_KEY, redis_instance
+
+logger = logging.getLogger("plane")
+
+
+def increment_metric(name, amount=1):
+    """Add to a counter, metrics never fail the caller"""
+    try:
+        redis_instance().hincrby(METRICS_KEY, name, amount)
+    except Exception as e:
+        logger.warning(f"Metric {name} was not recorded: {e}")
+
+
+def observe_metric(name, total, count=1):
+    """Record count observations adding up to total, e.g. a latency"""
+    try:
+        pipeline = redis_instance().pipeline()
+        pipeline.hincrbyfloat(METRICS_KEY, f"{name}.sum", total)
+        pipeline.hincrby(METRICS_KEY, f"{name}.count", count)
+        pipeline.hset(METRICS_KEY, f"{name}.last", total / max(count, 1))
+        pipeline.execute()
+    except Exception as e:
+        logger.warning(f"Metric {name} was not recorded: {e}")
+
+
+def get_metrics():
+    """All the recorded metrics, with the average of every observation"""
+    metrics = {
+        key.decode(): float(value)
+        for key, value in redis_instance().hgetall(METRICS_KEY).items()
+    }
+    for key in [key for key in metrics if key.endswith(".count")]:
+        name = key[: -len(".count")]
+        if metrics[key]:
+            metrics[f"{name}.avg"] = (
+                metrics.get(f"{name}.sum", 0) / metrics[key]
+            )
+    return metrics
@@ -0,0 +1,135 @@
+# Python imports
+import logging
+from collections import Counter
+
+# Django imports
+from django.conf import settings
+from django.db.models import Count, Q
+
+# Module imports
+from plane.db.models import Notification
+from plane.settings.redis import redis_instance
+
+# Redis hash of the unread and mention counts of a user in a workspace
+NOTIFICATION_COUNTERS_KEY = "notifications:unread:{slug}:{user_id}"
+# Set of the counters loaded in Redis, kept exact by the reconciliation task
+NOTIFICATION_COUNTERS_INDEX = "notifications:unread:keys"
+
+COUNTER_FIELDS = ("unread", "mention")
+
+# Counters that are not loaded are left alone, they are computed on read
+INCREMENT_IF_LOADED = """
+if redis.call("EXISTS", KEYS[1]) == 1 then
+    return redis.call("HINCRBY", KEYS[1], ARGV[1], ARGV[2])
+end
+return nil
+"""
+
+logger = logging.getLogger("plane")
+
+
+def get_counters_key(slug, user_id):
+    return NOTIFICATION_COUNTERS_KEY.format(slug=slug, user_id=user_id)
+
+
+def is_counted(notification):
+    """Unread notifications are the ones not read, archived nor snoozed"""
+    return (
+        notification.read_at is None
+        and notification.archived_at is None
+        and notification.snoozed_till is None
+    )
+
+
+def get_counter_field(notification):
+    if "mentioned" in (notification.sender or "").lower():
+        return "mention"
+    return "unread"
+
+
+def unread_notifications(**filters):
+    return Notification.objects.filter(
+        read_at__isnull=True,
+        archived_at__isnull=True,
+        snoozed_till__isnull=True,
+        **filters,
+    )
+
+
+def counter_aggregates():
+    mentioned = Q(sender__icontains="mentioned")
+    return {
+        "unread": Count("id", filter=~mentioned),
+        "mention": Count("id", filter=mentioned),
+    }
+
+
+def count_unread_notifications(**filters):
+    return unread_notifications(**filters).aggregate(**counter_aggregates())
+
+
+def get_notification_counters(slug, user_id):
+    """
+    Unread and mention counts of a user, served from Redis and loaded from
+    the database when missing or when Redis is not reachable
+    """
+    key = get_counters_key(slug, user_id)
+    try:
+        counters = redis_instance().hgetall(key)
+        if all(field.encode() in counters for field in COUNTER_FIELDS):
+            # Out of order updates can briefly take a counter below zero
+            return {
+                field: max(int(counters[field.encode()]), 0)
+                for field in COUNTER_FIELDS
+            }
+    except Exception as e:
+        logger.warning(f"Notification counters were not read: {e}")
+        return count_unread_notifications(
+            workspace__slug=slug, receiver_id=user_id
+        )
+
+    counters = count_unread_notifications(
+        workspace__slug=slug, receiver_id=user_id
+    )
+    try:
+        pipeline = redis_instance().pipeline()
+        pipeline.hset(key, mapping=counters)
+        pipeline.expire(key, settings.NOTIFICATION_COUNTERS_TTL)
+        pipeline.sadd(NOTIFICATION_COUNTERS_INDEX, key)
+        pipeline.execute()
+    except Exception as e:
+        logger.warning(f"Notification counters were not stored: {e}")
+    return counters
+
+
+def update_notification_counters(slug, notifications, amount):
+    """Move the counters of the receivers of the notifications by amount"""
+    changes = Counter(
+        (notification.receiver_id, get_counter_field(notification))
+        for notification in notifications
+    )
+    if not changes:
+        return
+    try:
+        client = redis_instance()
+        increment = client.register_script(INCREMENT_IF_LOADED)
+        pipeline = client.pipeline()
+        for (user_id, field), count in changes.items():
+            increment(
+                keys=[get_counters_key(slug, user_id)],
+                args=[field, count * amount],
+                client=pipeline,
+            )
+        pipeline.execute()
+    except Exception as e:
+        # The reconciliation task corrects the counters that were missed
+        logger.warning(f"Notification counters were not updated: {e}")
+
+
+def track_notification_change(slug, notification, was_counted):
+    """Update the counters after a notification was read, archived or snoozed"""
+    counted = is_counted(notification)
+    if counted != was_counted:
+        update_notification_counters(
+            slug, [notification], 1 if counted else -1
+        )
@@ -1,17 +1,29 @@
 # Python imports
+import base64
+import datetime
+import hashlib
+import heapq
+import json
 import math
-from collections import defaultdict
 from collections.abc import Sequence
+from itertools import islice
 
 # Django imports
-from django.db.models import Count, F, Window
-from django.db.models.functions import RowNumber
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Count, Exists, F, OuterRef, Q
 
 # Third party imports
 from rest_framework.exceptions import ParseError
 from rest_framework.response import Response
 
 # Module imports
+from plane.utils.grouper import (
+    ISSUE_M2M_GROUP_FIELDS,
+    issue_group_buckets,
+    issue_group_ids,
+)
 
 
 class Cursor:
@@ -57,6 +69,74 @@ class Cursor:
             raise ValueError(f"Invalid cursor format: {e}")
 
 
+class KeysetCursorEncoder(DjangoJSONEncoder):
+    """
+    Encodes datetimes and times with their microseconds, the position is
+    compared against the columns so it must survive the round trip exactly
+    """
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+class KeysetCursor:
+    """
+    Cursor pointing at a row instead of a page. The position is the
+    `(order_key, created_at, id)` tuple of the last (or first when going
+    backwards) row that was returned.
+    """
+
+    # Prefix used to tell keyset cursors apart from offset cursors
+    prefix = "k"
+
+    def __init__(self, position=None, is_prev=False, has_results=None):
+        self.position = tuple(position) if position is not None else None
+        self.is_prev = bool(is_prev)
+        self.has_results = has_results
+
+    # Return the cursor value in string format
+    def __str__(self):
+        payload = json.dumps(
+            [self.position, int(self.is_prev)], cls=KeysetCursorEncoder
+        )
+        encoded = base64.urlsafe_b64encode(payload.encode()).decode()
+        return f"{self.prefix}:{encoded.rstrip('=')}"
+
+    def __eq__(self, other):
+        return all(
+            getattr(self, attr) == getattr(other, attr, None)
+            for attr in ("position", "is_prev", "has_results")
+        )
+
+    def __repr__(self):
+        return f"{type(self).__name__}: position={self.position} is_prev={int(self.is_prev)}"
+
+    def __bool__(self):
+        return bool(self.has_results)
+
+    @classmethod
+    def from_string(cls, value):
+        """
+        Return the cursor from string format, offset cursors
+        (`value:offset:is_prev`) are returned as a `Cursor`
+        """
+        if not value.startswith(f"{cls.prefix}:"):
+            return Cursor.from_string(value)
+        try:
+            encoded = value[len(cls.prefix) + 1 :]
+            encoded += "=" * (-len(encoded) % 4)
+            position, is_prev = json.loads(
+                base64.urlsafe_b64decode(encoded.encode()).decode()
+            )
+            if position is not None and len(position) != 3:
+                raise ValueError("Cursor position must have three values")
+            return cls(position, bool(is_prev))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid cursor format: {e}")
+
+
 class CursorResult(Sequence):
     def __init__(self, results, next, prev, hits=None, max_hits=None):
         self.results = results
@@ -84,6 +164,17 @@ class CursorResult(Sequence):
 
 MAX_LIMIT = 100
 
+# Total count modes
+# exact  - count the queryset on every page
+# cached - count on the first page and serve later pages from the cache
+# none   - skip the count, total_count and total_pages are returned as null
+COUNT_EXACT = "exact"
+COUNT_CACHED = "cached"
+COUNT_NONE = "none"
+
+# Seconds a cached total count is kept for
+COUNT_CACHE_TIMEOUT = 60 * 5
+
 
 class BadPaginationError(Exception):
     pass
@@ -97,6 +188,9 @@ class OffsetPaginator:
     cursor=limit,offset=page,
     """
 
+    # Cursor class used to parse the request cursor
+    cursor_cls = Cursor
+
     def __init__(
         self,
         queryset,
@@ -104,6 +198,7 @@ class OffsetPaginator:
         max_limit=MAX_LIMIT,
         max_offset=None,
         on_results=None,
+        count=COUNT_EXACT,
     ):
         # Key tuple and remove `-` if descending order by
         self.key = (
@@ -117,6 +212,33 @@ class OffsetPaginator:
         self.max_limit = max_limit
         self.max_offset = max_offset
         self.on_results = on_results
+        self.count = count
+
+    def get_count(self, queryset, is_first_page=True):
+        """Count the queryset honouring the configured count mode"""
+        if self.count == COUNT_NONE:
+            return None
+
+        if self.count != COUNT_CACHED:
+            return queryset.count()
+
+        # Key the cached count on the compiled query
+        sql, params = queryset.query.sql_with_params()
+        key = "paginator:count:" + (
+            hashlib.md5(f"{sql}:{params}".encode()).hexdigest()
+        )
+        # The first page always refreshes the count
+        count = None if is_first_page else cache.get(key)
+        if count is None:
+            count = queryset.count()
+            cache.set(key, count, COUNT_CACHE_TIMEOUT)
+        return count
+
+    def get_max_hits(self, count, limit):
+        # Total pages are unknown when the count is skipped
+        if count is None:
+            return None
+        return math.ceil(count / limit)
 
     def get_result(self, limit=100, cursor=None):
         # offset is page #
@@ -167,10 +289,10 @@ class OffsetPaginator:
             results = self.on_results(results)
 
         # Count the queryset
-        count = queryset.count()
+        count = self.get_count(queryset, is_first_page=page == 0)
 
         # Optionally, calculate the total count and max_hits if needed
-        max_hits = math.ceil(count / limit)
+        max_hits = self.get_max_hits(count, limit)
 
         # Return the cursor results
         return CursorResult(
@@ -185,33 +307,410 @@ class OffsetPaginator:
         raise NotImplementedError
 
 
-class GroupedOffsetPaginator(OffsetPaginator):
+class KeysetPaginator(OffsetPaginator):
+    """
+    The Keyset (seek) paginator, the cursor holds the position of the
+    boundary row so every page is fetched with an indexed range filter
+    instead of an offset scan.
+    http://example.com/api/issues/?cursor=k:WyJhIiwgMF0&per_page=10
+    Offset cursors are still accepted, the returned cursors are keyset ones.
+    """
+
+    # Cursor class used to parse the request cursor
+    cursor_cls = KeysetCursor
 
-    # Field mappers - list m2m fields here
-    FIELD_MAPPER = {
-        "labels__id": "label_ids",
-        "assignees__id": "assignee_ids",
-        "issue_module__module_id": "module_ids",
-    }
+    # Columns used to break ties in the order key
+    tiebreakers = ("created_at", "id")
+
+    def get_key(self):
+        return self.key[0] if self.key else "created_at"
+
+    def get_ordering(self, reverse=False):
+        # Nulls are kept last in the forward order, paging backwards
+        # flips every column including the nulls placement
+        key = F(self.get_key())
+        if reverse:
+            key_ordering = (
+                key.asc(nulls_first=True)
+                if self.desc
+                else key.desc(nulls_first=True)
+            )
+        else:
+            key_ordering = (
+                key.desc(nulls_last=True)
+                if self.desc
+                else key.asc(nulls_last=True)
+            )
+        return (
+            key_ordering,
+            *(
+                F(field).asc() if reverse else F(field).desc()
+                for field in self.tiebreakers
+            ),
+        )
+
+    def get_seek_filter(self, position, reverse=False):
+        # Rows after the position for the forward order
+        # rows before the position when paging backwards
+        value, created_at, pk = position
+        key = self.get_key()
+        tie_lookup = "gt" if reverse else "lt"
+        key_lookup = "gt" if self.desc == reverse else "lt"
+
+        tie_filter = Q(**{f"created_at__{tie_lookup}": created_at}) | Q(
+            created_at=created_at, **{f"id__{tie_lookup}": pk}
+        )
+        if value is None:
+            # Nulls are always ordered last
+            if reverse:
+                return Q(**{f"{key}__isnull": False}) | Q(
+                    tie_filter, **{f"{key}__isnull": True}
+                )
+            return Q(tie_filter, **{f"{key}__isnull": True})
+
+        seek_filter = Q(**{f"{key}__{key_lookup}": value}) | Q(
+            tie_filter, **{key: value}
+        )
+        if not reverse:
+            seek_filter |= Q(**{f"{key}__isnull": True})
+        return seek_filter
+
+    def get_position(self, row):
+        return tuple(row[field] for field in ("key", *self.tiebreakers))
+
+    def get_result(self, limit=100, cursor=None):
+        limit = min(limit, self.max_limit)
+
+        # Offset cursors are served with an offset on the seek query
+        offset = 0
+        if isinstance(cursor, Cursor):
+            offset = cursor.offset * cursor.value
+            if offset < 0:
+                raise BadPaginationError(
+                    "Pagination offset cannot be negative"
+                )
+            if self.max_offset is not None and offset >= self.max_offset:
+                raise BadPaginationError("Pagination offset too large")
+            cursor = None
+
+        position = cursor.position if cursor is not None else None
+        is_prev = cursor.is_prev if cursor is not None else False
+
+        queryset = self.queryset
+        page_queryset = queryset.order_by(*self.get_ordering(reverse=is_prev))
+        if position is not None:
+            page_queryset = page_queryset.filter(
+                self.get_seek_filter(position, reverse=is_prev)
+            )
+
+        # Only fetch the boundary columns for the page and one extra row
+        key = self.get_key()
+        fields = [key] + [
+            field for field in self.tiebreakers if field != key
+        ]
+        rows = [
+            dict(zip(fields, values), key=values[0])
+            for values in page_queryset.values_list(*fields)[
+                offset : offset + limit + 1
+            ]
+        ]
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if is_prev:
+            rows.reverse()
+
+        # Adjust cursors based on the boundary rows
+        if rows:
+            next_position = self.get_position(rows[-1])
+            prev_position = self.get_position(rows[0])
+        else:
+            next_position = prev_position = position
+
+        next_cursor = KeysetCursor(
+            next_position,
+            False,
+            has_more if not is_prev else position is not None,
+        )
+        prev_cursor = KeysetCursor(
+            prev_position,
+            True,
+            has_more if is_prev else position is not None or offset > 0,
+        )
+
+        # Fetch the page in the forward order
+        results = queryset.filter(pk__in=[row["id"] for row in rows]).order_by(
+            *self.get_ordering()
+        )
+
+        if self.on_results:
+            results = self.on_results(results)
+
+        # Count the queryset
+        count = self.get_count(
+            queryset, is_first_page=position is None and offset == 0
+        )
+
+        return CursorResult(
+            results=results,
+            next=next_cursor,
+            prev=prev_cursor,
+            hits=count,
+            max_hits=self.get_max_hits(count, limit),
+        )
+
+
+class MergedKeysetPaginator(OffsetPaginator):
+    """
+    Keyset paginator over several querysets merged into one list ordered by
+    creation, e.g. the activities and comments of an issue. Every page reads
+    the boundary columns of at most limit + 1 rows of each queryset, merges
+    them and loads only the rows of the page. The cursor position is the
+    `(created_at, source, id)` of the boundary row, where source is the
+    index of its queryset. The next cursor of the last page keeps pointing
+    at its last row, so polling with it returns only the newer rows.
+    """
+
+    # Cursor class used to parse the request cursor
+    cursor_cls = KeysetCursor
 
     def __init__(
-        self,
-        queryset,
-        group_by_field_name,
-        group_by_fields,
-        count_filter,
-        *args,
-        **kwargs,
+        self, querysets, max_limit=MAX_LIMIT, on_results=None, count=COUNT_NONE
     ):
-        # Initiate the parent class for all the parameters
+        super().__init__(
+            queryset=None,
+            max_limit=max_limit,
+            on_results=on_results,
+            count=count,
+        )
+        self.querysets = list(querysets)
+
+    def get_seek_filter(self, source, position, reverse=False):
+        # Rows after the position for the forward order
+        # rows before the position when paging backwards
+        created_at, position_source, pk = position
+        lookup = "lt" if reverse else "gt"
+        if source == position_source:
+            return Q(**{f"created_at__{lookup}": created_at}) | Q(
+                created_at=created_at, **{f"id__{lookup}": pk}
+            )
+        # Rows of other querysets created at the same time are ordered by
+        # their source
+        if (source > position_source) != reverse:
+            lookup += "e"
+        return Q(**{f"created_at__{lookup}": created_at})
+
+    def get_result(self, limit=100, cursor=None):
+        limit = min(limit, self.max_limit)
+
+        # Offset cursors can only point at the first page
+        if isinstance(cursor, Cursor):
+            if cursor.offset:
+                raise BadPaginationError("Pagination needs a keyset cursor")
+            cursor = None
+
+        position = cursor.position if cursor is not None else None
+        is_prev = cursor.is_prev if cursor is not None else False
+        ordering = ("-created_at", "-id") if is_prev else ("created_at", "id")
+
+        boundaries = []
+        for source, queryset in enumerate(self.querysets):
+            page_queryset = queryset.order_by(*ordering)
+            if position is not None:
+                page_queryset = page_queryset.filter(
+                    self.get_seek_filter(source, position, reverse=is_prev)
+                )
+            boundaries.append(
+                [
+                    (created_at, source, pk)
+                    for created_at, pk in page_queryset.values_list(
+                        "created_at", "id"
+                    )[: limit + 1]
+                ]
+            )
+
+        # Every list is already ordered, merge them up to one extra row
+        rows = list(
+            islice(heapq.merge(*boundaries, reverse=is_prev), limit + 1)
+        )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if is_prev:
+            rows.reverse()
+
+        # Adjust cursors based on the boundary rows
+        next_position = rows[-1] if rows else position
+        prev_position = rows[0] if rows else position
+        next_cursor = KeysetCursor(
+            next_position,
+            False,
+            has_more if not is_prev else position is not None,
+        )
+        prev_cursor = KeysetCursor(
+            prev_position,
+            True,
+            has_more if is_prev else position is not None,
+        )
+
+        # Load the rows of the page from their own queryset
+        instances = {}
+        for source, queryset in enumerate(self.querysets):
+            ids = [pk for _, row_source, pk in rows if row_source == source]
+            if ids:
+                instances.update(
+                    ((source, instance.pk), instance)
+                    for instance in queryset.filter(pk__in=ids)
+                )
+        results = [
+            instances[(source, pk)]
+            for _, source, pk in rows
+            if (source, pk) in instances
+        ]
+
+        if self.on_results:
+            results = self.on_results(results)
+
+        # Count the querysets
+        counts = [
+            self.get_count(queryset, is_first_page=position is None)
+            for queryset in self.querysets
+        ]
+        count = None if None in counts else sum(counts)
+
+        return CursorResult(
+            results=results,
+            next=next_cursor,
+            prev=prev_cursor,
+            hits=count,
+            max_hits=self.get_max_hits(count, limit),
+        )
+
+
+# Numbers and counts the distinct rows of the partitions, reading the rows
+# up to the end of the page. The earlier rows of every partition carry the
+# totals of the partitions already exhausted
+PARTITION_ROWS_SQL = """
+SELECT * FROM (
+    SELECT {columns} FROM ({pairs}) AS pairs
+) AS numbered
+WHERE row_number <= %s
+"""
+
+
+class WindowOffsetPaginator(OffsetPaginator):
+    """
+    Base paginator for the grouped paginators, every partition is paged
+    with a single windowed query which also returns the partition totals
+    (`COUNT(*) OVER (PARTITION BY ...)`) and the has next flag
+    """
+
+    # Field mappers - list m2m fields here
+    FIELD_MAPPER = ISSUE_M2M_GROUP_FIELDS
+
+    def __init__(self, queryset, *args, **kwargs):
         super().__init__(queryset, *args, **kwargs)
+        # Extra filters the partition totals are counted with
+        self.count_filter = None
+        # Rows of the current page as (id, *partition values)
+        self.page_rows = set()
+        # Totals for every partition annotation keyed by the partition values
+        self.partition_totals = {}
+
+    def get_partition_fields(self):
+        # Fields the rows are numbered over
+        raise NotImplementedError
 
-        # Set the group by field name
-        self.group_by_field_name = group_by_field_name
-        # Set the group by fields
-        self.group_by_fields = group_by_fields
-        # Set the count filter - this are extra filters that need to be passed to calculate the counts with the filters
-        self.count_filter = count_filter
+    def get_total_partitions(self):
+        # Total annotations and the fields they are partitioned by
+        raise NotImplementedError
+
+    def get_ordering(self):
+        return (
+            (
+                F(*self.key).desc(nulls_last=True)
+                if self.desc
+                else F(*self.key).asc(nulls_last=True)
+            ),
+            F("created_at").desc(),
+        )
+
+    def get_row_key(self, row):
+        return (str(row["id"]),) + tuple(
+            str(row.get(field)) for field in self.get_partition_fields()
+        )
+
+    def get_pairs_queryset(self):
+        # Distinct (id, partition values) pairs with the columns they are
+        # ordered by, the joins of m2m filters repeat the rows otherwise
+        values = {
+            f"partition_{index}": F(field)
+            for index, field in enumerate(self.get_partition_fields())
+        }
+        values["order_key"] = F(*self.key)
+        if self.count_filter is not None:
+            # Evaluated per issue so its joins do not repeat the pairs
+            values["counted"] = Exists(
+                self.queryset.model.objects.filter(
+                    self.count_filter, pk=OuterRef("pk")
+                )
+            )
+        return (
+            self.queryset.order_by()
+            .values("id", "created_at", **values)
+            .distinct()
+        )
+
+    def get_partition_rows(self, stop):
+        """
+        Rows numbered in every partition up to stop, each carrying the
+        totals of its partitions, read with a single windowed query
+        """
+        partition_fields = self.get_partition_fields()
+        total_partitions = self.get_total_partitions()
+        aliases = {
+            field: f"partition_{index}"
+            for index, field in enumerate(partition_fields)
+        }
+
+        pairs = self.get_pairs_queryset()
+        connection = connections[pairs.db]
+        qn = connection.ops.quote_name
+        sql, params = pairs.query.sql_with_params()
+
+        count = (
+            "COUNT(*) FILTER (WHERE counted)"
+            if self.count_filter is not None
+            else "COUNT(*)"
+        )
+        totals = [
+            f"{count} OVER (PARTITION BY "
+            + ", ".join(qn(aliases[field]) for field in fields)
+            + f") AS {qn(name)}"
+            for name, fields in total_partitions.items()
+        ]
+        direction = "DESC" if self.desc else "ASC"
+        row_number = (
+            "ROW_NUMBER() OVER (PARTITION BY "
+            + ", ".join(qn(alias) for alias in aliases.values())
+            + f" ORDER BY order_key {direction} NULLS LAST,"
+            + " created_at DESC, id DESC) AS row_number"
+        )
+        columns = ", ".join(
+            ["id", *(qn(alias) for alias in aliases.values()), row_number]
+            + totals
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                PARTITION_ROWS_SQL.format(columns=columns, pairs=sql),
+                (*params, stop),
+            )
+            names = [column.name for column in cursor.description]
+            rows = [dict(zip(names, values)) for values in cursor.fetchall()]
+
+        for row in rows:
+            for field, alias in aliases.items():
+                row[field] = row.pop(alias)
+        return rows
 
     def get_result(self, limit=50, cursor=None):
         # offset is page #
@@ -221,9 +720,6 @@ class GroupedOffsetPaginator(OffsetPaginator):
 
         limit = min(limit, self.max_limit)
 
-        # Adjust the initial offset and stop based on the cursor and limit
-        queryset = self.queryset
-
         page = cursor.offset
         offset = cursor.offset * cursor.value
         stop = offset + (cursor.value or limit) + 1
@@ -236,75 +732,51 @@ class GroupedOffsetPaginator(OffsetPaginator):
         if offset < 0:
             raise BadPaginationError("Pagination offset cannot be negative")
 
-        # Compute the results
-        results = {}
-        # Create window for all the groups
-        queryset = queryset.annotate(
-            row_number=Window(
-                expression=RowNumber(),
-                partition_by=[F(self.group_by_field_name)],
-                order_by=(
-                    (
-                        F(*self.key).desc(
-                            nulls_last=True
-                        )  # order by desc if desc is set
-                        if self.desc
-                        else F(*self.key).asc(
-                            nulls_last=True
-                        )  # Order by asc if set
-                    ),
-                    F("created_at").desc(),
-                ),
-            )
-        )
-        # Filter the results by row number
-        results = queryset.filter(
-            row_number__gt=offset, row_number__lt=stop
-        ).order_by(
-            (
-                F(*self.key).desc(nulls_last=True)
-                if self.desc
-                else F(*self.key).asc(nulls_last=True)
-            ),
-            F("created_at").desc(),
-        )
+        partition_fields = self.get_partition_fields()
+        total_partitions = self.get_total_partitions()
+
+        self.page_rows = set()
+        self.partition_totals = {name: {} for name in total_partitions}
+        has_next = False
+        for row in self.get_partition_rows(stop):
+            row_key = self.get_row_key(row)
+            for name, fields in total_partitions.items():
+                self.partition_totals[name][row_key[1 : len(fields) + 1]] = (
+                    row[name]
+                )
+            if row["row_number"] >= stop:
+                has_next = True
+            elif row["row_number"] > offset:
+                self.page_rows.add(row_key)
 
         # Adjust cursors based on the grouped results for pagination
-        next_cursor = Cursor(
-            limit,
-            page + 1,
-            False,
-            queryset.filter(row_number__gte=stop).exists(),
-        )
+        next_cursor = Cursor(limit, page + 1, False, has_next)
 
         # Add previous cursors
-        prev_cursor = Cursor(
-            limit,
-            page - 1,
-            True,
-            page > 0,
-        )
-
-        # Count the queryset
-        count = queryset.count()
+        prev_cursor = Cursor(limit, page - 1, True, page > 0)
 
-        # Optionally, calculate the total count and max_hits if needed
-        # This might require adjustments based on specific use cases
-        if results:
-            max_hits = math.ceil(
-                queryset.values(self.group_by_field_name)
-                .annotate(
-                    count=Count(
-                        "id",
-                        filter=self.count_filter,
-                        distinct=True,
-                    )
-                )
-                .order_by("-count")[0]["count"]
-                / limit
+        # Fetch the page rows by primary key in the requested order
+        results = self.queryset.filter(
+            pk__in={row_key[0] for row_key in self.page_rows}
+        ).order_by(*self.get_ordering())
+
+        # Every row belongs to exactly one leaf partition
+        leaf_totals = self.partition_totals[
+            next(
+                name
+                for name, fields in total_partitions.items()
+                if len(fields) == len(partition_fields)
             )
-        else:
-            max_hits = 0
+        ]
+        count = sum(leaf_totals.values())
+
+        # Pages needed for the largest group
+        group_totals = self.partition_totals.get("group_total") or leaf_totals
+        max_hits = (
+            math.ceil(max(group_totals.values()) / limit)
+            if self.page_rows
+            else 0
+        )
         return CursorResult(
             results=results,
             next=next_cursor,
@@ -313,31 +785,50 @@ class GroupedOffsetPaginator(OffsetPaginator):
             max_hits=max_hits,
         )
 
-    def __get_total_queryset(self):
-        # Get total items for each group
-        return (
-            self.queryset.values(self.group_by_field_name)
-            .annotate(
-                count=Count(
-                    "id",
-                    filter=self.count_filter,
-                    distinct=True,
-                )
-            )
-            .order_by()
-        )
+    def get_page_results(self, results):
+        # Drop the m2m rows of the fetched issues that are not on this page
+        return [
+            result
+            for result in results
+            if self.get_row_key(result) in self.page_rows
+        ]
+
+
+class GroupedOffsetPaginator(WindowOffsetPaginator):
+
+    def __init__(
+        self,
+        queryset,
+        group_by_field_name,
+        group_by_fields,
+        count_filter,
+        *args,
+        **kwargs,
+    ):
+        # Initiate the parent class for all the parameters
+        super().__init__(queryset, *args, **kwargs)
+
+        # Set the group by field name
+        self.group_by_field_name = group_by_field_name
+        # Set the group by fields
+        self.group_by_fields = group_by_fields
+        # Set the count filter - this are extra filters that need to be passed to calculate the counts with the filters
+        self.count_filter = count_filter
+
+    def get_partition_fields(self):
+        return [self.group_by_field_name]
+
+    def get_total_partitions(self):
+        return {"group_total": [self.group_by_field_name]}
 
     def __get_total_dict(self):
-        # Convert the total into dictionary of keys as group name and value as the total
-        total_group_dict = {}
-        for group in self.__get_total_queryset():
-            total_group_dict[str(group.get(self.group_by_field_name))] = (
-                total_group_dict.get(
-                    str(group.get(self.group_by_field_name)), 0
-                )
-                + (1 if group.get("count") == 0 else group.get("count"))
-            )
-        return total_group_dict
+        # Convert the window totals into dictionary of keys as group name and value as the total
+        return {
+            group: count
+            for (group,), count in self.partition_totals[
+                "group_total"
+            ].items()
+        }
 
     def __get_field_dict(self):
         # Create a field dictionary
@@ -350,41 +841,14 @@ class GroupedOffsetPaginator(OffsetPaginator):
             for field in self.group_by_fields
         }
 
-    def __result_already_added(self, result, group):
-        # Check if the result is already added then add it
-        for existing_issue in group:
-            if existing_issue["id"] == result["id"]:
-                return True
-        return False
-
     def __query_multi_grouper(self, results):
         # Grouping for m2m values
         total_group_dict = self.__get_total_dict()
 
-        # Preparing a dict to keep track of group IDs associated with each entity ID
-        result_group_mapping = defaultdict(set)
-        # Preparing a dict to group result by group ID
-        grouped_by_field_name = defaultdict(list)
-
-        # Iterate over results to fill the above dictionaries
-        for result in results:
-            result_id = result["id"]
-            group_id = result[self.group_by_field_name]
-            result_group_mapping[str(result_id)].add(str(group_id))
-
-        # Adding group_ids key to each issue and grouping by group_name
-        for result in results:
-            result_id = result["id"]
-            group_ids = list(result_group_mapping[str(result_id)])
-            result[self.FIELD_MAPPER.get(self.group_by_field_name)] = (
-                [] if "None" in group_ids else group_ids
-            )
-            # If a result belongs to multiple groups, add it to each group
-            for group_id in group_ids:
-                if not self.__result_already_added(
-                    result, grouped_by_field_name[group_id]
-                ):
-                    grouped_by_field_name[group_id].append(result)
+        # Bucket every issue into each of its groups
+        grouped_by_field_name = issue_group_buckets(
+            issues=results, field=self.group_by_field_name
+        )
 
         # Convert grouped_by_field_name back to a list for each group
         processed_results = {
@@ -410,7 +874,9 @@ class GroupedOffsetPaginator(OffsetPaginator):
         # Process results
         if results:
             if self.group_by_field_name in self.FIELD_MAPPER:
-                processed_results = self.__query_multi_grouper(results=results)
+                processed_results = self.__query_multi_grouper(
+                    results=self.get_page_results(results)
+                )
             else:
                 processed_results = self.__query_grouper(results=results)
         else:
@@ -418,13 +884,7 @@ class GroupedOffsetPaginator(OffsetPaginator):
         return processed_results
 
 
-class SubGroupedOffsetPaginator(OffsetPaginator):
-    # Field mappers this are the fields that are m2m
-    FIELD_MAPPER = {
-        "labels__id": "label_ids",
-        "assignees__id": "assignee_ids",
-        "issue_module__module_id": "module_ids",
-    }
+class SubGroupedOffsetPaginator(WindowOffsetPaginator):
 
     def __init__(
         self,
@@ -451,109 +911,20 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
         # Set the count filter - this are extra filters that need to be passed to calculate the counts with the filters
         self.count_filter = count_filter
 
-    def get_result(self, limit=30, cursor=None):
-        # offset is page #
-        # value is page limit
-        if cursor is None:
-            cursor = Cursor(0, 0, 0)
-
-        # get the minimum value
-        limit = min(limit, self.max_limit)
-
-        # Adjust the initial offset and stop based on the cursor and limit
-        queryset = self.queryset
-
-        # the current page
-        page = cursor.offset
-
-        # the offset
-        offset = cursor.offset * cursor.value
-
-        # the stop
-        stop = offset + (cursor.value or limit) + 1
-
-        if self.max_offset is not None and offset >= self.max_offset:
-            raise BadPaginationError("Pagination offset too large")
-        if offset < 0:
-            raise BadPaginationError("Pagination offset cannot be negative")
-
-        # Compute the results
-        results = {}
-
-        # Create windows for group and sub group field name
-        queryset = queryset.annotate(
-            row_number=Window(
-                expression=RowNumber(),
-                partition_by=[
-                    F(self.group_by_field_name),
-                    F(self.sub_group_by_field_name),
-                ],
-                order_by=(
-                    (
-                        F(*self.key).desc(nulls_last=True)
-                        if self.desc
-                        else F(*self.key).asc(nulls_last=True)
-                    ),
-                    "-created_at",
-                ),
-            )
-        )
-
-        # Filter the results
-        results = queryset.filter(
-            row_number__gt=offset, row_number__lt=stop
-        ).order_by(
-            (
-                F(*self.key).desc(nulls_last=True)
-                if self.desc
-                else F(*self.key).asc(nulls_last=True)
-            ),
-            F("created_at").desc(),
-        )
-
-        # Adjust cursors based on the grouped results for pagination
-        next_cursor = Cursor(
-            limit,
-            page + 1,
-            False,
-            queryset.filter(row_number__gte=stop).exists(),
-        )
+    def get_partition_fields(self):
+        return [self.group_by_field_name, self.sub_group_by_field_name]
 
-        # Add previous cursors
-        prev_cursor = Cursor(
-            limit,
-            page - 1,
-            True,
-            page > 0,
-        )
-
-        # Count the queryset
-        count = queryset.count()
-
-        # Optionally, calculate the total count and max_hits if needed
-        # This might require adjustments based on specific use cases
-        if results:
-            max_hits = math.ceil(
-                queryset.values(self.group_by_field_name)
-                .annotate(
-                    count=Count(
-                        "id",
-                        filter=self.count_filter,
-                        distinct=True,
-                    )
-                )
-                .order_by("-count")[0]["count"]
-                / limit
-            )
-        else:
-            max_hits = 0
-        return CursorResult(
-            results=results,
-            next=next_cursor,
-            prev=prev_cursor,
-            hits=count,
-            max_hits=max_hits,
-        )
+    def get_total_partitions(self):
+        total_partitions = {
+            "sub_group_total": [
+                self.group_by_field_name,
+                self.sub_group_by_field_name,
+            ]
+        }
+        # Group totals are only exact when the sub group is not m2m
+        if self.sub_group_by_field_name not in self.FIELD_MAPPER:
+            total_partitions["group_total"] = [self.group_by_field_name]
+        return total_partitions
 
     def __get_group_total_queryset(self):
         # Get group totals
@@ -570,49 +941,32 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
             .distinct()
         )
 
-    def __get_subgroup_total_queryset(self):
-        # Get subgroup totals
-        return (
-            self.queryset.values(
-                self.group_by_field_name, self.sub_group_by_field_name
-            )
-            .annotate(
-                count=Count("id", filter=self.count_filter, distinct=True)
-            )
-            .order_by()
-            .values(
-                self.group_by_field_name, self.sub_group_by_field_name, "count"
-            )
-        )
-
     def __get_total_dict(self):
-        # Use the above to convert to dictionary of 2D objects
+        # Use the window totals to build the dictionary of 2D objects
         total_group_dict = {}
         total_sub_group_dict = {}
-        for group in self.__get_group_total_queryset():
-            total_group_dict[str(group.get(self.group_by_field_name))] = (
-                total_group_dict.get(
-                    str(group.get(self.group_by_field_name)), 0
+        if self.sub_group_by_field_name in self.FIELD_MAPPER:
+            # Issues repeat across m2m sub groups, so the distinct group
+            # totals can not be read from the window counts
+            for group in self.__get_group_total_queryset():
+                total_group_dict[str(group.get(self.group_by_field_name))] = (
+                    total_group_dict.get(
+                        str(group.get(self.group_by_field_name)), 0
+                    )
+                    + (1 if group.get("count") == 0 else group.get("count"))
                 )
-                + (1 if group.get("count") == 0 else group.get("count"))
-            )
+        else:
+            for (group,), count in self.partition_totals[
+                "group_total"
+            ].items():
+                total_group_dict[group] = count
 
         # Sub group total values
-        for item in self.__get_subgroup_total_queryset():
-            group = str(item[self.group_by_field_name])
-            subgroup = str(item[self.sub_group_by_field_name])
-            count = item["count"]
-
-            # Create a dictionary of group and sub group
-            if group not in total_sub_group_dict:
-                total_sub_group_dict[str(group)] = {}
-
-            # Create a dictionary of sub group
-            if subgroup not in total_sub_group_dict[group]:
-                total_sub_group_dict[str(group)][str(subgroup)] = {}
-
+        for (group, subgroup), count in self.partition_totals[
+            "sub_group_total"
+        ].items():
             # Create a nested dictionary of group and sub group
-            total_sub_group_dict[group][subgroup] = count
+            total_sub_group_dict.setdefault(group, {})[subgroup] = count
 
         return total_group_dict, total_sub_group_dict
 
@@ -640,22 +994,17 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
     def __query_multi_grouper(self, results):
         # Multi grouper
         processed_results = self.__get_field_dict()
-        # Preparing a dict to keep track of group IDs associated with each label ID
-        result_group_mapping = defaultdict(set)
-        result_sub_group_mapping = defaultdict(set)
-
-        # Iterate over results to fill the above dictionaries
-        if self.group_by_field_name in self.FIELD_MAPPER:
-            for result in results:
-                result_id = result["id"]
-                group_id = result[self.group_by_field_name]
-                result_group_mapping[str(result_id)].add(str(group_id))
-        # Use the same calculation for the sub group
-        if self.sub_group_by_field_name in self.FIELD_MAPPER:
-            for result in results:
-                result_id = result["id"]
-                sub_group_id = result[self.sub_group_by_field_name]
-                result_sub_group_mapping[str(result_id)].add(str(sub_group_id))
+        # Group ids associated with each issue for the m2m fields
+        result_group_mapping = (
+            issue_group_ids(issues=results, field=self.group_by_field_name)
+            if self.group_by_field_name in self.FIELD_MAPPER
+            else {}
+        )
+        result_sub_group_mapping = (
+            issue_group_ids(issues=results, field=self.sub_group_by_field_name)
+            if self.sub_group_by_field_name in self.FIELD_MAPPER
+            else {}
+        )
 
         # Iterate over results
         for result in results:
@@ -673,14 +1022,12 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
             ):
                 if self.group_by_field_name in self.FIELD_MAPPER:
                     # for multi grouper
-                    group_ids = list(result_group_mapping[str(result_id)])
+                    group_ids = result_group_mapping[str(result_id)]
                     result[self.FIELD_MAPPER.get(self.group_by_field_name)] = (
                         [] if "None" in group_ids else group_ids
                     )
                 if self.sub_group_by_field_name in self.FIELD_MAPPER:
-                    sub_group_ids = list(
-                        result_sub_group_mapping[str(result_id)]
-                    )
+                    sub_group_ids = result_sub_group_mapping[str(result_id)]
                     # for multi groups
                     result[
                         self.FIELD_MAPPER.get(self.sub_group_by_field_name)
@@ -711,7 +1058,9 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
                 or self.sub_group_by_field_name in self.FIELD_MAPPER
             ):
                 # if the grouping is done through m2m then
-                processed_results = self.__query_multi_grouper(results=results)
+                processed_results = self.__query_multi_grouper(
+                    results=self.get_page_results(results)
+                )
             else:
                 # group it directly
                 processed_results = self.__query_grouper(results=results)
@@ -749,7 +1098,7 @@ class BasePaginator:
         paginator_cls=OffsetPaginator,
         default_per_page=100,
         max_per_page=100,
-        cursor_cls=Cursor,
+        cursor_cls=None,
         extra_stats=None,
         controller=None,
         group_by_field_name=None,
@@ -762,6 +1111,10 @@ class BasePaginator:
         """Paginate the request"""
         per_page = self.get_per_page(request, default_per_page, max_per_page)
 
+        # Use the cursor class of the paginator unless one is passed
+        if cursor_cls is None:
+            cursor_cls = getattr(paginator or paginator_cls, "cursor_cls", Cursor)
+
         # Convert the cursor value to integer and float from string
         input_cursor = None
         try:
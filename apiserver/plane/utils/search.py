@@ -0,0 +1,195 @@
+# Python imports
+import re
+
+# Django imports
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramSimilarity,
+)
+from django.db.models import F, Q, Window
+from django.db.models.functions import RowNumber
+
+# Module imports
+from plane.db.models import (
+    Cycle,
+    Issue,
+    IssueView,
+    Module,
+    Page,
+    SearchDocument,
+)
+
+SEARCH_CONFIG = "simple"
+
+# Results of every entity type returned by a search
+SEARCH_RESULTS_LIMIT = 50
+
+# Characters of the content that are indexed
+SEARCH_CONTENT_LIMIT = 100000
+
+# Entity name of the indexed models, with their name and content fields
+SEARCH_ENTITIES = {
+    Issue: ("issue", "name", "description_stripped"),
+    Page: ("page", "name", "description_stripped"),
+    Cycle: ("cycle", "name", None),
+    Module: ("module", "name", None),
+    IssueView: ("issue_view", "name", None),
+}
+
+# Fields whose changes are reflected in the documents
+SEARCH_FIELDS = {
+    "name",
+    "description_html",
+    "description_stripped",
+    "project",
+    "project_id",
+    "deleted_at",
+}
+
+SEARCH_VECTOR = SearchVector(
+    "name", weight="A", config=SEARCH_CONFIG
+) + SearchVector("content", weight="B", config=SEARCH_CONFIG)
+
+
+def get_search_document(instance):
+    entity_name, name_field, content_field = SEARCH_ENTITIES[type(instance)]
+    content = getattr(instance, content_field) if content_field else ""
+    return SearchDocument(
+        workspace_id=instance.workspace_id,
+        # Pages belong to the projects they are linked to
+        project_id=getattr(instance, "project_id", None),
+        entity_name=entity_name,
+        entity_identifier=instance.id,
+        name=getattr(instance, name_field) or "",
+        content=(content or "")[:SEARCH_CONTENT_LIMIT],
+    )
+
+
+def remove_search_documents(entity_name, entity_ids):
+    SearchDocument.all_objects.filter(
+        entity_name=entity_name, entity_identifier__in=entity_ids
+    ).delete()
+
+
+def index_search_documents(instances):
+    """Create or refresh the search documents of instances of one model"""
+    instances = list(instances)
+    if not instances:
+        return
+    entity_name = SEARCH_ENTITIES[type(instances[0])][0]
+
+    remove_search_documents(
+        entity_name,
+        [instance.id for instance in instances if instance.deleted_at],
+    )
+    documents = [
+        get_search_document(instance)
+        for instance in instances
+        if not instance.deleted_at
+    ]
+    if not documents:
+        return
+
+    SearchDocument.all_objects.bulk_create(
+        documents,
+        update_conflicts=True,
+        unique_fields=["entity_name", "entity_identifier"],
+        update_fields=[
+            "workspace",
+            "project",
+            "name",
+            "content",
+            "deleted_at",
+            "updated_at",
+        ],
+        batch_size=500,
+    )
+    # The vectors are built by the database from the stored text
+    SearchDocument.all_objects.filter(
+        entity_name=entity_name,
+        entity_identifier__in=[
+            document.entity_identifier for document in documents
+        ],
+    ).update(search_vector=SEARCH_VECTOR)
+
+
+def is_search_update(update_fields):
+    """Saves restricted to fields that are not searched leave documents alone"""
+    return update_fields is None or bool(SEARCH_FIELDS & set(update_fields))
+
+
+def get_search_query(query):
+    """Prefix query matching every word of the text, for typeahead"""
+    words = re.findall(r"\w+", query)
+    if not words:
+        return None
+    return SearchQuery(
+        " & ".join(f"{word}:*" for word in words),
+        search_type="raw",
+        config=SEARCH_CONFIG,
+    )
+
+
+def get_search_rank(query):
+    """Full text rank of the document, with the similarity of its name"""
+    rank = TrigramSimilarity("name", query)
+    search_query = get_search_query(query)
+    if search_query is not None:
+        rank = rank + SearchRank(F("search_vector"), search_query)
+    return rank
+
+
+def search_documents(query, **filters):
+    """Documents matching the query, annotated with their rank"""
+    search_query = get_search_query(query)
+    matches = Q(name__icontains=query)
+    if search_query is not None:
+        matches |= Q(search_vector=search_query)
+    return SearchDocument.objects.filter(matches, **filters).annotate(
+        rank=get_search_rank(query)
+    )
+
+
+def rank_documents(documents, limit=SEARCH_RESULTS_LIMIT):
+    """Ids of the best ranked documents of every entity type, in rank order"""
+    results = {}
+    for entity_name, entity_identifier in (
+        documents.annotate(
+            position=Window(
+                RowNumber(),
+                partition_by=F("entity_name"),
+                order_by=F("rank").desc(),
+            )
+        )
+        .filter(position__lte=limit)
+        .order_by("entity_name", "position")
+        .values_list("entity_name", "entity_identifier")
+    ):
+        results.setdefault(entity_name, []).append(entity_identifier)
+    return results
+
+
+def exact_match_filter(query):
+    """
+    Issues referenced by their sequence id, with or without the project
+    identifier e.g. WEB-12 or 12
+    """
+    q = Q()
+    for identifier, sequence_id in re.findall(r"\b(\w+)-(\d+)\b", query):
+        q |= Q(project__identifier__iexact=identifier, sequence_id=sequence_id)
+    if len(query) <= 20:
+        for sequence_id in re.findall(r"(?<!-)\b\d+\b", query):
+            q |= Q(sequence_id=sequence_id)
+    return q or None
+
+
+def update_search_document(instance, update_fields=None):
+    """Keep the document of a saved instance in step with it"""
+    if is_search_update(update_fields):
+        index_search_documents([instance])
+
+
+def remove_search_document(instance):
+    remove_search_documents(SEARCH_ENTITIES[type(instance)][0], [instance.id])